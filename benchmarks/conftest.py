@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any, Callable
+
+from pytest import fixture
+from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@fixture
+def measure_allocations(benchmark: BenchmarkFixture) -> Callable[[Callable[[], Any]], None]:
+    """
+    Measure the allocations of a single call and store them in the benchmark's extra info.
+
+    The call is made outside of the timed rounds, because the tracing slows the allocations down.
+    """
+
+    def measure(function: Callable[[], Any]) -> None:
+        tracemalloc.start()
+        try:
+            result = function()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+        benchmark.extra_info["allocated_peak_bytes"] = peak
+        benchmark.extra_info["allocated_retained_bytes"] = current
+
+    return measure
@@ -0,0 +1,121 @@
+"""
+Deterministic message corpora.
+
+Each corpus is generated from a fixed seed, so that the results are comparable between the runs and versions.
+"""
+
+from __future__ import annotations
+
+from random import Random
+from string import ascii_letters, ascii_lowercase
+from typing import Callable
+
+from benchmarks.schemas import (
+    Envelope,
+    Event,
+    Failure,
+    PackedArrays,
+    Ping,
+    Status,
+    StringMaps,
+    TreeNode,
+    WideFlat,
+)
+from pure_protobuf.annotations import ZigZagInt, double, fixed32, fixed64, sfixed64, uint
+from pure_protobuf.message import BaseMessage
+
+SEED = 42
+
+
+def _text(random: Random, min_length: int, max_length: int, alphabet: str = ascii_letters) -> str:
+    return "".join(random.choices(alphabet, k=random.randint(min_length, max_length)))
+
+
+def _wide_flat(random: Random) -> WideFlat:
+    return WideFlat(
+        id=uint(random.getrandbits(40)),
+        created_at=fixed64(random.getrandbits(63)),
+        updated_at=fixed64(random.getrandbits(63)),
+        status=random.choice(list(Status)),
+        name=_text(random, 5, 30),
+        email=f"{_text(random, 5, 15, ascii_lowercase)}@example.com",
+        country=_text(random, 2, 2),
+        avatar=random.randbytes(random.randint(0, 64)),
+        age=random.randint(0, 100),
+        balance=sfixed64(random.randint(-(2**40), 2**40)),
+        delta=ZigZagInt(random.randint(-1000, 1000)),
+        score=double(random.uniform(-1e6, 1e6)),
+        # Exactly representable as a 32-bit float.
+        ratio=random.randint(0, 1024) / 1024,
+        flags=fixed32(random.getrandbits(32)),
+        is_admin=random.random() < 0.1,
+        is_verified=random.random() < 0.9,
+        login_count=random.randint(0, 10_000),
+        referrer_id=uint(random.getrandbits(40)) if random.random() < 0.5 else None,
+        locale=random.choice(("en_US", "nl_NL", "ru_RU", "de_DE")),
+        timezone=random.choice(("Europe/Amsterdam", "America/New_York", "Asia/Tokyo")),
+    )
+
+
+def _tree_node(random: Random, depth: int = 6) -> TreeNode:
+    return TreeNode(
+        value=random.randint(-(2**31), 2**31),
+        label=_text(random, 0, 8),
+        children=[_tree_node(random, depth - 1) for _ in range(2)] if depth else [],
+    )
+
+
+def _packed_arrays(random: Random, length: int = 2_000) -> PackedArrays:
+    return PackedArrays(
+        timestamps=[1_700_000_000 + i * 60 for i in range(length)],
+        values=[double(random.gauss(0.0, 1.0)) for _ in range(length)],
+        deltas=[ZigZagInt(random.randint(-500, 500)) for _ in range(length)],
+        checksums=[fixed32(random.getrandbits(32)) for _ in range(length)],
+    )
+
+
+def _string_maps(random: Random) -> StringMaps:
+    return StringMaps(
+        headers={_text(random, 4, 20): _text(random, 10, 80) for _ in range(50)},
+        counters={_text(random, 4, 20): random.randint(0, 2**32) for _ in range(50)},
+        tags=[random.choice(("alpha", "beta", "gamma", "delta", "production", "staging")) for _ in range(20)],
+    )
+
+
+def _envelope(random: Random) -> Envelope:
+    request_id = uint(random.getrandbits(32))
+    kind = random.randrange(4)
+    if kind == 0:
+        return Envelope(request_id=request_id, ping=Ping(sequence=uint(random.getrandbits(16))))
+    if kind == 1:
+        return Envelope(
+            request_id=request_id,
+            event=Event(
+                kind=random.choice(("click", "view", "purchase")),
+                timestamp=fixed64(random.getrandbits(63)),
+                attributes={_text(random, 3, 10): _text(random, 3, 20) for _ in range(5)},
+            ),
+        )
+    if kind == 2:
+        return Envelope(
+            request_id=request_id,
+            failure=Failure(code=random.randint(400, 599), message=_text(random, 10, 60)),
+        )
+    return Envelope(request_id=request_id, raw=random.randbytes(random.randint(16, 256)))
+
+
+CORPORA: dict[str, tuple[type[BaseMessage], Callable[[Random], BaseMessage], int]] = {
+    "wide_flat": (WideFlat, _wide_flat, 200),
+    "tree": (TreeNode, _tree_node, 5),
+    "packed_arrays": (PackedArrays, _packed_arrays, 2),
+    "string_maps": (StringMaps, _string_maps, 10),
+    "envelope": (Envelope, _envelope, 500),
+}
+"""Corpus names, mapped to the message types, the message factories, and the corpus sizes."""
+
+
+def generate_corpus(name: str) -> tuple[type[BaseMessage], list[BaseMessage]]:
+    """Generate the named corpus from the fixed seed."""
+    message_type, factory, size = CORPORA[name]
+    random = Random(f"{SEED}:{name}")
+    return message_type, [factory(random) for _ in range(size)]
@@ -0,0 +1,103 @@
+"""Representative message schemas."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Annotated, ClassVar, Optional
+
+from pure_protobuf.annotations import Field, ZigZagInt, double, fixed32, fixed64, sfixed64, uint
+from pure_protobuf.message import BaseMessage
+from pure_protobuf.one_of import OneOf
+
+
+class Status(IntEnum):
+    UNKNOWN = 0
+    ACTIVE = 1
+    SUSPENDED = 2
+    DELETED = 3
+
+
+@dataclass
+class WideFlat(BaseMessage):
+    """Many singular scalar fields of the different types, like a denormalized database row."""
+
+    id: Annotated[uint, Field(1)] = uint(0)
+    created_at: Annotated[fixed64, Field(2)] = fixed64(0)
+    updated_at: Annotated[fixed64, Field(3)] = fixed64(0)
+    status: Annotated[Status, Field(4)] = Status.UNKNOWN
+    name: Annotated[str, Field(5)] = ""
+    email: Annotated[str, Field(6)] = ""
+    country: Annotated[str, Field(7)] = ""
+    avatar: Annotated[bytes, Field(8)] = b""
+    age: Annotated[int, Field(9)] = 0
+    balance: Annotated[sfixed64, Field(10)] = sfixed64(0)
+    delta: Annotated[ZigZagInt, Field(11)] = ZigZagInt(0)
+    score: Annotated[double, Field(12)] = double(0.0)
+    ratio: Annotated[float, Field(13)] = 0.0
+    flags: Annotated[fixed32, Field(14)] = fixed32(0)
+    is_admin: Annotated[bool, Field(15)] = False
+    is_verified: Annotated[bool, Field(16)] = False
+    login_count: Annotated[int, Field(17)] = 0
+    referrer_id: Annotated[Optional[uint], Field(18)] = None
+    locale: Annotated[str, Field(19)] = ""
+    timezone: Annotated[str, Field(20)] = ""
+
+
+@dataclass
+class TreeNode(BaseMessage):
+    """Recursive structure with the deeply nested embedded messages."""
+
+    value: Annotated[int, Field(1)] = 0
+    label: Annotated[str, Field(2)] = ""
+    children: Annotated[list[TreeNode], Field(3)] = field(default_factory=list)
+
+
+@dataclass
+class PackedArrays(BaseMessage):
+    """Large packed repeated numeric fields, like a time series."""
+
+    timestamps: Annotated[list[int], Field(1)] = field(default_factory=list)
+    values: Annotated[list[double], Field(2)] = field(default_factory=list)
+    deltas: Annotated[list[ZigZagInt], Field(3)] = field(default_factory=list)
+    checksums: Annotated[list[fixed32], Field(4)] = field(default_factory=list)
+
+
+@dataclass
+class StringMaps(BaseMessage):
+    """String-heavy maps and repeated strings, like HTTP headers or labels."""
+
+    headers: Annotated[dict[str, str], Field(1)] = field(default_factory=dict)
+    counters: Annotated[dict[str, int], Field(2)] = field(default_factory=dict)
+    tags: Annotated[list[str], Field(3)] = field(default_factory=list)
+
+
+@dataclass
+class Ping(BaseMessage):
+    sequence: Annotated[uint, Field(1)] = uint(0)
+
+
+@dataclass
+class Event(BaseMessage):
+    kind: Annotated[str, Field(1)] = ""
+    timestamp: Annotated[fixed64, Field(2)] = fixed64(0)
+    attributes: Annotated[dict[str, str], Field(3)] = field(default_factory=dict)
+
+
+@dataclass
+class Failure(BaseMessage):
+    code: Annotated[int, Field(1)] = 0
+    message: Annotated[str, Field(2)] = ""
+
+
+@dataclass
+class Envelope(BaseMessage):
+    """One-of envelope, which wraps one of the several payload messages."""
+
+    payload: ClassVar[OneOf] = OneOf()
+
+    request_id: Annotated[uint, Field(1)] = uint(0)
+    ping: Annotated[Optional[Ping], Field(2, one_of=payload)] = None
+    event: Annotated[Optional[Event], Field(3, one_of=payload)] = None
+    failure: Annotated[Optional[Failure], Field(4, one_of=payload)] = None
+    raw: Annotated[Optional[bytes], Field(5, one_of=payload)] = None
@@ -0,0 +1,86 @@
+"""
+End-to-end benchmarks of the message encoding and decoding.
+
+Each benchmark round processes the whole corpus. The extra info contains the corpus size in messages and bytes,
+and the allocations of a single round.
+
+Run them via `make benchmark`, which saves the results into `benchmark.json` (or `BENCHMARK_JSON`).
+Two saved runs may then be compared via `pytest-benchmark compare before.json after.json`.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import Any, Callable
+
+from pytest import fixture, mark
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.corpora import CORPORA, generate_corpus
+from pure_protobuf.message import BaseMessage
+
+Corpus = tuple[type[BaseMessage], list[BaseMessage], list[bytes]]
+
+
+@fixture(params=sorted(CORPORA), scope="module")
+def corpus(request: Any) -> Corpus:
+    message_type, messages = generate_corpus(request.param)
+    return message_type, messages, [bytes(message) for message in messages]
+
+
+def _record_size(benchmark: BenchmarkFixture, corpus: Corpus) -> None:
+    _, messages, encoded = corpus
+    benchmark.extra_info["messages"] = len(messages)
+    benchmark.extra_info["encoded_bytes"] = sum(map(len, encoded))
+
+
+@mark.benchmark(group="encode")
+def test_encode(
+    benchmark: BenchmarkFixture,
+    measure_allocations: Callable[[Callable[[], Any]], None],
+    corpus: Corpus,
+) -> None:
+    _, messages, encoded = corpus
+
+    def encode() -> list[bytes]:
+        return [bytes(message) for message in messages]
+
+    _record_size(benchmark, corpus)
+    measure_allocations(encode)
+    assert benchmark(encode) == encoded
+
+
+@mark.benchmark(group="encode-stream")
+def test_write_to(
+    benchmark: BenchmarkFixture,
+    measure_allocations: Callable[[Callable[[], Any]], None],
+    corpus: Corpus,
+) -> None:
+    _, messages, encoded = corpus
+
+    def write() -> bytes:
+        io = BytesIO()
+        for message in messages:
+            message.write_to(io)
+        return io.getvalue()
+
+    _record_size(benchmark, corpus)
+    measure_allocations(write)
+    assert benchmark(write) == b"".join(encoded)
+
+
+@mark.benchmark(group="decode")
+def test_decode(
+    benchmark: BenchmarkFixture,
+    measure_allocations: Callable[[Callable[[], Any]], None],
+    corpus: Corpus,
+) -> None:
+    message_type, messages, encoded = corpus
+    loads = message_type.loads
+
+    def decode() -> list[BaseMessage]:
+        return [loads(buffer) for buffer in encoded]
+
+    _record_size(benchmark, corpus)
+    measure_allocations(decode)
+    assert benchmark(decode) == messages
@@ -2,7 +2,7 @@ from collections.abc import Iterable
 from typing import Generic, Optional
 
 from pure_protobuf.interfaces._repr import ReprWithInner
-from pure_protobuf.interfaces._vars import MessageT, RecordT
+from pure_protobuf.interfaces._vars import KeyT, MessageT, RecordT, ValueT
 from pure_protobuf.interfaces.accumulate import Accumulate
 
 
@@ -35,6 +35,24 @@ class AccumulateAppend(Accumulate[list[RecordT], RecordT]):
         return accumulator
 
 
+class AccumulateMap(Accumulate[dict[KeyT, ValueT], tuple[KeyT, ValueT]]):
+    def __call__(
+        self,
+        accumulator: Optional[dict[KeyT, ValueT]],
+        other: Iterable[tuple[KeyT, ValueT]],
+    ) -> dict[KeyT, ValueT]:
+        """
+        Update the accumulator with the key-value pairs from the `other`.
+
+        See Also:
+            - https://protobuf.dev/programming-guides/encoding/#maps
+        """
+        if accumulator is None:
+            accumulator = {}
+        accumulator.update(other)
+        return accumulator
+
+
 class AccumulateMessages(Accumulate[MessageT, MessageT], ReprWithInner):
     inner: type[MessageT]
 
@@ -55,14 +73,11 @@ class AccumulateMessages(Accumulate[MessageT, MessageT], ReprWithInner):
             assert other is not None, "right-hand side items must not be `None`"
             if lhs is not None:
                 for name, descriptor in other.__PROTOBUF_FIELDS_BY_NUMBER__.values():
-                    setattr(
-                        lhs,
-                        name,
-                        descriptor.merge(getattr(lhs, name), getattr(other, name)),
-                    )
+                    value = descriptor.merge(getattr(lhs, name), getattr(other, name))
+                    setattr(lhs, name, value)
                     one_of = descriptor.one_of
-                    if one_of is not None:
-                        one_of._keep_attribute(lhs, descriptor.number)
+                    if one_of is not None and value is not None:
+                        one_of._keep_attribute(lhs, name)
             else:
                 lhs = other
 
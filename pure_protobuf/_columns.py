@@ -0,0 +1,141 @@
+"""Columnar batch encoding and decoding."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from pure_protobuf._construct import get_default
+from pure_protobuf.annotations import ZigZagInt, double, fixed32, fixed64, sfixed32, sfixed64, uint
+from pure_protobuf.exceptions import IncorrectValueError
+
+if TYPE_CHECKING:
+    from pure_protobuf.descriptors._field import _FieldDescriptor
+    from pure_protobuf.message import BaseMessage
+
+ARRAY_TYPECODES: dict[Any, str] = {
+    double: "d",
+    fixed32: "L",
+    fixed64: "Q",
+    float: "f",
+    int: "q",
+    sfixed32: "l",
+    sfixed64: "q",
+    uint: "Q",
+    ZigZagInt: "q",
+}
+"""
+[Array type codes](https://docs.python.org/3/library/array.html) of the numeric types.
+
+Booleans are deliberately absent: an array would turn them into integers.
+"""
+
+
+def decode_columns(
+    message_type: type[BaseMessage],
+    frames: Iterable[bytes],
+    *,
+    numpy: bool = False,
+) -> dict[str, Union[list[Any], array[Any]]]:
+    """Read the serialized messages into per-field columns."""
+
+    columns: dict[str, Union[list[Any], array[Any]]] = {}
+    appends = []
+    for name, descriptor in message_type.__PROTOBUF_FIELDS_BY_NUMBER__.values():
+        typecode = _array_typecode(descriptor)
+        column: Union[list[Any], array[Any]] = array(typecode) if typecode is not None else []
+        columns[name] = column
+        appends.append((name, column.append, _missing_factory(message_type, name, descriptor, typecode)))
+
+    for frame in frames:
+        values = message_type._read_values(BytesIO(frame))
+        for name, append, missing in appends:
+            append(values[name] if name in values else missing())
+
+    if numpy:
+        from numpy import frombuffer
+
+        converted: dict[str, Any] = {
+            name: frombuffer(column, dtype=column.typecode) if isinstance(column, array) else column
+            for name, column in columns.items()
+        }
+        return converted
+    return columns
+
+
+def encode_columns(
+    message_type: type[BaseMessage],
+    columns: Mapping[str, Sequence[Any]],
+) -> list[bytes]:
+    """Serialize the rows of the parallel columns."""
+
+    fields = message_type.__PROTOBUF_FIELDS_BY_NAME__
+    for name in columns:
+        if name not in fields:
+            raise IncorrectValueError(f"`{name}` is not a field of `{message_type.__name__}`")
+    if len({len(column) for column in columns.values()}) > 1:
+        raise IncorrectValueError("columns must be of the same length")
+
+    writes = []
+    ordered_columns = []
+    for name, descriptor in message_type.__PROTOBUF_FIELDS_BY_NUMBER__.values():
+        try:
+            column = columns[name]
+        except KeyError:
+            continue
+        writes.append(descriptor.write)
+        # Arrays are converted in one go, so that the items would become native Python objects.
+        ordered_columns.append(column.tolist() if hasattr(column, "tolist") else column)
+
+    rows = []
+    for row in zip(*ordered_columns):
+        io = BytesIO()
+        for write, value in zip(writes, row):
+            write(value, io)
+        rows.append(io.getvalue())
+    return rows
+
+
+def _missing_factory(
+    message_type: type[BaseMessage],
+    name: str,
+    descriptor: _FieldDescriptor[Any, Any],
+    typecode: Optional[str],
+) -> Callable[[], Any]:
+    """Get the factory of the missing field value: the declared default, or else the zero value."""
+    zero = _zero_factory(descriptor, typecode)
+
+    def missing() -> Any:
+        # Called on each missing value, since the default may come from a factory.
+        default = get_default(message_type, name)
+        return default if default is not None else zero()
+
+    return missing
+
+
+def _zero_factory(descriptor: _FieldDescriptor[Any, Any], typecode: Optional[str]) -> Callable[[], Any]:
+    """Get the factory of the zero value: that of the arrays, repeated and map fields."""
+    if typecode is not None:
+        return int
+    if descriptor.is_map:
+        return dict
+    if descriptor.is_repeated:
+        return list
+    return _none
+
+
+def _none() -> None:
+    return None
+
+
+def _array_typecode(descriptor: _FieldDescriptor[Any, Any]) -> Optional[str]:
+    """Get the array type code, if the field's values may be stored in an array."""
+    if descriptor.is_optional or descriptor.is_repeated or descriptor.is_map:
+        return None
+    try:
+        return ARRAY_TYPECODES.get(descriptor.inner_hint)
+    except TypeError:
+        # Unhashable type hint.
+        return None
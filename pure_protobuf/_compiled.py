@@ -0,0 +1,207 @@
+"""
+Runtime support of the ahead-of-time compiled codecs.
+
+See Also:
+    - `pure_protobuf.compile` for the code generator.
+"""
+
+from __future__ import annotations
+
+import sys
+from hashlib import sha256
+from importlib import import_module
+from importlib.util import resolve_name
+from struct import Struct
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional
+from warnings import warn
+from weakref import WeakSet
+
+from pure_protobuf.annotations import ZigZagInt, double, fixed32, fixed64, sfixed32, sfixed64, uint
+from pure_protobuf.descriptors.record import RecordDescriptor
+from pure_protobuf.exceptions import IncorrectWireTypeError
+from pure_protobuf.helpers.io import read_checked
+from pure_protobuf.io.bytes_ import read_bytes as read_bytes
+from pure_protobuf.io.bytes_ import read_string as read_string
+from pure_protobuf.io.bytes_ import write_bytes as write_bytes
+from pure_protobuf.io.bytes_ import write_string as write_string
+from pure_protobuf.io.varint import (
+    ReadTwosComplimentVarint,
+    ReadZigZagVarint,
+    WriteTwosComplimentVarint,
+    WriteZigZagVarint,
+)
+from pure_protobuf.io.varint import read_bool as read_bool
+from pure_protobuf.io.varint import read_unsigned_varint as read_unsigned_varint
+from pure_protobuf.io.varint import write_bool as write_bool
+from pure_protobuf.io.varint import write_unsigned_varint as write_unsigned_varint
+from pure_protobuf.io.wire_type import WireType
+
+if TYPE_CHECKING:
+    from pure_protobuf.descriptors._field import _FieldDescriptor
+    from pure_protobuf.message import BaseMessage
+    from pure_protobuf.one_of import OneOf
+
+CODECS_ATTRIBUTE = "__protobuf_codecs__"
+"""Module attribute, which names the module with the compiled codecs of the module's message classes."""
+
+_CODECS_INSTALLED: WeakSet[type[BaseMessage]] = WeakSet()
+"""Message classes with an installed compiled codec."""
+
+
+def _struct_codec(format_: str) -> tuple[Callable[[Any, IO[bytes]], None], Callable[[IO[bytes]], Any]]:
+    struct = Struct(format_)
+    pack = struct.pack
+    unpack = struct.unpack
+    size = struct.size
+
+    def write(value: Any, io: IO[bytes]) -> None:
+        io.write(pack(value))
+
+    def read(io: IO[bytes]) -> Any:
+        return unpack(read_checked(io, size))[0]
+
+    return write, read
+
+
+write_int = WriteTwosComplimentVarint()
+read_int = ReadTwosComplimentVarint()
+write_zigzag = WriteZigZagVarint()
+read_zigzag = ReadZigZagVarint()
+write_float, read_float = _struct_codec("<f")
+write_double, read_double = _struct_codec("<d")
+write_fixed32, read_fixed32 = _struct_codec("<I")
+write_sfixed32, read_sfixed32 = _struct_codec("<i")
+write_fixed64, read_fixed64 = _struct_codec("<Q")
+write_sfixed64, read_sfixed64 = _struct_codec("<q")
+
+INLINE_KINDS: dict[Any, tuple[str, WireType]] = {
+    bool: ("bool", WireType.VARINT),
+    bytes: ("bytes", WireType.LEN),
+    bytearray: ("bytes", WireType.LEN),
+    double: ("double", WireType.I64),
+    fixed32: ("fixed32", WireType.I32),
+    fixed64: ("fixed64", WireType.I64),
+    float: ("float", WireType.I32),
+    int: ("int", WireType.VARINT),
+    memoryview: ("bytes", WireType.LEN),
+    sfixed32: ("sfixed32", WireType.I32),
+    sfixed64: ("sfixed64", WireType.I64),
+    str: ("string", WireType.LEN),
+    uint: ("unsigned_varint", WireType.VARINT),
+    ZigZagInt: ("zigzag", WireType.VARINT),
+}
+"""
+Record types which get inlined into the compiled codecs, mapped to the helper name suffix and the wire type.
+
+The helpers are `write_<suffix>()` and `read_<suffix>()`, which are available in this module.
+"""
+
+
+def classify(descriptor: _FieldDescriptor[Any, Any]) -> Optional[tuple[str, WireType]]:
+    """
+    Decide whether the field gets inlined into the compiled codec.
+
+    Returns:
+        Helper name suffix and wire type of the inlined field, or `None` if the field
+        is read and written via its runtime descriptor.
+    """
+    if descriptor.is_repeated or descriptor.is_map or descriptor.is_packed or descriptor.one_of is not None:
+        return None
+    try:
+        kind = INLINE_KINDS[descriptor.inner_hint]
+    except (KeyError, TypeError):
+        return None
+    if descriptor.read is not RecordDescriptor.__PREDEFINED__[descriptor.inner_hint].read:
+        # Customized, for example, interned.
+        return None
+    return kind
+
+
+def fingerprint(fields_by_number: dict[int, tuple[str, _FieldDescriptor[Any, Any]]]) -> str:
+    """Calculate the schema fingerprint, which the compiled codec must match to be used."""
+    layout = []
+    for number, (name, descriptor) in fields_by_number.items():
+        kind = classify(descriptor)
+        layout.append((number, name, kind[0] if kind is not None else None))
+    return sha256(repr(layout).encode()).hexdigest()[:16]
+
+
+def read_field(
+    message_type: type[BaseMessage],
+    values: dict[str, Any],
+    which_one_of: dict[OneOf[Any], str],
+    encoded_tag: int,
+    io: IO[bytes],
+) -> None:
+    """Read a field, which is not inlined into the compiled codec, in the same way `BaseMessage` does."""
+    try:
+        wire_type = WireType(encoded_tag & 0b111)
+    except ValueError as e:
+        raise IncorrectWireTypeError(f"incorrect wire type {encoded_tag & 0b111}") from e
+    try:
+        name, descriptor = message_type.__PROTOBUF_FIELDS_BY_NUMBER__[encoded_tag >> 3]
+    except KeyError:
+        message_type.__PROTOBUF_SKIP__[wire_type](io)
+    else:
+        values[name] = descriptor.accumulate(values.get(name), descriptor.read(io, wire_type))
+        one_of = descriptor.one_of
+        if one_of is not None:
+            one_of._keep_values(values, which_one_of, name)
+
+
+def install(
+    message_type: type[BaseMessage],
+    fields_by_number: dict[int, tuple[str, _FieldDescriptor[Any, Any]]],
+) -> None:
+    """Install the compiled codec of the message class, if its module declares one."""
+
+    from pure_protobuf.message import BaseMessage
+
+    if (
+        message_type.write_to is not BaseMessage.write_to
+        or getattr(message_type._read_values, "__func__", None) is not BaseMessage.__dict__["_read_values"].__func__
+    ):
+        # The class customizes the serialization on its own.
+        return
+
+    module = sys.modules.get(message_type.__module__)
+    codecs_name = getattr(module, CODECS_ATTRIBUTE, None)
+    if codecs_name is None:
+        return
+    codecs_name = resolve_name(codecs_name, getattr(module, "__package__", None))
+    try:
+        codecs = import_module(codecs_name)
+    except ModuleNotFoundError as e:
+        if e.name == codecs_name:
+            # Not generated yet.
+            return
+        raise
+
+    try:
+        expected_fingerprint, compile_codec = codecs.CODECS[message_type.__qualname__]
+    except KeyError:
+        return
+    if expected_fingerprint != fingerprint(fields_by_number):
+        warn(
+            f"compiled codec of `{message_type.__qualname__}` is out of date, regenerate `{codecs.__name__}`",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return
+
+    write_to, read_values = compile_codec(message_type)
+    message_type.write_to = write_to  # type: ignore[method-assign]
+    message_type._read_values = staticmethod(read_values)  # type: ignore[method-assign, assignment]
+    _CODECS_INSTALLED.add(message_type)
+
+
+def uninstall_inherited(message_type: type[BaseMessage]) -> None:
+    """Restore the generic codec, if the class inherits a compiled one, which is not aware of its fields."""
+
+    from pure_protobuf.message import BaseMessage
+
+    if any(base in _CODECS_INSTALLED for base in message_type.__mro__[1:]):
+        if "write_to" not in message_type.__dict__:
+            message_type.write_to = BaseMessage.write_to  # type: ignore[method-assign]
+        if "_read_values" not in message_type.__dict__:
+            message_type._read_values = BaseMessage.__dict__["_read_values"]  # type: ignore[method-assign]
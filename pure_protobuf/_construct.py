@@ -0,0 +1,99 @@
+"""Trusted construction of decoded messages, bypassing `__init__()` and validation."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, fields, is_dataclass
+from typing import TYPE_CHECKING, Any, Callable
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from pure_protobuf.interfaces._vars import MessageT
+
+_InitField = tuple[str, Any, Callable[[], Any]]
+"""Attribute name, default value, and default factory."""
+
+_DATACLASS_FIELDS: WeakKeyDictionary[type, list[_InitField]] = WeakKeyDictionary()
+"""Cached dataclass fields per message class."""
+
+
+def construct_trusted(message_type: type[MessageT], values: dict[str, Any]) -> MessageT:
+    """
+    Construct the message from the already typed values.
+
+    - **pydantic** models are built via `model_construct()`, so that the validation is skipped.
+    - Dataclasses are allocated via `object.__new__()` and then their attributes are assigned directly.
+      Neither `__init__()`, nor `__post_init__()` get called.
+    - Otherwise, it falls back to the normal `__init__()`.
+    """
+    try:
+        model_construct = message_type.model_construct  # type: ignore[attr-defined]
+    except AttributeError:
+        pass
+    else:
+        message = model_construct(**values)
+        _keep_one_ofs(message, values)
+        return message
+
+    if not is_dataclass(message_type):
+        return message_type(**values)
+
+    message = object.__new__(message_type)
+    for name, default, default_factory in _dataclass_fields(message_type):
+        try:
+            value = values[name]
+        except KeyError:
+            if default is not MISSING:
+                value = default
+            elif default_factory is not MISSING:
+                value = default_factory()
+            else:
+                raise TypeError(f"{message_type.__qualname__} is missing the value of `{name}`") from None
+        object.__setattr__(message, name, value)
+    _keep_one_ofs(message, values)
+    return message
+
+
+def get_default(message_type: type[MessageT], name: str) -> Any:
+    """
+    Get the value, which the message class assigns to the missing field.
+
+    Only **pydantic** models and dataclasses declare their defaults, the other classes get `None`.
+    """
+    try:
+        model_fields = message_type.model_fields  # type: ignore[attr-defined]
+    except AttributeError:
+        pass
+    else:
+        field = model_fields[name]
+        return None if field.is_required() else field.get_default(call_default_factory=True)
+
+    if is_dataclass(message_type):
+        for name_, default, default_factory in _dataclass_fields(message_type):
+            if name_ == name:
+                if default is not MISSING:
+                    return default
+                if default_factory is not MISSING:
+                    return default_factory()
+                break
+    return None
+
+
+def _dataclass_fields(message_type: type) -> list[_InitField]:
+    try:
+        return _DATACLASS_FIELDS[message_type]
+    except KeyError:
+        init_fields = _DATACLASS_FIELDS[message_type] = [
+            (field.name, field.default, field.default_factory)  # type: ignore[misc]
+            for field in fields(message_type)
+        ]
+        return init_fields
+
+
+def _keep_one_ofs(message: MessageT, values: dict[str, Any]) -> None:
+    """Reset the other members of the one-of groups, which might have been set to their defaults."""
+    fields_by_name = message.__PROTOBUF_FIELDS_BY_NAME__
+    for name in values:
+        descriptor = fields_by_name[name]
+        one_of = descriptor.one_of
+        if one_of is not None:
+            one_of._keep_attribute(message, name)
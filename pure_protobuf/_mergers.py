@@ -2,7 +2,7 @@ from typing import Generic, Optional
 
 from pure_protobuf._accumulators import AccumulateMessages
 from pure_protobuf.interfaces._repr import ReprWithInner
-from pure_protobuf.interfaces._vars import FieldT, MessageT, RecordT
+from pure_protobuf.interfaces._vars import FieldT, KeyT, MessageT, RecordT, ValueT
 from pure_protobuf.interfaces.merge import Merge
 
 
@@ -32,6 +32,20 @@ class MergeConcatenate(Merge[list[RecordT]], Generic[RecordT]):
         return lhs
 
 
+class MergeMaps(Merge[dict[KeyT, ValueT]], Generic[KeyT, ValueT]):
+    def __call__(
+        self,
+        lhs: Optional[dict[KeyT, ValueT]],
+        rhs: Optional[dict[KeyT, ValueT]],
+    ) -> Optional[dict[KeyT, ValueT]]:
+        if lhs is None:
+            return rhs
+        if rhs is None:
+            return lhs
+        lhs.update(rhs)
+        return lhs
+
+
 class MergeMessages(Merge[MessageT], ReprWithInner):
     __slots__ = ("inner",)
 
@@ -0,0 +1,348 @@
+"""
+Parser of the `.proto` files, the proto3 subset.
+
+Supported are messages, nested messages and enums, scalar and message fields, `repeated` and `optional` labels,
+maps, one-ofs, and the `packed` field option. Imports are recorded but not followed here. Services,
+reserved ranges, and the other options are skipped.
+
+See Also:
+    - https://protobuf.dev/reference/protobuf/proto3-spec/
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+
+from pure_protobuf.exceptions import IncorrectProtoError
+from pure_protobuf.helpers._dataclasses import SLOTS
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<comment>//[^\n]*|/\*.*?\*/)
+    | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    | (?P<number>[-+]?(?:0[xX][0-9a-fA-F]+|\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)(?![\w.]))
+    | (?P<identifier>\.?[A-Za-z_][\w]*(?:\.[A-Za-z_][\w]*)*)
+    | (?P<symbol>[=;{}\[\]()<>,.:+-])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+class _Token(NamedTuple):
+    kind: str
+    value: str
+    line: int
+
+
+@dataclass(**SLOTS)
+class FieldDefinition:
+    """Message field."""
+
+    name: str
+    number: int
+    type_name: str
+    """Scalar type name or message/enum reference as written in the file."""
+
+    label: Optional[str] = None
+    """`repeated`, `optional`, or `None`."""
+
+    key_type_name: Optional[str] = None
+    """Key type name of a map field."""
+
+    one_of: Optional[str] = None
+    """Name of the enclosing one-of."""
+
+    packed: Optional[bool] = None
+    """Explicit `packed` option."""
+
+
+@dataclass(**SLOTS)
+class EnumDefinition:
+    """Enum type."""
+
+    name: str
+    values: list[tuple[str, int]] = field(default_factory=list)
+
+
+@dataclass(**SLOTS)
+class MessageDefinition:
+    """Message type."""
+
+    name: str
+    fields: list[FieldDefinition] = field(default_factory=list)
+    one_ofs: list[str] = field(default_factory=list)
+    messages: list[MessageDefinition] = field(default_factory=list)
+    enums: list[EnumDefinition] = field(default_factory=list)
+
+
+@dataclass(**SLOTS)
+class ProtoFile:
+    """Parsed `.proto` file."""
+
+    package: Optional[str] = None
+    imports: list[str] = field(default_factory=list)
+    messages: list[MessageDefinition] = field(default_factory=list)
+    enums: list[EnumDefinition] = field(default_factory=list)
+
+
+def parse(source: str, name: str = "<source>") -> ProtoFile:
+    """Parse the `.proto` file contents."""
+    return _Parser(source, name).parse_file()
+
+
+def _tokenize(source: str, name: str) -> Iterator[_Token]:
+    line = 1
+    position = 0
+    while position < len(source):
+        match = _TOKEN_RE.match(source, position)
+        if match is None:
+            raise IncorrectProtoError(f"{name}:{line}: unexpected character `{source[position]}`")
+        kind = match.lastgroup
+        assert kind is not None
+        value = match.group()
+        if kind not in ("space", "comment"):
+            yield _Token(kind, value, line)
+        line += value.count("\n")
+        position = match.end()
+
+
+class _Parser:
+    __slots__ = ("name", "tokens", "position")
+
+    def __init__(self, source: str, name: str) -> None:
+        self.name = name
+        self.tokens = list(_tokenize(source, name))
+        self.position = 0
+
+    def parse_file(self) -> ProtoFile:
+        proto_file = ProtoFile()
+        if self._peek("syntax"):
+            self._next()
+            self._expect("=")
+            syntax = self._string()
+            self._expect(";")
+        else:
+            syntax = "proto2"
+        if syntax != "proto3":
+            raise self._error(f"syntax `{syntax}` is not supported, only `proto3` is")
+
+        while self.position < len(self.tokens):
+            keyword = self._next().value
+            if keyword == ";":
+                continue
+            if keyword == "package":
+                proto_file.package = self._identifier()
+                self._expect(";")
+            elif keyword == "import":
+                if self._peek("public") or self._peek("weak"):
+                    self._next()
+                proto_file.imports.append(self._string())
+                self._expect(";")
+            elif keyword == "option":
+                self._skip_statement()
+            elif keyword == "message":
+                proto_file.messages.append(self._message())
+            elif keyword == "enum":
+                proto_file.enums.append(self._enum())
+            elif keyword == "service":
+                self._identifier()
+                self._skip_block()
+            else:
+                raise self._error(f"unexpected `{keyword}`")
+        return proto_file
+
+    def _message(self) -> MessageDefinition:
+        message = MessageDefinition(self._identifier())
+        self._expect("{")
+        while not self._peek("}"):
+            keyword = self._next().value
+            if keyword == ";":
+                continue
+            if keyword == "message":
+                message.messages.append(self._message())
+            elif keyword == "enum":
+                message.enums.append(self._enum())
+            elif keyword in ("option", "reserved"):
+                self._skip_statement()
+            elif keyword == "oneof":
+                self._one_of(message)
+            elif keyword == "map":
+                message.fields.append(self._map_field())
+            elif keyword in ("extensions", "extend", "group", "required"):
+                raise self._error(f"`{keyword}` is not supported in proto3")
+            else:
+                if keyword in ("repeated", "optional"):
+                    label: Optional[str] = keyword
+                    type_name = self._identifier()
+                else:
+                    label = None
+                    type_name = self._check_identifier(keyword)
+                message.fields.append(self._field(type_name, label))
+        self._expect("}")
+        return message
+
+    def _one_of(self, message: MessageDefinition) -> None:
+        name = self._identifier()
+        message.one_ofs.append(name)
+        self._expect("{")
+        while not self._peek("}"):
+            keyword = self._next().value
+            if keyword == ";":
+                continue
+            if keyword == "option":
+                self._skip_statement()
+            else:
+                field_ = self._field(self._check_identifier(keyword), None)
+                field_.one_of = name
+                message.fields.append(field_)
+        self._expect("}")
+
+    def _map_field(self) -> FieldDefinition:
+        self._expect("<")
+        key_type_name = self._identifier()
+        self._expect(",")
+        value_type_name = self._identifier()
+        self._expect(">")
+        field_ = self._field(value_type_name, None)
+        field_.key_type_name = key_type_name
+        return field_
+
+    def _field(self, type_name: str, label: Optional[str]) -> FieldDefinition:
+        name = self._identifier()
+        self._expect("=")
+        field_ = FieldDefinition(name=name, number=self._integer(), type_name=type_name, label=label)
+        if self._peek("["):
+            for option_name, value in self._field_options():
+                if option_name == "packed":
+                    if value not in ("true", "false"):
+                        raise self._error(f"incorrect `packed` value `{value}`")
+                    field_.packed = value == "true"
+        self._expect(";")
+        return field_
+
+    def _field_options(self) -> Iterator[tuple[str, str]]:
+        self._expect("[")
+        while True:
+            option_name = self._option_name()
+            self._expect("=")
+            yield option_name, self._constant()
+            if self._peek("]"):
+                break
+            self._expect(",")
+        self._expect("]")
+
+    def _enum(self) -> EnumDefinition:
+        enum = EnumDefinition(self._identifier())
+        self._expect("{")
+        while not self._peek("}"):
+            keyword = self._next().value
+            if keyword == ";":
+                continue
+            if keyword in ("option", "reserved"):
+                self._skip_statement()
+                continue
+            name = self._check_identifier(keyword)
+            self._expect("=")
+            enum.values.append((name, self._integer()))
+            if self._peek("["):
+                for _ in self._field_options():
+                    pass
+            self._expect(";")
+        self._expect("}")
+        if not enum.values or enum.values[0][1] != 0:
+            raise self._error(f"the first value of enum `{enum.name}` must be zero")
+        return enum
+
+    def _option_name(self) -> str:
+        if self._peek("("):
+            self._next()
+            name = f"({self._identifier()})"
+            self._expect(")")
+        else:
+            name = self._identifier()
+        while self.tokens[self.position].kind == "identifier" and self.tokens[self.position].value.startswith("."):
+            name += self._next().value
+        return name
+
+    def _constant(self) -> str:
+        token = self._next()
+        if token.kind == "symbol" and token.value == "{":
+            self.position -= 1
+            self._skip_block()
+            return "{...}"
+        if token.kind == "symbol" and token.value in "+-":
+            return token.value + self._next().value
+        if token.kind == "symbol":
+            raise self._error(f"unexpected `{token.value}`")
+        return token.value
+
+    def _skip_statement(self) -> None:
+        while not self._peek(";"):
+            if self._peek("{"):
+                self._skip_block()
+            else:
+                self._next()
+        self._next()
+
+    def _skip_block(self) -> None:
+        self._expect("{")
+        depth = 1
+        while depth:
+            value = self._next().value
+            if value == "{":
+                depth += 1
+            elif value == "}":
+                depth -= 1
+
+    def _identifier(self) -> str:
+        return self._check_identifier(self._next().value)
+
+    def _check_identifier(self, value: str) -> str:
+        token = self.tokens[self.position - 1]
+        if token.kind != "identifier":
+            raise self._error(f"expected an identifier, got `{value}`")
+        return value
+
+    def _integer(self) -> int:
+        token = self._next()
+        try:
+            return int(token.value, 0)
+        except ValueError:
+            # Octal literals are written with a bare leading zero.
+            try:
+                return int(token.value, 8)
+            except ValueError:
+                raise self._error(f"expected an integer, got `{token.value}`") from None
+
+    def _string(self) -> str:
+        token = self._next()
+        if token.kind != "string":
+            raise self._error(f"expected a string, got `{token.value}`")
+        return token.value[1:-1]
+
+    def _expect(self, value: str) -> None:
+        token = self._next()
+        if token.value != value:
+            raise self._error(f"expected `{value}`, got `{token.value}`")
+
+    def _peek(self, value: str) -> bool:
+        return self.position < len(self.tokens) and self.tokens[self.position].value == value
+
+    def _next(self) -> _Token:
+        try:
+            token = self.tokens[self.position]
+        except IndexError:
+            raise self._error("unexpected end of file") from None
+        self.position += 1
+        return token
+
+    def _error(self, message: str) -> IncorrectProtoError:
+        try:
+            line = self.tokens[min(self.position, len(self.tokens)) - 1].line
+        except IndexError:
+            line = 1
+        return IncorrectProtoError(f"{self.name}:{line}: {message}")
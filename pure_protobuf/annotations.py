@@ -38,6 +38,23 @@ class Field:
     one_of: Optional[OneOf] = None
     """Specifies a one-of group for this field."""
 
+    intern: bool = False
+    """
+    Specifies whether the decoded strings should be interned, so that the repeated values share the same object.
+
+    This reduces the memory footprint of the decoded messages with many repeated string values,
+    and also saves on decoding the recently seen values again. Each field keeps its own bounded cache
+    of the recently seen values, the strings are not passed to `sys.intern()`.
+    """
+
+    open_enum: bool = False
+    """
+    Specifies whether unknown values of an enum field should be read as plain `int`s instead of being rejected.
+
+    See Also:
+        - https://protobuf.dev/programming-guides/enum/#definitions
+    """
+
     @classmethod
     def _from_annotated_args(cls, *args: Any) -> Optional[Field]:
         """Extract itself from the `Annotated[_, *args]` type hint, if present."""
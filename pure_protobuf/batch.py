@@ -0,0 +1,147 @@
+"""
+Size-bounded batching of the messages into frames.
+
+A frame is a concatenation of the length-delimited messages: each message is prefixed with its size as a varint,
+the same way as in the repeated embedded message fields.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from io import BytesIO
+from types import TracebackType
+from typing import Callable, Optional
+
+from typing_extensions import Self
+
+from pure_protobuf.exceptions import IncorrectValueError, MessageTooLargeError
+from pure_protobuf.interfaces._vars import MessageT
+from pure_protobuf.io.bytes_ import read_bytes
+from pure_protobuf.io.varint import get_unsigned_varint_size, write_unsigned_varint
+from pure_protobuf.message import BaseMessage
+
+
+class BatchWriter:
+    """
+    Packs the messages into the frames, which never exceed the byte budget.
+
+    Each message is measured with `byte_size()`, and then serialized exactly once, directly into the frame buffer.
+    Once the next message does not fit, the frame is flushed, and the message starts the next one.
+
+    The writer is not thread-safe.
+    """
+
+    __slots__ = ("max_bytes", "flush_callback", "on_oversized", "_buffer", "_count")
+
+    def __init__(
+        self,
+        max_bytes: int,
+        flush_callback: Callable[[bytes], None],
+        *,
+        on_oversized: Optional[Callable[[BaseMessage, int], None]] = None,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            max_bytes: maximum frame size in bytes
+            flush_callback: called with each complete frame
+            on_oversized: called with a message and its delimited size, when the message alone does not fit
+                into a frame. By default, `MessageTooLargeError` is raised instead.
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"the frame size must be positive, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self.flush_callback = flush_callback
+        self.on_oversized = on_oversized
+        self._buffer = BytesIO()
+        self._count = 0
+
+    @property
+    def size(self) -> int:
+        """Size of the pending frame in bytes."""
+        return self._buffer.tell()
+
+    @property
+    def count(self) -> int:
+        """Number of the messages in the pending frame."""
+        return self._count
+
+    def write(self, message: BaseMessage) -> None:
+        """
+        Append the message to the pending frame, flushing the frame first if the message does not fit.
+
+        Raises:
+            MessageTooLargeError: the message alone exceeds the frame size, and `on_oversized` is not set.
+                The pending frame is left intact.
+            IncorrectValueError: the message has written a different number of bytes than `byte_size()` predicted,
+                for example, because it has been mutated in between. The pending frame is left intact.
+
+        Notes:
+            - If the message fails to serialize, its partially written bytes are discarded,
+              and the pending frame is left intact.
+        """
+        message_size = message.byte_size()
+        delimited_size = get_unsigned_varint_size(message_size) + message_size
+        if delimited_size > self.max_bytes:
+            if self.on_oversized is None:
+                raise MessageTooLargeError(
+                    f"message of {delimited_size} bytes exceeds the frame size of {self.max_bytes} bytes",
+                )
+            self.on_oversized(message, delimited_size)
+            return
+        buffer = self._buffer
+        if buffer.tell() + delimited_size > self.max_bytes:
+            self.flush()
+        position = buffer.tell()
+        try:
+            write_unsigned_varint(message_size, buffer)
+            message.write_to(buffer)
+        except BaseException:
+            self._truncate(position)
+            raise
+        # The size prefix must match, otherwise the frame gets corrupted.
+        written_size = buffer.tell() - position
+        if written_size != delimited_size:
+            self._truncate(position)
+            raise IncorrectValueError(
+                f"message has written {written_size} bytes, but {delimited_size} bytes were predicted",
+            )
+        self._count += 1
+
+    def flush(self) -> None:
+        """
+        Emit the pending frame, if it is not empty.
+
+        If `flush_callback` raises, the frame is kept pending, so that the flush may be retried.
+        """
+        if not self._count:
+            return
+        self.flush_callback(self._buffer.getvalue())
+        self._truncate(0)
+        self._count = 0
+
+    def _truncate(self, position: int) -> None:
+        """Discard the buffered bytes starting from the position."""
+        self._buffer.seek(position)
+        self._buffer.truncate()
+
+    def __enter__(self) -> Self:  # noqa: D105
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Flush the pending frame, unless an exception occurred."""
+        if exc_type is None:
+            self.flush()
+
+
+def read_frame(message_type: type[MessageT], frame: bytes) -> Iterator[MessageT]:
+    """Read the messages from the frame emitted by `BatchWriter`."""
+    io = BytesIO(frame)
+    while io.tell() < len(frame):
+        yield message_type.loads(read_bytes(io))
@@ -0,0 +1,163 @@
+"""
+Ahead-of-time generation of the specialized message codecs.
+
+Usage:
+
+    python -m pure_protobuf.compile mypkg.messages -o mypkg/_codecs.py
+
+The generated module contains `write_to()` and `_read_values()` replacements for each message class
+defined in the source module. Singular fields of the scalar types get inlined, and the other fields
+are still read and written via their runtime descriptors.
+
+To use the codecs, the source module should point to the generated one via the `__protobuf_codecs__`
+attribute, for example: `__protobuf_codecs__ = "mypkg._codecs"`, or relatively: `"._codecs"`.
+The codecs get installed on the first use of each message class, as long as its schema did not change
+since the generation. Otherwise, the class falls back to the generic codec with a `RuntimeWarning`.
+"""
+
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser
+from collections.abc import Iterator, Sequence
+from importlib import import_module
+from pathlib import Path
+from typing import Optional
+from warnings import catch_warnings, simplefilter
+
+from pure_protobuf._compiled import classify, fingerprint
+from pure_protobuf.io.tag import Tag
+from pure_protobuf.io.wrappers import to_bytes
+from pure_protobuf.message import BaseMessage
+
+
+def generate(module_name: str) -> str:
+    """Generate the source code of the codecs module for the message classes of the specified module."""
+
+    module = import_module(module_name)
+    message_types = list(
+        dict.fromkeys(
+            value
+            for value in vars(module).values()
+            if isinstance(value, type)
+            and issubclass(value, BaseMessage)
+            and value is not BaseMessage
+            and value.__module__ == module.__name__
+        ),
+    )
+
+    lines = [
+        '"""',
+        f"Specialized codecs of `{module_name}`.",
+        "",
+        f"Generated by `python -m pure_protobuf.compile {module_name}`, do not edit.",
+        '"""',
+        "",
+    ]
+    helpers = {"read_field", "read_unsigned_varint"}
+    codecs = []
+    with catch_warnings():
+        # The schemas being compiled may be different from the previously generated codecs.
+        simplefilter("ignore", RuntimeWarning)
+        for message_type in message_types:
+            function_name = f"_compile_{message_type.__qualname__.replace('.', '_')}"
+            lines.extend(("", ""))
+            lines.extend(_generate_codec(message_type, function_name))
+            for descriptor in message_type.__PROTOBUF_FIELDS_BY_NAME__.values():
+                kind = classify(descriptor)
+                if kind is not None:
+                    helpers.update((f"read_{kind[0]}", f"write_{kind[0]}"))
+            codecs.append(
+                f'    "{message_type.__qualname__}": '
+                f'("{fingerprint(message_type.__PROTOBUF_FIELDS_BY_NUMBER__)}", {function_name}),',
+            )
+
+    lines[6:6] = [
+        "from pure_protobuf._compiled import (",
+        *(f"    {helper}," for helper in sorted(helpers)),
+        ")",
+    ]
+    lines.extend(("", "", "CODECS = {", *codecs, "}", ""))
+    return "\n".join(lines)
+
+
+def _generate_codec(message_type: type[BaseMessage], function_name: str) -> Iterator[str]:
+    fields = message_type.__PROTOBUF_FIELDS_BY_NUMBER__
+    inlined = {number: classify(descriptor) for number, (_, descriptor) in fields.items()}
+
+    yield f"def {function_name}(message_type):"
+    if None in inlined.values():
+        yield "    fields = message_type.__PROTOBUF_FIELDS_BY_NUMBER__"
+    for number, kind in inlined.items():
+        if kind is None:
+            yield f"    write_{number} = fields[{number}][1].write"
+    if None in inlined.values():
+        yield ""
+
+    yield "    def write_to(message, io):"
+    yield "        write = io.write"
+    for number, (name, _) in fields.items():
+        kind = inlined[number]
+        if kind is None:
+            yield f"        write_{number}(message.{name}, io)"
+        else:
+            suffix, wire_type = kind
+            tag = to_bytes(Tag.write_to, Tag(field_number=number, wire_type=wire_type))
+            yield f"        value = message.{name}"
+            yield "        if value is not None:"
+            yield f"            write({_bytes_literal(tag)})"
+            yield f"            write_{suffix}(value, io)"
+    if not fields:
+        yield "        pass"
+
+    yield ""
+    yield "    def read_values(io):"
+    yield "        values = {}"
+    yield "        which_one_of = {}"
+    yield "        while True:"
+    yield "            try:"
+    yield "                tag = read_unsigned_varint(io)"
+    yield "            except EOFError:"
+    yield "                return values"
+    keyword = "if"
+    for number, (name, _) in fields.items():
+        kind = inlined[number]
+        if kind is not None:
+            suffix, wire_type = kind
+            yield f"            {keyword} tag == {Tag(field_number=number, wire_type=wire_type).encode()}:"
+            yield f'                values["{name}"] = read_{suffix}(io)'
+            keyword = "elif"
+    if keyword == "if":
+        yield "            read_field(message_type, values, which_one_of, tag, io)"
+    else:
+        yield "            else:"
+        yield "                read_field(message_type, values, which_one_of, tag, io)"
+
+    yield ""
+    yield "    return write_to, read_values"
+
+
+def _bytes_literal(value: bytes) -> str:
+    return 'b"' + "".join(f"\\x{byte:02x}" for byte in value) + '"'
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """Run the command-line interface."""
+
+    parser = ArgumentParser(
+        prog="python -m pure_protobuf.compile",
+        description="Generate specialized codecs of the message classes.",
+    )
+    parser.add_argument("module", help="module with the message classes, for example: mypkg.messages")
+    parser.add_argument("-o", "--output", type=Path, help="output file, standard output by default")
+    parsed_args = parser.parse_args(args)
+
+    source = generate(parsed_args.module)
+    if parsed_args.output is not None:
+        parsed_args.output.write_text(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
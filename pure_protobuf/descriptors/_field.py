@@ -1,25 +1,45 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Annotated, Any, Generic, Optional, cast
+from datetime import datetime, timedelta
+from enum import IntEnum
+from functools import partial
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Generic, Optional, cast
+from urllib.parse import ParseResult, urlparse
 
+from typing_extensions import Self
 from typing_extensions import get_args as get_type_args
 from typing_extensions import get_origin as get_type_origin
 
-from pure_protobuf._accumulators import AccumulateAppend
-from pure_protobuf._mergers import MergeConcatenate
-from pure_protobuf.annotations import Field
+from pure_protobuf._accumulators import AccumulateAppend, AccumulateMap
+from pure_protobuf._mergers import MergeConcatenate, MergeMaps
+from pure_protobuf.annotations import (
+    Field,
+    ZigZagInt,
+    double,
+    fixed32,
+    fixed64,
+    sfixed32,
+    sfixed64,
+    uint,
+)
 from pure_protobuf.descriptors.record import RecordDescriptor
+from pure_protobuf.exceptions import IncorrectAnnotationError, UnsupportedAnnotationError
 from pure_protobuf.helpers._dataclasses import KW_ONLY, SLOTS
-from pure_protobuf.helpers._typing import extract_optional, extract_repeated
+from pure_protobuf.helpers._typing import extract_mapping, extract_optional, extract_repeated
+from pure_protobuf.helpers.datetime import EPOCH
 from pure_protobuf.interfaces._vars import FieldT, RecordT
 from pure_protobuf.interfaces.accumulate import Accumulate
 from pure_protobuf.interfaces.merge import Merge
-from pure_protobuf.interfaces.read import ReadTyped
+from pure_protobuf.interfaces.read import Read, ReadTyped
 from pure_protobuf.interfaces.write import Write
+from pure_protobuf.io.map_ import ReadMapEntry, WriteMap, WriteMapEntry
 from pure_protobuf.io.tag import Tag
 from pure_protobuf.io.wire_type import WireType
 from pure_protobuf.io.wrappers import (
+    ReadLengthDelimited,
+    ReadStrictlyTyped,
     WriteLengthDelimited,
     WriteOptional,
     WriteRepeated,
@@ -60,6 +80,25 @@ class _FieldDescriptor(Generic[FieldT, RecordT]):
     accumulate: Accumulate[FieldT, RecordT]
     merge: Merge[FieldT]
 
+    inner_hint: Any
+    """
+    Type hint of a single record, for example, `int` for `Annotated[Optional[list[int]], Field(1)]`.
+
+    For map fields, it is the `tuple` of the key and value hints.
+    """
+
+    is_optional: bool
+    """Whether the attribute is annotated as `Optional`."""
+
+    is_repeated: bool
+    """Whether the field is repeated."""
+
+    is_map: bool
+    """Whether the field is a map."""
+
+    is_packed: bool
+    """Whether the field is written packed."""
+
     @classmethod
     def from_attribute(
         cls,
@@ -85,19 +124,25 @@ class _FieldDescriptor(Generic[FieldT, RecordT]):
             return None
 
         # Extract the flags from the hint.
-        inner_hint, _ = extract_optional(inner_hint)
+        inner_hint, is_optional = extract_optional(inner_hint)
+        mapping_hints = extract_mapping(inner_hint)
+        if mapping_hints is not None:
+            return cls._from_mapping_hints(message_type, field, is_optional, *mapping_hints)
         inner_hint, is_repeated = extract_repeated(inner_hint)
 
         inner: RecordDescriptor[RecordT] = RecordDescriptor._from_inner_type_hint(
             message_type,
             inner_hint,
+            open_enum=field.open_enum,
+            intern=field.intern,
         )
         write = cast(Write[FieldT], inner.write)
         accumulate = cast(Accumulate[FieldT, RecordT], inner.accumulate)
         merge = cast(Merge[FieldT], inner.merge)
 
         # Abandon hope all ye who enter here.
-        if field._packed_or(is_repeated and inner.wire_type.is_primitive_numeric):
+        is_packed = field._packed_or(is_repeated and inner.wire_type.is_primitive_numeric)
+        if is_packed:
             # Repeated fields of primitive numeric types are packed by default per the specification.
             if is_repeated:
                 # Repeated packed field are untagged internally.
@@ -130,4 +175,145 @@ class _FieldDescriptor(Generic[FieldT, RecordT]):
             read=inner.read,
             accumulate=accumulate,
             merge=merge,
+            inner_hint=inner_hint,
+            is_optional=is_optional,
+            is_repeated=is_repeated,
+            is_map=False,
+            is_packed=is_packed,
+        )
+
+    @classmethod
+    def _from_mapping_hints(
+        cls,
+        message_type: type[BaseMessage],
+        field: Field,
+        is_optional: bool,
+        key_hint: Any,
+        value_hint: Any,
+    ) -> _FieldDescriptor[Any, Any]:
+        """
+        Construct a map field descriptor.
+
+        On the wire, a map is a repeated embedded message with the key as field 1 and the value as field 2.
+        Here, the entries get read and written directly from and into the mapping items.
+
+        See Also:
+            - https://protobuf.dev/programming-guides/proto3/#maps
+        """
+        if key_hint not in _MAP_KEY_HINTS:
+            raise UnsupportedAnnotationError(f"map key annotation `{key_hint!r}` is not supported")
+        if field.packed is True:
+            raise IncorrectAnnotationError(f"map field {field.number} cannot be packed")
+
+        if field.intern and str not in (key_hint, value_hint):
+            raise IncorrectAnnotationError(f"map field {field.number} has no strings to intern")
+
+        key = RecordDescriptor._from_inner_type_hint(
+            message_type,
+            key_hint,
+            intern=field.intern and key_hint is str,
+        )
+        value = RecordDescriptor._from_inner_type_hint(
+            message_type,
+            value_hint,
+            open_enum=field.open_enum,
+            intern=field.intern and value_hint is str,
         )
+
+        write_entry = WriteMapEntry(
+            WriteTagged(key.write, Tag(field_number=1, wire_type=key.wire_type)),
+            WriteTagged(value.write, Tag(field_number=2, wire_type=value.wire_type)),
+        )
+        write: Write[Mapping[Any, Any]] = WriteMap(
+            WriteTagged(
+                WriteLengthDelimited(write_entry),
+                Tag(field_number=field.number, wire_type=WireType.LEN),
+            ),
+        )
+        read_entry: Read[tuple[Any, Any]] = ReadMapEntry(
+            key,
+            _zero_factory(message_type, key_hint),
+            value,
+            _zero_factory(message_type, value_hint),
+            message_type,
+        )
+        return cls(
+            number=field.number,
+            one_of=field.one_of,
+            write=cast(Write[FieldT], WriteOptional(write)),
+            read=cast(ReadTyped[RecordT], ReadStrictlyTyped(ReadLengthDelimited(read_entry), WireType.LEN)),
+            accumulate=cast(Accumulate[FieldT, RecordT], AccumulateMap()),
+            merge=cast(Merge[FieldT], MergeMaps()),
+            inner_hint=tuple[key_hint, value_hint],  # type: ignore[valid-type]
+            is_optional=is_optional,
+            is_repeated=False,
+            is_map=True,
+            is_packed=False,
+        )
+
+
+_MAP_KEY_HINTS = {bool, fixed32, fixed64, int, sfixed32, sfixed64, str, uint, ZigZagInt}
+"""
+Map keys may be any integral or string type.
+
+See Also:
+    - https://protobuf.dev/programming-guides/proto3/#maps
+"""
+
+_ZERO_VALUES: dict[Any, Any] = {
+    bool: False,
+    bytes: b"",
+    bytearray: b"",
+    datetime: EPOCH,
+    double: 0.0,
+    fixed32: 0,
+    fixed64: 0,
+    float: 0.0,
+    int: 0,
+    memoryview: b"",
+    ParseResult: urlparse(""),
+    sfixed32: 0,
+    sfixed64: 0,
+    str: "",
+    timedelta: timedelta(),
+    uint: 0,
+    ZigZagInt: 0,
+}
+"""
+Default values of the primitive types.
+
+See Also:
+    - https://protobuf.dev/programming-guides/proto3/#default
+"""
+
+
+def _zero_factory(message_type: type[BaseMessage], hint: Any) -> Callable[[], Any]:
+    """Make a factory of the value which is implied when a map entry is missing its key or value."""
+
+    from pure_protobuf.message import BaseMessage
+
+    if hint is Self:
+        hint = message_type
+    try:
+        zero = _ZERO_VALUES[hint]
+    except (KeyError, TypeError):
+        pass
+    else:
+        return partial(_identity, zero)
+    if issubclass(hint, IntEnum):
+        return partial(hint, 0)
+    if issubclass(hint, BaseMessage):
+        return partial(hint.loads, b"")
+    raise UnsupportedAnnotationError(f"type annotation `{hint!r}` is not supported")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+try:
+    from collections.abc import ByteString
+except ImportError:
+    pass
+else:
+    _ZERO_VALUES[ByteString] = b""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 from enum import IntEnum
 from types import GenericAlias
 from typing import TYPE_CHECKING, Any, ClassVar, Generic
@@ -11,7 +12,7 @@ from typing_extensions import Self
 from pure_protobuf._accumulators import AccumulateLastOneWins
 from pure_protobuf._mergers import MergeLastOneWins
 from pure_protobuf.annotations import ZigZagInt, double, fixed32, fixed64, sfixed32, sfixed64, uint
-from pure_protobuf.exceptions import UnsupportedAnnotationError
+from pure_protobuf.exceptions import IncorrectAnnotationError, UnsupportedAnnotationError
 from pure_protobuf.helpers._dataclasses import KW_ONLY, SLOTS
 from pure_protobuf.helpers.itertools import ReadCallback
 from pure_protobuf.interfaces._vars import RecordT
@@ -19,7 +20,8 @@ from pure_protobuf.interfaces.accumulate import Accumulate
 from pure_protobuf.interfaces.merge import Merge
 from pure_protobuf.interfaces.read import ReadTyped
 from pure_protobuf.interfaces.write import Write
-from pure_protobuf.io.bytes_ import read_bytes, read_string, write_bytes, write_string
+from pure_protobuf.io.bytes_ import ReadInternedString, read_bytes, read_string, write_bytes, write_string
+from pure_protobuf.io.datetime_ import ReadDuration, ReadTimestamp, WriteDuration, WriteTimestamp
 from pure_protobuf.io.struct_ import ReadStruct, WriteStruct
 from pure_protobuf.io.url import ReadUrl, WriteUrl
 from pure_protobuf.io.varint import (
@@ -35,7 +37,7 @@ from pure_protobuf.io.varint import (
     write_unsigned_varint,
 )
 from pure_protobuf.io.wire_type import WireType
-from pure_protobuf.io.wrappers import ReadMaybePacked, ReadStrictlyTyped
+from pure_protobuf.io.wrappers import ReadLengthDelimited, ReadMaybePacked, ReadStrictlyTyped, WriteLengthDelimited
 
 if TYPE_CHECKING:
     from pure_protobuf.message import BaseMessage
@@ -78,6 +80,9 @@ class RecordDescriptor(Generic[RecordT]):
         cls,
         message_type: type[BaseMessage],
         inner_hint: Any,
+        *,
+        open_enum: bool = False,
+        intern: bool = False,
     ) -> RecordDescriptor[Any]:
         """
         Construct a descriptor from the inner type hint.
@@ -90,10 +95,24 @@ class RecordDescriptor(Generic[RecordT]):
         Args:
             message_type: message type which contains the attribute being described
             inner_hint: the attribute's own type hint
+            open_enum: read unknown enum values as plain `int`s
+            intern: intern the decoded strings
         """
 
         from pure_protobuf.message import BaseMessage
 
+        if open_enum and not (isinstance(inner_hint, type) and issubclass(inner_hint, IntEnum)):
+            raise IncorrectAnnotationError(f"`{inner_hint!r}` is not an enum, so it cannot be open")
+        if intern:
+            if inner_hint is not str:
+                raise IncorrectAnnotationError(f"`{inner_hint!r}` is not a string, so it cannot be interned")
+            # Each field gets its own cache.
+            return RecordDescriptor(
+                wire_type=WireType.LEN,
+                write=write_string,
+                read=ReadStrictlyTyped(ReadCallback(ReadInternedString()), WireType.LEN),
+            )
+
         try:
             singular = RecordDescriptor.__PREDEFINED__[inner_hint]
         except KeyError:
@@ -114,7 +133,7 @@ class RecordDescriptor(Generic[RecordT]):
                 return RecordDescriptor(
                     wire_type=WireType.VARINT,
                     write=WriteEnum[inner_hint](),
-                    read=ReadMaybePacked[inner_hint](ReadEnum(inner_hint), WireType.VARINT),
+                    read=ReadMaybePacked[inner_hint](ReadEnum(inner_hint, open_enum), WireType.VARINT),
                 )
             if (
                 not isinstance(inner_hint, GenericAlias)  # TODO: remove with Python 3.9 end-of-life.
@@ -157,12 +176,12 @@ UNSIGNED_INT32_DESCRIPTOR: RecordDescriptor[fixed32] = RecordDescriptor(
 )
 SIGNED_INT64_DESCRIPTOR: RecordDescriptor[sfixed64] = RecordDescriptor(
     wire_type=WireType.I64,
-    read=ReadMaybePacked(ReadStruct[sfixed64]("<i"), WireType.I64),
+    read=ReadMaybePacked(ReadStruct[sfixed64]("<q"), WireType.I64),
     write=WriteStruct[sfixed64]("<q"),
 )
 UNSIGNED_INT64_DESCRIPTOR: RecordDescriptor[fixed64] = RecordDescriptor(
     wire_type=WireType.I64,
-    read=ReadMaybePacked(ReadStruct[fixed64]("<I"), WireType.I64),
+    read=ReadMaybePacked(ReadStruct[fixed64]("<Q"), WireType.I64),
     write=WriteStruct[fixed64]("<Q"),
 )
 URL_DESCRIPTOR: RecordDescriptor[ParseResult] = RecordDescriptor(
@@ -170,11 +189,22 @@ URL_DESCRIPTOR: RecordDescriptor[ParseResult] = RecordDescriptor(
     read=ReadStrictlyTyped[ParseResult](ReadUrl(), WireType.LEN),
     write=WriteUrl(),
 )
+TIMESTAMP_DESCRIPTOR: RecordDescriptor[datetime] = RecordDescriptor(
+    wire_type=WireType.LEN,
+    read=ReadStrictlyTyped(ReadLengthDelimited(ReadTimestamp()), WireType.LEN),
+    write=WriteLengthDelimited(WriteTimestamp()),
+)
+DURATION_DESCRIPTOR: RecordDescriptor[timedelta] = RecordDescriptor(
+    wire_type=WireType.LEN,
+    read=ReadStrictlyTyped(ReadLengthDelimited(ReadDuration()), WireType.LEN),
+    write=WriteLengthDelimited(WriteDuration()),
+)
 
 RecordDescriptor.__PREDEFINED__ = {
     bool: BOOL_DESCRIPTOR,
     bytes: BYTES_DESCRIPTOR,
     bytearray: BYTES_DESCRIPTOR,
+    datetime: TIMESTAMP_DESCRIPTOR,
     fixed32: UNSIGNED_INT32_DESCRIPTOR,
     fixed64: UNSIGNED_INT64_DESCRIPTOR,
     float: FLOAT_DESCRIPTOR,
@@ -186,8 +216,9 @@ RecordDescriptor.__PREDEFINED__ = {
     ),
     memoryview: BYTES_DESCRIPTOR,
     ParseResult: URL_DESCRIPTOR,
+    timedelta: DURATION_DESCRIPTOR,
     sfixed32: SIGNED_INT32_DESCRIPTOR,
-    sfixed64: UNSIGNED_INT64_DESCRIPTOR,
+    sfixed64: SIGNED_INT64_DESCRIPTOR,
     str: RecordDescriptor(
         wire_type=WireType.LEN,
         write=write_string,
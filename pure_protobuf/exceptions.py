@@ -24,3 +24,11 @@ class UnsupportedAnnotationError(ProtobufTypeError):
 
 class IncorrectValueError(ProtobufValueError):
     """Something's wrong with the field value."""
+
+
+class IncorrectProtoError(ProtobufValueError):
+    """Something's wrong with the `.proto` file, or it uses an unsupported feature."""
+
+
+class MessageTooLargeError(ProtobufValueError):
+    """The serialized message exceeds the size limit."""
@@ -0,0 +1,436 @@
+"""
+Generation of the message classes from the `.proto` files, the proto3 subset.
+
+Usage:
+
+    python -m pure_protobuf.generate protos/mypkg/messages.proto -I protos -o mypkg/messages.py
+
+The generated module contains a `BaseMessage` dataclass for each message, and an `IntEnum` for each enum.
+Nested types become nested classes. The field annotations follow the scalar types of the `.proto` file,
+so that, for example, `sint64` becomes `ZigZagInt` and `fixed64` becomes `fixed64`.
+
+Imported `.proto` files are looked up in the include paths, and their types are referred to via
+the Python modules of the same path: `import "mypkg/common.proto"` becomes `import mypkg.common`.
+`google.protobuf.Timestamp`, `google.protobuf.Duration`, and `google.protobuf.Any` map onto
+`datetime`, `timedelta`, and `pure_protobuf.well_known.Any_` respectively.
+
+No `protoc` is needed.
+"""
+
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser
+from collections import defaultdict
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from keyword import iskeyword
+from pathlib import Path
+from typing import Optional
+
+from pure_protobuf._proto import EnumDefinition, FieldDefinition, MessageDefinition, ProtoFile, parse
+from pure_protobuf.exceptions import IncorrectProtoError
+from pure_protobuf.helpers._dataclasses import SLOTS
+
+_SCALARS: dict[str, tuple[str, str]] = {
+    "bool": ("bool", "False"),
+    "bytes": ("bytes", 'b""'),
+    "double": ("double", "0.0"),
+    "fixed32": ("fixed32", "0"),
+    "fixed64": ("fixed64", "0"),
+    "float": ("float", "0.0"),
+    "int32": ("int", "0"),
+    "int64": ("int", "0"),
+    "sfixed32": ("sfixed32", "0"),
+    "sfixed64": ("sfixed64", "0"),
+    "sint32": ("ZigZagInt", "0"),
+    "sint64": ("ZigZagInt", "0"),
+    "string": ("str", '""'),
+    "uint32": ("uint", "0"),
+    "uint64": ("uint", "0"),
+}
+"""Scalar `.proto` types, mapped to their annotations and zero values."""
+
+_ANNOTATIONS = frozenset(("double", "fixed32", "fixed64", "sfixed32", "sfixed64", "uint", "ZigZagInt"))
+"""Annotations, which are imported from `pure_protobuf.annotations`."""
+
+_WELL_KNOWN: dict[str, tuple[str, str]] = {
+    ".google.protobuf.Any": ("pure_protobuf.well_known", "Any_"),
+    ".google.protobuf.Duration": ("datetime", "timedelta"),
+    ".google.protobuf.Timestamp": ("datetime", "datetime"),
+}
+"""Well-known types, which are natively supported, mapped to their modules and annotations."""
+
+_STANDARD_MODULES = frozenset(("dataclasses", "datetime", "enum", "typing"))
+"""Standard library modules, which the generated module may import."""
+
+_RESERVED = frozenset(
+    (
+        "Annotated",
+        "Any_",
+        "BaseMessage",
+        "ClassVar",
+        "Field",
+        "IntEnum",
+        "OneOf",
+        "Optional",
+        "dataclass",
+        "datetime",
+        "field",
+        "timedelta",
+        *_ANNOTATIONS,
+    ),
+)
+"""Names, which are imported into the generated module, and so must not be shadowed."""
+
+_BUILTINS = frozenset(("bool", "bytes", "dict", "float", "int", "list", "str"))
+"""Built-in names, which the generated annotations refer to."""
+
+
+@dataclass(**SLOTS)
+class _Symbol:
+    path: str
+    """Python expression, which refers to the type in the generated module."""
+
+    module: Optional[str] = None
+    """Module to import, if the type is defined in another file."""
+
+    enum_zero: Optional[str] = None
+    """Name of the zero member, if the type is an enum."""
+
+
+def generate(
+    path: Path,
+    include_paths: Sequence[Path] = (),
+    codecs: Optional[str] = None,
+) -> str:
+    """
+    Generate the source code of the module with the message classes of the `.proto` file.
+
+    Args:
+        path: `.proto` file path
+        include_paths: directories, where the imported `.proto` files are looked up,
+            the directory of the file itself by default
+        codecs: value of `__protobuf_codecs__` of the generated module, if the specialized codecs are going
+            to be generated by `pure_protobuf.compile`
+    """
+    include_paths = list(include_paths) or [path.parent]
+    proto_file = parse(path.read_text(), str(path))
+    return _Generator(proto_file, path, include_paths, codecs).generate()
+
+
+class _Generator:
+    __slots__ = ("proto_file", "source_name", "include_paths", "codecs", "symbols", "imports", "defined")
+
+    def __init__(self, proto_file: ProtoFile, path: Path, include_paths: list[Path], codecs: Optional[str]) -> None:
+        self.proto_file = proto_file
+        self.source_name = path.name
+        for include_path in include_paths:
+            try:
+                self.source_name = path.resolve().relative_to(include_path.resolve()).as_posix()
+            except ValueError:
+                continue
+            break
+        self.include_paths = include_paths
+        self.codecs = codecs
+
+        self.symbols: dict[str, _Symbol] = {}
+        """Types, available to the file, by their fully qualified names."""
+
+        self.imports: dict[str, set[str]] = defaultdict(set)
+        """Names, which the generated module needs to import, by module. Empty set means `import <module>`."""
+
+        self.defined: set[str] = set()
+        """Top-level classes, which have been completely defined in the generated module so far."""
+
+        package = _qualify(proto_file.package)
+        self._add_symbols(package, "", proto_file.messages, proto_file.enums, None)
+        for import_path in proto_file.imports:
+            self._add_imported_symbols(import_path)
+
+    def generate(self) -> str:
+        body: list[str] = []
+        for enum in self.proto_file.enums:
+            body.extend(("", ""))
+            body.extend(self._enum(enum, ""))
+            self.defined.add(_name(enum.name))
+        for message in self.proto_file.messages:
+            body.extend(("", ""))
+            body.extend(self._message(message, _qualify(self.proto_file.package), "", ""))
+            self.defined.add(_name(message.name))
+
+        lines = [
+            '"""',
+            f"Message classes of `{self.source_name}`.",
+            "",
+            f"Generated by `python -m pure_protobuf.generate {self.source_name}`, do not edit.",
+            '"""',
+            "",
+            "from __future__ import annotations",
+        ]
+        standard = {module: names for module, names in self.imports.items() if module in _STANDARD_MODULES}
+        other = {module: names for module, names in self.imports.items() if module not in _STANDARD_MODULES}
+        for section in (standard, other):
+            if section:
+                lines.append("")
+                lines.extend(_import_statements(section))
+        if self.codecs is not None:
+            lines.extend(("", f'__protobuf_codecs__ = "{self.codecs}"'))
+        lines.extend(body)
+        lines.append("")
+        return "\n".join(lines)
+
+    def _add_symbols(
+        self,
+        scope: str,
+        path: str,
+        messages: list[MessageDefinition],
+        enums: list[EnumDefinition],
+        module: Optional[str],
+    ) -> None:
+        for enum in enums:
+            self.symbols[f"{scope}.{enum.name}"] = _Symbol(
+                path=f"{path}{_name(enum.name)}",
+                module=module,
+                enum_zero=_member_name(enum.values[0][0]),
+            )
+        for message in messages:
+            message_path = f"{path}{_name(message.name)}"
+            self.symbols[f"{scope}.{message.name}"] = _Symbol(path=message_path, module=module)
+            self._add_symbols(f"{scope}.{message.name}", f"{message_path}.", message.messages, message.enums, module)
+
+    def _add_imported_symbols(self, import_path: str) -> None:
+        if import_path.startswith("google/protobuf/"):
+            # Well-known types are mapped natively.
+            return
+        for include_path in self.include_paths:
+            path = include_path / import_path
+            if path.is_file():
+                break
+        else:
+            raise IncorrectProtoError(f"{self.source_name}: cannot find `{import_path}` in the include paths")
+        imported = parse(path.read_text(), import_path)
+        module_name = import_path.removesuffix(".proto").replace("/", ".")
+        self._add_symbols(
+            _qualify(imported.package),
+            f"{module_name}.",
+            imported.messages,
+            imported.enums,
+            module_name,
+        )
+
+    def _enum(self, enum: EnumDefinition, indent: str) -> Iterator[str]:
+        self.imports["enum"].add("IntEnum")
+        yield f"{indent}class {_name(enum.name)}(IntEnum):"
+        for name, value in enum.values:
+            yield f"{indent}    {_member_name(name)} = {value}"
+
+    def _message(self, message: MessageDefinition, scope: str, path: str, indent: str) -> Iterator[str]:
+        """
+        Generate the message class.
+
+        Args:
+            message: message definition
+            scope: fully qualified `.proto` name of the enclosing scope
+            path: Python path of the enclosing class with the trailing dot, or empty string
+            indent: indentation of the class statement
+        """
+        self.imports["dataclasses"].add("dataclass")
+        self.imports["pure_protobuf.message"].add("BaseMessage")
+        scope = f"{scope}.{message.name}"
+        path = f"{path}{_name(message.name)}"
+        yield f"{indent}@dataclass"
+        yield f"{indent}class {_name(message.name)}(BaseMessage):"
+
+        indent = f"{indent}    "
+        blocks: list[list[str]] = []
+        for enum in message.enums:
+            blocks.append(list(self._enum(enum, indent)))
+        for nested in message.messages:
+            blocks.append(list(self._message(nested, scope, f"{path}.", indent)))
+        shadowed = self._referenced(message, scope, path)
+        if message.one_ofs:
+            self.imports["typing"].add("ClassVar")
+            self.imports["pure_protobuf.one_of"].add("OneOf")
+            blocks.append(
+                [f"{indent}{_name(name, shadowed)}: ClassVar[OneOf] = OneOf()" for name in message.one_ofs],
+            )
+        if message.fields:
+            blocks.append([f"{indent}{self._field(field, scope, path, shadowed)}" for field in message.fields])
+
+        if not blocks:
+            yield f"{indent}pass"
+        for i, block in enumerate(blocks):
+            if i != 0:
+                yield ""
+            yield from block
+
+    def _referenced(self, message: MessageDefinition, scope: str, path: str) -> frozenset[str]:
+        """
+        Collect the names, which the class body refers to, and so its attributes must not shadow.
+
+        Under `from __future__ import annotations`, the annotations get resolved in the class namespace first,
+        thus, for example, a field `bytes bytes = 1;` would otherwise resolve its annotation to the field default.
+        """
+        names = set(_BUILTINS)
+        names.update(_name(enum.name) for enum in message.enums)
+        names.update(_name(nested.name) for nested in message.messages)
+        for field in message.fields:
+            for type_name in (field.type_name, field.key_type_name):
+                if type_name is not None:
+                    hint, _, _ = self._type(type_name, scope, path)
+                    names.add(hint.split(".")[0])
+        return frozenset(names)
+
+    def _field(self, field: FieldDefinition, scope: str, path: str, shadowed: frozenset[str]) -> str:
+        self.imports["typing"].add("Annotated")
+        self.imports["pure_protobuf.annotations"].add("Field")
+        hint, zero, is_enum = self._type(field.type_name, scope, path)
+
+        options = [str(field.number)]
+        if field.key_type_name is not None:
+            key_hint, _, _ = self._type(field.key_type_name, scope, path)
+            hint = f"dict[{key_hint}, {hint}]"
+            default = "field(default_factory=dict)"
+        elif field.label == "repeated":
+            hint = f"list[{hint}]"
+            default = "field(default_factory=list)"
+            if field.packed is False:
+                options.append("packed=False")
+        elif zero is None or field.label == "optional" or field.one_of is not None:
+            self.imports["typing"].add("Optional")
+            hint = f"Optional[{hint}]"
+            default = "None"
+        else:
+            default = zero
+        if "field(" in default:
+            self.imports["dataclasses"].add("field")
+        if field.one_of is not None:
+            options.append(f"one_of={_name(field.one_of, shadowed)}")
+        if is_enum:
+            # Proto3 enums are open.
+            options.append("open_enum=True")
+        return f"{_name(field.name, shadowed)}: Annotated[{hint}, Field({', '.join(options)})] = {default}"
+
+    def _type(self, type_name: str, scope: str, path: str) -> tuple[str, Optional[str], bool]:
+        """
+        Resolve the field type.
+
+        Returns:
+            Annotation, zero value expression (`None` for the message types), and whether it is an enum.
+        """
+        try:
+            hint, zero = _SCALARS[type_name]
+        except KeyError:
+            pass
+        else:
+            if hint in _ANNOTATIONS:
+                self.imports["pure_protobuf.annotations"].add(hint)
+            return hint, zero, False
+
+        qualified_name, symbol = self._resolve(type_name, scope)
+        if symbol is None:
+            module, hint = _WELL_KNOWN[qualified_name]
+            self.imports[module].add(hint)
+            return hint, None, False
+        if symbol.module is not None:
+            # Referred to by the module name, which is imported as a whole.
+            self.imports.setdefault(symbol.module, set())
+        if symbol.enum_zero is None:
+            return symbol.path, None, False
+
+        member = f"{symbol.path}.{symbol.enum_zero}"
+        enum_parent, _, enum_name = symbol.path.rpartition(".")
+        if symbol.module is not None or symbol.path.split(".")[0] in self.defined:
+            zero = member
+        elif enum_parent == path:
+            # Nested enum of the class being defined is available by its own name.
+            zero = f"{enum_name}.{symbol.enum_zero}"
+        else:
+            # The enclosing class is not yet defined.
+            zero = f"field(default_factory=lambda: {member})"
+        return symbol.path, zero, True
+
+    def _resolve(self, type_name: str, scope: str) -> tuple[str, Optional[_Symbol]]:
+        """
+        Resolve the type reference in the C++-like manner, starting from the innermost scope.
+
+        See Also:
+            - https://protobuf.dev/programming-guides/proto3/#packages-name-resolution
+        """
+        if type_name.startswith("."):
+            candidates = [type_name]
+        else:
+            candidates = []
+            while True:
+                candidates.append(f"{scope}.{type_name}")
+                if not scope:
+                    break
+                scope = scope.rpartition(".")[0]
+        for candidate in candidates:
+            if candidate in self.symbols:
+                return candidate, self.symbols[candidate]
+            if candidate in _WELL_KNOWN:
+                return candidate, None
+        raise IncorrectProtoError(f"{self.source_name}: cannot resolve type `{type_name}`")
+
+
+def _qualify(package: Optional[str]) -> str:
+    return f".{package}" if package else ""
+
+
+def _name(name: str, shadowed: Collection[str] = ()) -> str:
+    """Avoid the name clashes with the keywords, the imported names, and the `shadowed` ones."""
+    return f"{name}_" if iskeyword(name) or name in _RESERVED or name in shadowed else name
+
+
+def _import_statements(imports: Mapping[str, set[str]]) -> Iterator[str]:
+    """Generate the import statements in the `isort` order."""
+    for module in sorted(module for module, names in imports.items() if not names):
+        yield f"import {module}"
+    for module, names in sorted(imports.items()):
+        if names:
+            yield f"from {module} import {', '.join(sorted(names, key=_import_order))}"
+
+
+def _import_order(name: str) -> tuple[int, str]:
+    # Constants, then classes, then the rest.
+    return (0 if name.isupper() else 1 if name[0].isupper() else 2), name
+
+
+def _member_name(name: str) -> str:
+    return f"{name}_" if iskeyword(name) else name
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """Run the command-line interface."""
+
+    parser = ArgumentParser(
+        prog="python -m pure_protobuf.generate",
+        description="Generate the message classes from a `.proto` file.",
+    )
+    parser.add_argument("proto", type=Path, help="`.proto` file")
+    parser.add_argument(
+        "-I",
+        "--include",
+        type=Path,
+        action="append",
+        default=[],
+        help="directory, where the imports are looked up, may be repeated, the file's directory by default",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="output file, standard output by default")
+    parser.add_argument(
+        "--codecs",
+        help="module with the compiled codecs to declare, for example: ._codecs, see `pure_protobuf.compile`",
+    )
+    parsed_args = parser.parse_args(args)
+
+    source = generate(parsed_args.proto, parsed_args.include, parsed_args.codecs)
+    if parsed_args.output is not None:
+        parsed_args.output.write_text(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
-from collections.abc import Iterable
-from typing import Any, Union
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional, Union
 
 from typing_extensions import TypeGuard, get_args, get_origin
 
@@ -37,6 +37,15 @@ def extract_repeated(hint: Any) -> tuple[Any, TypeGuard[list]]:
     return hint, False
 
 
+def extract_mapping(hint: Any) -> Optional[tuple[Any, Any]]:
+    """Extract possible key and value hints of a mapping."""
+    origin = get_origin(hint)
+    if isinstance(origin, type) and issubclass(origin, Mapping):
+        key_hint, value_hint = get_args(hint)
+        return key_hint, value_hint
+    return None
+
+
 def extract_optional(hint: Any) -> tuple[Any, bool]:
     """Extract a possible optional flag."""
     if get_origin(hint) in UNION_TYPES:
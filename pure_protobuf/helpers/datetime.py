@@ -1,5 +1,9 @@
+from datetime import datetime, timedelta, timezone
 from math import modf
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+"""Unix epoch as an aware `datetime`."""
+
 
 def split_seconds(seconds: float) -> tuple[int, int]:
     """Split seconds into whole seconds and nanoseconds."""
@@ -10,3 +14,35 @@ def split_seconds(seconds: float) -> tuple[int, int]:
 def unsplit_seconds(seconds: int, nanos: int) -> float:
     """Merge whole seconds and nanoseconds back to normal seconds."""
     return float(seconds) + float(nanos) / 1_000_000_000.0
+
+
+def split_datetime(value: datetime) -> tuple[int, int]:
+    """
+    Split the `datetime` into whole seconds since the epoch and non-negative nanoseconds.
+
+    Naive `datetime`s are considered to be in the local time, like `datetime.timestamp()` does.
+    """
+    if value.tzinfo is None:
+        value = value.astimezone(timezone.utc)
+    delta = value - EPOCH
+    return delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+
+
+def unsplit_datetime(seconds: int, nanos: int) -> datetime:
+    """Merge seconds since the epoch and nanoseconds back into an aware UTC `datetime`."""
+    return EPOCH + timedelta(seconds=seconds, microseconds=nanos // 1000)
+
+
+def split_timedelta(value: timedelta) -> tuple[int, int]:
+    """Split the `timedelta` into whole seconds and nanoseconds of the same sign."""
+    microseconds = (value.days * 86400 + value.seconds) * 1_000_000 + value.microseconds
+    seconds, microseconds = divmod(abs(microseconds), 1_000_000)
+    if value.days < 0:
+        return -seconds, -microseconds * 1000
+    return seconds, microseconds * 1000
+
+
+def unsplit_timedelta(seconds: int, nanos: int) -> timedelta:
+    """Merge whole seconds and nanoseconds back into a `timedelta`."""
+    # Nanoseconds are truncated towards zero.
+    return timedelta(seconds=seconds, microseconds=nanos // 1000 if nanos >= 0 else -(-nanos // 1000))
@@ -0,0 +1,251 @@
+"""
+Opt-in per-message-class counters of the encoding and decoding.
+
+When disabled, which is the default, nothing is installed, and the messages are processed at the full speed.
+When enabled, the message classes get their `read_from()`, `write_to()`, and `__PROTOBUF_SKIP__`
+wrapped by the counting ones, which are removed again on disabling.
+
+Notes:
+    - Counters of a message class include its embedded messages, which are also counted on their own.
+    - Bytes are counted only for the file objects, which support `tell()`, like `BytesIO`.
+    - Embedded messages are counted on their own only within the message classes, whose schemas are built
+      while enabled. Otherwise, the embedded `read_from()` is bound once, so that it costs nothing extra.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import RLock
+from time import perf_counter
+from typing import IO, Any, Callable, Optional
+from weakref import WeakKeyDictionary
+
+from pure_protobuf.exceptions import UnexpectedWireTypeError
+from pure_protobuf.helpers._dataclasses import SLOTS
+from pure_protobuf.interfaces._skip import Skip
+from pure_protobuf.io.wire_type import WireType
+from pure_protobuf.message import _CLASS_HOOKS, BaseMessage, _is_schema_built, _set_late_bound_reads
+
+
+@dataclass(**SLOTS)
+class MessageCounters:
+    """Counters of a single message class."""
+
+    decode_calls: int = 0
+    """Number of the decoded messages."""
+
+    decode_bytes: int = 0
+    """Number of the decoded bytes."""
+
+    decode_seconds: float = 0.0
+    """Total decoding time."""
+
+    encode_calls: int = 0
+    """Number of the encoded messages."""
+
+    encode_bytes: int = 0
+    """Number of the encoded bytes."""
+
+    encode_seconds: float = 0.0
+    """Total encoding time."""
+
+    unknown_fields: int = 0
+    """Number of the unknown fields, which were skipped while decoding."""
+
+    wire_type_mismatches: int = 0
+    """Number of the fields, which failed to decode because of an unexpected wire type."""
+
+
+_COUNTERS: WeakKeyDictionary[type[BaseMessage], MessageCounters] = WeakKeyDictionary()
+"""Counters of the instrumented message classes."""
+
+_SAVED: WeakKeyDictionary[type[BaseMessage], dict[str, Any]] = WeakKeyDictionary()
+"""Original own attributes of the instrumented message classes, `_MISSING` if the attribute was inherited."""
+
+_MISSING = object()
+
+_ORIGINAL = "__protobuf_original__"
+"""Attribute of a counting wrapper, which refers to the wrapped function."""
+
+_LOCK = RLock()
+
+
+def enable() -> Mapping[type[BaseMessage], MessageCounters]:
+    """
+    Start counting.
+
+    Returns:
+        Live counters by message class, the classes appear on their first use.
+    """
+    with _LOCK:
+        if _instrument not in _CLASS_HOOKS:
+            _set_late_bound_reads(True)
+            _CLASS_HOOKS.append(_instrument)
+            pending = BaseMessage.__subclasses__()
+            while pending:
+                message_type = pending.pop()
+                _instrument(message_type, _is_schema_built(message_type))
+                pending.extend(message_type.__subclasses__())
+    return _COUNTERS
+
+
+def disable() -> None:
+    """Stop counting and uninstall the wrappers, the collected counters are kept."""
+    with _LOCK:
+        if _instrument in _CLASS_HOOKS:
+            _CLASS_HOOKS.remove(_instrument)
+            _set_late_bound_reads(False)
+        for message_type, saved in list(_SAVED.items()):
+            for name, value in saved.items():
+                if value is _MISSING:
+                    delattr(message_type, name)
+                else:
+                    setattr(message_type, name, value)
+        _SAVED.clear()
+
+
+def is_enabled() -> bool:
+    """Check whether the counting is enabled."""
+    return _instrument in _CLASS_HOOKS
+
+
+def get_counters() -> Mapping[type[BaseMessage], MessageCounters]:
+    """Get the live counters by message class."""
+    return _COUNTERS
+
+
+def reset() -> None:
+    """Reset all the counters."""
+    _COUNTERS.clear()
+
+
+@contextmanager
+def instrumented() -> Iterator[Mapping[type[BaseMessage], MessageCounters]]:
+    """Count within the context."""
+    was_enabled = is_enabled()
+    try:
+        yield enable()
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def _instrument(message_type: type[BaseMessage], is_built: bool) -> None:
+    """
+    Install the counting wrappers, which are not yet installed.
+
+    `write_to()` is only wrapped after the schema is built, because the compiled codec may replace it.
+    """
+    with _LOCK:
+        saved = _SAVED.setdefault(message_type, {})
+        try:
+            counters = _COUNTERS[message_type]
+        except KeyError:
+            counters = _COUNTERS[message_type] = MessageCounters()
+
+        if "read_from" not in saved:
+            _replace(message_type, "read_from", classmethod(_wrap_read_from(message_type, counters)))
+        if "__PROTOBUF_SKIP__" not in saved:
+            _replace(message_type, "__PROTOBUF_SKIP__", _wrap_skip(message_type.__PROTOBUF_SKIP__, counters))
+        if "write_to" not in saved and is_built:
+            _replace(message_type, "write_to", _wrap_write_to(message_type, counters))
+
+
+def _replace(message_type: type[BaseMessage], name: str, value: Any) -> None:
+    _SAVED[message_type][name] = _unwrap_attribute(message_type.__dict__.get(name, _MISSING))
+    setattr(message_type, name, value)
+
+
+def _unwrap_attribute(value: Any) -> Any:
+    """
+    Get the original class attribute.
+
+    The own attribute may already be a wrapper, for example, when `@dataclass(slots=True)` re-creates
+    the instrumented class, copying the wrappers into the new class.
+    """
+    if isinstance(value, classmethod):
+        function = value.__func__
+        return classmethod(_unwrap(function)) if hasattr(function, _ORIGINAL) else value
+    if isinstance(value, Mapping):
+        return {key: _unwrap(item) for key, item in value.items()}
+    if callable(value):
+        return _unwrap(value)
+    return value
+
+
+def _unwrap(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Get the original function, since the inherited one may be a wrapper installed into a parent class."""
+    return getattr(function, _ORIGINAL, function)
+
+
+def _tell(io: IO[bytes]) -> Optional[int]:
+    try:
+        return io.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _wrap_read_from(
+    message_type: type[BaseMessage],
+    counters: MessageCounters,
+) -> Callable[[type[BaseMessage], IO[bytes]], BaseMessage]:
+    read_from = _unwrap(message_type.read_from.__func__)  # type: ignore[attr-defined]
+
+    def counting_read_from(cls: type[BaseMessage], io: IO[bytes]) -> BaseMessage:
+        start_position = _tell(io)
+        start_time = perf_counter()
+        try:
+            return read_from(cls, io)  # type: ignore[no-any-return]
+        except UnexpectedWireTypeError as e:
+            # Only the innermost message, which actually has the field, counts the mismatch.
+            if not getattr(e, "__protobuf_counted__", False):
+                counters.wire_type_mismatches += 1
+                e.__protobuf_counted__ = True  # type: ignore[attr-defined]
+            raise
+        finally:
+            counters.decode_seconds += perf_counter() - start_time
+            counters.decode_calls += 1
+            if start_position is not None:
+                end_position = _tell(io)
+                if end_position is not None:
+                    counters.decode_bytes += end_position - start_position
+
+    setattr(counting_read_from, _ORIGINAL, read_from)
+    return counting_read_from
+
+
+def _wrap_write_to(
+    message_type: type[BaseMessage],
+    counters: MessageCounters,
+) -> Callable[[BaseMessage, IO[bytes]], None]:
+    write_to = _unwrap(message_type.write_to)
+
+    def counting_write_to(self: BaseMessage, io: IO[bytes]) -> None:
+        start_position = _tell(io)
+        start_time = perf_counter()
+        try:
+            write_to(self, io)
+        finally:
+            counters.encode_seconds += perf_counter() - start_time
+            counters.encode_calls += 1
+            if start_position is not None:
+                end_position = _tell(io)
+                if end_position is not None:
+                    counters.encode_bytes += end_position - start_position
+
+    setattr(counting_write_to, _ORIGINAL, write_to)
+    return counting_write_to
+
+
+def _wrap_skip(skip: Mapping[WireType, Skip], counters: MessageCounters) -> Mapping[WireType, Skip]:
+    def wrap(skip: Skip) -> Skip:
+        def counting_skip(io: IO[bytes]) -> None:
+            counters.unknown_fields += 1
+            skip(io)
+
+        setattr(counting_skip, _ORIGINAL, skip)
+        return counting_skip
+
+    return {wire_type: wrap(_unwrap(skip_)) for wire_type, skip_ in skip.items()}
@@ -14,4 +14,10 @@ RecordT = TypeVar("RecordT")
 RecordT_contra = TypeVar("RecordT_contra", contravariant=True)
 RecordT_co = TypeVar("RecordT_co", covariant=True)
 
+KeyT = TypeVar("KeyT")
+"""Map field's key type."""
+
+ValueT = TypeVar("ValueT")
+"""Map field's value type."""
+
 MessageT = TypeVar("MessageT", bound="BaseMessage")
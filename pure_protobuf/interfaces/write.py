@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from io import BytesIO
 from typing import IO, Protocol
 
 from pure_protobuf.interfaces._repr import Repr
@@ -11,3 +12,21 @@ class Write(Repr, Protocol[FieldT_contra]):
     @abstractmethod
     def __call__(self, __value: FieldT_contra, __io: IO[bytes]) -> None:
         raise NotImplementedError
+
+    def size(self, __value: FieldT_contra) -> int:
+        """
+        Calculate the exact serialized size of the value.
+
+        By default, the value gets written into a buffer, the built-in writers override it with the arithmetic.
+        """
+        io = BytesIO()
+        self(__value, io)
+        return io.tell()
+
+    def max_size(self, __value: FieldT_contra) -> int:
+        """
+        Calculate an upper bound of the serialized size of the value.
+
+        It should be cheaper than `size()`, by default, it is the exact size.
+        """
+        return self.size(__value)
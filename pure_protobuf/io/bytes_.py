@@ -6,6 +6,7 @@ See Also:
 
 """
 
+from functools import lru_cache
 from io import SEEK_CUR
 from typing import IO
 
@@ -13,7 +14,7 @@ from pure_protobuf.helpers.io import read_checked
 from pure_protobuf.interfaces._skip import Skip
 from pure_protobuf.interfaces.read import ReadSingular
 from pure_protobuf.interfaces.write import Write
-from pure_protobuf.io.varint import read_unsigned_varint, write_unsigned_varint
+from pure_protobuf.io.varint import get_unsigned_varint_size, read_unsigned_varint, write_unsigned_varint
 
 
 class SkipBytes(Skip):
@@ -27,6 +28,10 @@ class WriteBytes(Write[bytes]):
         write_unsigned_varint(len(value), io)
         io.write(value)
 
+    def size(self, value: bytes) -> int:
+        length = len(value)
+        return get_unsigned_varint_size(length) + length
+
 
 class ReadBytes(ReadSingular[bytes]):
     def __call__(self, io: IO[bytes]) -> bytes:
@@ -44,10 +49,47 @@ class ReadString(ReadSingular[str]):
         return read_bytes(io).decode("utf-8")
 
 
+class ReadInternedString(ReadSingular[str]):
+    """
+    Reads a string, so that the repeated values share the same object.
+
+    Notes:
+        - The recently read values are cached by their raw bytes, so that the repeated values are not decoded again,
+          and the cached string gets returned instead. The cache is bounded, and, unlike `sys.intern()`,
+          it never makes the strings immortal.
+    """
+
+    __slots__ = ("decode",)
+
+    # noinspection PyProtocol
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.decode = lru_cache(maxsize)(_decode_string)
+
+    def __call__(self, io: IO[bytes]) -> str:
+        return self.decode(read_bytes(io))
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{type(self).__name__}(maxsize={self.decode.cache_parameters()['maxsize']})"
+
+
+def _decode_string(value: bytes) -> str:
+    return value.decode("utf-8")
+
+
 class WriteString(Write[str]):
     def __call__(self, value: str, io: IO[bytes]) -> None:
         write_bytes(value.encode("utf-8"), io)
 
+    def size(self, value: str) -> int:
+        # ASCII strings are measured without encoding.
+        length = len(value) if value.isascii() else len(value.encode("utf-8"))
+        return get_unsigned_varint_size(length) + length
+
+    def max_size(self, value: str) -> int:
+        # A code point takes at most 4 bytes in UTF-8.
+        length = len(value) if value.isascii() else len(value) * 4
+        return get_unsigned_varint_size(length) + length
+
 
 read_string = ReadString()
 write_string = WriteString()
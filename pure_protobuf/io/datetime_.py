@@ -0,0 +1,128 @@
+"""
+Reading and writing `datetime` and `timedelta` as the well-known `Timestamp` and `Duration`.
+
+The values are written inline as the embedded `seconds` and `nanos` fields,
+no intermediate message gets instantiated.
+
+See Also:
+    - https://protobuf.dev/reference/protobuf/google.protobuf/#timestamp
+    - https://protobuf.dev/reference/protobuf/google.protobuf/#duration
+
+"""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import IO
+
+from pure_protobuf.exceptions import IncorrectValueError
+from pure_protobuf.helpers.datetime import split_datetime, split_timedelta, unsplit_datetime, unsplit_timedelta
+from pure_protobuf.interfaces._skip import Skip, skip_no_operation
+from pure_protobuf.interfaces.read import Read
+from pure_protobuf.interfaces.write import Write
+from pure_protobuf.io.bytes_ import skip_bytes
+from pure_protobuf.io.fixed32 import skip_fixed_32
+from pure_protobuf.io.fixed64 import skip_fixed_64
+from pure_protobuf.io.tag import Tag
+from pure_protobuf.io.varint import ReadTwosComplimentVarint, WriteTwosComplimentVarint, skip_varint
+from pure_protobuf.io.wire_type import WireType
+
+
+class ReadTimestamp(Read[datetime]):
+    """Reads an embedded `Timestamp` into an aware UTC `datetime`, the nanoseconds are truncated to microseconds."""
+
+    __slots__ = ()
+
+    def __call__(self, io: IO[bytes]) -> Iterator[datetime]:
+        seconds, nanos = _read_time_span(io)
+        try:
+            yield unsplit_datetime(seconds, nanos)
+        except OverflowError as e:
+            raise IncorrectValueError(f"timestamp of {seconds} seconds is out of range") from e
+
+
+class WriteTimestamp(Write[datetime]):
+    """Writes a `datetime` as an embedded `Timestamp`, without its length."""
+
+    __slots__ = ()
+
+    def __call__(self, value: datetime, io: IO[bytes]) -> None:
+        _write_time_span(*split_datetime(value), io)
+
+    def size(self, value: datetime) -> int:
+        return _get_time_span_size(*split_datetime(value))
+
+
+class ReadDuration(Read[timedelta]):
+    """Reads an embedded `Duration` into a `timedelta`, the nanoseconds are truncated to microseconds."""
+
+    __slots__ = ()
+
+    def __call__(self, io: IO[bytes]) -> Iterator[timedelta]:
+        seconds, nanos = _read_time_span(io)
+        try:
+            yield unsplit_timedelta(seconds, nanos)
+        except OverflowError as e:
+            raise IncorrectValueError(f"duration of {seconds} seconds is out of range") from e
+
+
+class WriteDuration(Write[timedelta]):
+    """Writes a `timedelta` as an embedded `Duration`, without its length."""
+
+    __slots__ = ()
+
+    def __call__(self, value: timedelta, io: IO[bytes]) -> None:
+        _write_time_span(*split_timedelta(value), io)
+
+    def size(self, value: timedelta) -> int:
+        return _get_time_span_size(*split_timedelta(value))
+
+
+def _read_time_span(io: IO[bytes]) -> tuple[int, int]:
+    seconds = 0
+    nanos = 0
+    while True:
+        try:
+            tag = Tag.read_from(io)
+        except EOFError:
+            return seconds, nanos
+        if tag.wire_type == WireType.VARINT and tag.field_number == 1:
+            seconds = _read_varint(io)
+        elif tag.wire_type == WireType.VARINT and tag.field_number == 2:
+            nanos = _read_varint(io)
+        else:
+            _SKIP[tag.wire_type](io)
+
+
+def _write_time_span(seconds: int, nanos: int, io: IO[bytes]) -> None:
+    # Zero fields are omitted, as they would be in the `Timestamp` and `Duration` messages.
+    if seconds:
+        io.write(_SECONDS_TAG)
+        _write_varint(seconds, io)
+    if nanos:
+        io.write(_NANOS_TAG)
+        _write_varint(nanos, io)
+
+
+def _get_time_span_size(seconds: int, nanos: int) -> int:
+    size = 0
+    if seconds:
+        size += len(_SECONDS_TAG) + _write_varint.size(seconds)
+    if nanos:
+        size += len(_NANOS_TAG) + _write_varint.size(nanos)
+    return size
+
+
+_read_varint = ReadTwosComplimentVarint()
+_write_varint = WriteTwosComplimentVarint()
+
+_SECONDS_TAG = bytes((Tag(field_number=1, wire_type=WireType.VARINT).encode(),))
+_NANOS_TAG = bytes((Tag(field_number=2, wire_type=WireType.VARINT).encode(),))
+
+_SKIP: dict[WireType, Skip] = {
+    WireType.VARINT: skip_varint,
+    WireType.I64: skip_fixed_64,
+    WireType.LEN: skip_bytes,
+    WireType.I32: skip_fixed_32,
+    WireType.SGROUP: skip_no_operation,
+    WireType.EGROUP: skip_no_operation,
+}
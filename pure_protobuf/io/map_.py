@@ -0,0 +1,123 @@
+"""
+Reading and writing map entries.
+
+See Also:
+    - https://protobuf.dev/programming-guides/encoding/#maps
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import IO, TYPE_CHECKING, Callable, Generic, Optional
+
+from pure_protobuf.interfaces._repr import ReprWithInner
+from pure_protobuf.interfaces._vars import KeyT, ValueT
+from pure_protobuf.interfaces.read import Read
+from pure_protobuf.interfaces.write import Write
+from pure_protobuf.io.tag import Tag
+
+if TYPE_CHECKING:
+    from pure_protobuf.descriptors.record import RecordDescriptor
+    from pure_protobuf.message import BaseMessage
+
+
+class ReadMapEntry(Read[tuple[KeyT, ValueT]], Generic[KeyT, ValueT]):
+    """
+    Read a single map entry as a key-value pair.
+
+    Notes:
+        - The entry is read directly into the pair, no intermediate message gets instantiated.
+        - Missing key or value gets substituted with the respective zero value.
+        - Unknown fields are skipped via the message class' `__PROTOBUF_SKIP__`, which is looked up on each call,
+          since it may get replaced later.
+    """
+
+    __slots__ = ("key", "key_zero", "value", "value_zero", "message_type")
+
+    # noinspection PyProtocol
+    def __init__(
+        self,
+        key: RecordDescriptor[KeyT],
+        key_zero: Callable[[], KeyT],
+        value: RecordDescriptor[ValueT],
+        value_zero: Callable[[], ValueT],
+        message_type: type[BaseMessage],
+    ) -> None:
+        self.key = key
+        self.key_zero = key_zero
+        self.value = value
+        self.value_zero = value_zero
+        self.message_type = message_type
+
+    def __call__(self, io: IO[bytes]) -> Iterator[tuple[KeyT, ValueT]]:
+        key: Optional[KeyT] = None
+        value: Optional[ValueT] = None
+        while True:
+            try:
+                tag = Tag.read_from(io)
+            except EOFError:
+                break
+            if tag.field_number == 1:
+                key = self.key.accumulate(key, self.key.read(io, tag.wire_type))
+            elif tag.field_number == 2:
+                value = self.value.accumulate(value, self.value.read(io, tag.wire_type))
+            else:
+                self.message_type.__PROTOBUF_SKIP__[tag.wire_type](io)
+        yield (
+            key if key is not None else self.key_zero(),
+            value if value is not None else self.value_zero(),
+        )
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{type(self).__name__}({self.key.read!r}, {self.value.read!r})"
+
+
+class WriteMapEntry(Write[tuple[KeyT, ValueT]], Generic[KeyT, ValueT]):
+    """Write a key-value pair as a map entry, the inner writers are expected to be tagged."""
+
+    __slots__ = ("key", "value")
+
+    # noinspection PyProtocol
+    def __init__(self, key: Write[KeyT], value: Write[ValueT]) -> None:
+        self.key = key
+        self.value = value
+
+    def __call__(self, entry: tuple[KeyT, ValueT], io: IO[bytes]) -> None:
+        key, value = entry
+        self.key(key, io)
+        self.value(value, io)
+
+    def size(self, entry: tuple[KeyT, ValueT]) -> int:
+        key, value = entry
+        return self.key.size(key) + self.value.size(value)
+
+    def max_size(self, entry: tuple[KeyT, ValueT]) -> int:
+        key, value = entry
+        return self.key.max_size(key) + self.value.max_size(value)
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{type(self).__name__}({self.key!r}, {self.value!r})"
+
+
+class WriteMap(Write[Mapping[KeyT, ValueT]], ReprWithInner):
+    """Wrap an inner entry writer to write all the mapping items."""
+
+    __slots__ = ("inner",)
+
+    inner: Write[tuple[KeyT, ValueT]]
+
+    # noinspection PyProtocol
+    def __init__(self, inner: Write[tuple[KeyT, ValueT]]) -> None:
+        self.inner = inner
+
+    def __call__(self, value: Mapping[KeyT, ValueT], io: IO[bytes]) -> None:
+        inner = self.inner
+        for item in value.items():
+            inner(item, io)
+
+    def size(self, value: Mapping[KeyT, ValueT]) -> int:
+        return sum(map(self.inner.size, value.items()))
+
+    def max_size(self, value: Mapping[KeyT, ValueT]) -> int:
+        return sum(map(self.inner.max_size, value.items()))
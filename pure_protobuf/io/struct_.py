@@ -34,3 +34,6 @@ class WriteStruct(Write[RecordT_contra], ReprWithInner, Generic[RecordT_contra])
 
     def __call__(self, value: RecordT_contra, io: IO[bytes]) -> None:
         io.write(self.inner.pack(value))
+
+    def size(self, value: RecordT_contra) -> int:
+        return self.inner.size
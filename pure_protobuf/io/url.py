@@ -1,23 +1,51 @@
 """Reading and writing parsed URLs."""
 
 from collections.abc import Iterator
+from functools import lru_cache
 from typing import IO
 from urllib.parse import ParseResult, urlparse
 
 from pure_protobuf.interfaces.read import Read
 from pure_protobuf.interfaces.write import Write
-from pure_protobuf.io.bytes_ import read_string, write_string
+from pure_protobuf.io.bytes_ import read_bytes, write_bytes
 
 
 class ReadUrl(Read[ParseResult]):
+    """
+    Reads a parsed URL.
+
+    Notes:
+        - The recently read URLs are cached by their raw bytes, since URLs, such as type URLs, tend to repeat.
+    """
+
     __slots__ = ()
 
     def __call__(self, io: IO[bytes]) -> Iterator[ParseResult]:
-        yield urlparse(read_string(io))
+        yield _parse_url(read_bytes(io))
 
 
 class WriteUrl(Write[ParseResult]):
+    """
+    Writes a parsed URL.
+
+    Notes:
+        - The recently written URLs are cached along with their encoded values.
+    """
+
     __slots__ = ()
 
     def __call__(self, value: ParseResult, io: IO[bytes]) -> None:
-        write_string(value.geturl(), io)
+        write_bytes(_encode_url(value), io)
+
+    def size(self, value: ParseResult) -> int:
+        return write_bytes.size(_encode_url(value))
+
+
+@lru_cache(maxsize=1024)
+def _parse_url(value: bytes) -> ParseResult:
+    return urlparse(value.decode("utf-8"))
+
+
+@lru_cache(maxsize=1024)
+def _encode_url(value: ParseResult) -> bytes:
+    return value.geturl().encode("utf-8")
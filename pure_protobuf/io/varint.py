@@ -47,6 +47,14 @@ class WriteUnsignedVarint(Write[int]):
             value >>= 7
         io.write(bytes((value,)))
 
+    def size(self, value: int) -> int:
+        return get_unsigned_varint_size(value)
+
+
+def get_unsigned_varint_size(value: int) -> int:
+    """Get the encoded size of the unsigned varint."""
+    return (value.bit_length() + 6) // 7 or 1
+
 
 skip_varint = SkipVarint()
 read_unsigned_varint = ReadUnsignedVarint()
@@ -72,6 +80,12 @@ class WriteZigZagVarint(Write[int]):
     def __call__(self, value: int, io: IO[bytes]) -> None:
         write_unsigned_varint(abs(value) * 2 - (value < 0), io)
 
+    def size(self, value: int) -> int:
+        return get_unsigned_varint_size(abs(value) * 2 - (value < 0))
+
+    def max_size(self, value: int) -> int:
+        return _MAX_VARINT_SIZE
+
 
 class ReadTwosComplimentVarint(ReadSingular[int]):
     """
@@ -106,6 +120,13 @@ class WriteTwosComplimentVarint(Write[int]):
         )
         return write_unsigned_varint(compliment, io)
 
+    def size(self, value: int) -> int:
+        # Negative values take all the 10 bytes.
+        return get_unsigned_varint_size(value) if value >= 0 else _MAX_VARINT_SIZE
+
+    def max_size(self, value: int) -> int:
+        return _MAX_VARINT_SIZE
+
 
 class ReadBool(ReadSingular[bool]):
     def __call__(self, io: IO[bytes]) -> bool:
@@ -116,6 +137,9 @@ class WriteBool(Write[bool]):
     def __call__(self, value: bool, io: IO[bytes]) -> None:
         write_unsigned_varint(int(value), io)
 
+    def size(self, value: bool) -> int:
+        return 1
+
 
 read_bool = ReadBool()
 write_bool = WriteBool()
@@ -125,28 +149,69 @@ EnumT = TypeVar("EnumT", bound=IntEnum)
 
 
 class ReadEnum(Read[EnumT]):
-    __slots__ = ("enum_type",)
+    """
+    Reads an enum member.
+
+    Notes:
+        - Members are looked up in the table, which is precomputed from the enum type.
+        - Enum values are signed: negative values take all the 10 bytes of a varint.
+        - In the open mode, unknown values are read as plain `int`s, otherwise they are rejected.
+
+    See Also:
+        - https://protobuf.dev/programming-guides/enum/
+    """
+
+    __slots__ = ("enum_type", "open_", "members")
 
     # noinspection PyProtocol
-    def __init__(self, enum_type: type[EnumT]) -> None:
+    def __init__(self, enum_type: type[EnumT], open_: bool = False) -> None:
         self.enum_type = enum_type
+        self.open_ = open_
+        self.members: dict[int, EnumT] = {member.value: member for member in enum_type}
 
     def __call__(self, io: IO[bytes]) -> Iterator[EnumT]:
         value = read_unsigned_varint(io)
-        try:
-            yield self.enum_type(value)
-        except ValueError as e:
-            raise IncorrectValueError(
-                f"incorrect value {value} for enum `{self.enum_type!r}`",
-            ) from e
+        if value > _MAX_INT64:
+            value -= _UINT64_MODULO
+        member = self.members.get(value)
+        if member is None:
+            try:
+                # The enum type may still accept the value, for example, via `_missing_()`.
+                member = self.enum_type(value)
+            except ValueError as e:
+                if not self.open_:
+                    raise IncorrectValueError(
+                        f"incorrect value {value} for enum `{self.enum_type!r}`",
+                    ) from e
+                yield value  # type: ignore[misc]
+                return
+        yield member
 
     def __repr__(self) -> str:  # noqa: D105
+        if self.open_:
+            return f"{type(self).__name__}({self.enum_type.__name__}, open_=True)"
         return f"{type(self).__name__}({self.enum_type.__name__})"
 
 
 class WriteEnum(Write[EnumT]):
+    """Writes an enum member, or a plain `int` value of an open enum."""
+
     __slots__ = ()
 
     def __call__(self, value: EnumT, io: IO[bytes]) -> None:
-        # noinspection PyTypeChecker
-        write_unsigned_varint(value.value, io)
+        # Negative values are written as 64-bit two's compliment.
+        write_unsigned_varint(value & _UINT64_MASK, io)
+
+    def size(self, value: EnumT) -> int:
+        return get_unsigned_varint_size(value & _UINT64_MASK)
+
+    def max_size(self, value: EnumT) -> int:
+        return _MAX_VARINT_SIZE
+
+
+_MAX_INT64 = 0x7FFF_FFFF_FFFF_FFFF
+_UINT64_MODULO = 1 << 64
+_UINT64_MASK = _UINT64_MODULO - 1
+
+_MAX_VARINT_SIZE = 10
+"""Encoded size of the largest 64-bit varint."""
@@ -1,6 +1,6 @@
 from collections.abc import Iterable, Iterator
 from io import BytesIO
-from typing import IO, Generic, Optional, cast
+from typing import IO, Callable, Generic, Optional, cast
 
 from pure_protobuf.exceptions import UnexpectedWireTypeError
 from pure_protobuf.interfaces._repr import ReprWithInner
@@ -9,6 +9,7 @@ from pure_protobuf.interfaces.read import Read, ReadTyped
 from pure_protobuf.interfaces.write import Write
 from pure_protobuf.io.bytes_ import read_bytes, write_bytes
 from pure_protobuf.io.tag import Tag
+from pure_protobuf.io.varint import get_unsigned_varint_size
 from pure_protobuf.io.wire_type import WireType
 
 
@@ -102,8 +103,14 @@ class WriteRepeated(Generic[RecordT, FieldT_contra], Write[FieldT_contra], ReprW
         for value in cast(Iterable[RecordT], values):
             self.inner(value, io)
 
+    def size(self, values: FieldT_contra) -> int:
+        return sum(map(self.inner.size, cast(Iterable[RecordT], values)))
 
-def to_bytes(write: Write[RecordT], value: RecordT) -> bytes:
+    def max_size(self, values: FieldT_contra) -> int:
+        return sum(map(self.inner.max_size, cast(Iterable[RecordT], values)))
+
+
+def to_bytes(write: Callable[[RecordT, IO[bytes]], None], value: RecordT) -> bytes:
     io = BytesIO()
     write(value, io)
     return io.getvalue()
@@ -123,6 +130,12 @@ class WriteTagged(Write[RecordT], ReprWithInner):
         io.write(self.encoded_tag)
         self.inner(value, io)
 
+    def size(self, value: RecordT) -> int:
+        return len(self.encoded_tag) + self.inner.size(value)
+
+    def max_size(self, value: RecordT) -> int:
+        return len(self.encoded_tag) + self.inner.max_size(value)
+
 
 class WriteOptional(Write[RecordT], ReprWithInner):
     """Wrap an inner writer to skip serialization of `None`."""
@@ -139,6 +152,12 @@ class WriteOptional(Write[RecordT], ReprWithInner):
         if value is not None:
             self.inner(value, io)
 
+    def size(self, value: Optional[RecordT]) -> int:
+        return self.inner.size(value) if value is not None else 0
+
+    def max_size(self, value: Optional[RecordT]) -> int:
+        return self.inner.max_size(value) if value is not None else 0
+
 
 class WriteLengthDelimited(Write[RecordT], ReprWithInner):
     """Wrap an inner writer into a length-delimited record."""
@@ -153,3 +172,11 @@ class WriteLengthDelimited(Write[RecordT], ReprWithInner):
 
     def __call__(self, value: RecordT, io: IO[bytes]) -> None:
         write_bytes(to_bytes(self.inner, value), io)
+
+    def size(self, value: RecordT) -> int:
+        size = self.inner.size(value)
+        return get_unsigned_varint_size(size) + size
+
+    def max_size(self, value: RecordT) -> int:
+        size = self.inner.max_size(value)
+        return get_unsigned_varint_size(size) + size
@@ -0,0 +1,181 @@
+"""
+Memory footprint accounting of the decoded messages.
+
+The deep in-memory size of a message is broken down by its fields and compared to the wire size,
+which helps to choose between string interning, packed arrays, or keeping the raw bytes around.
+
+Notes:
+    - Sizes are measured with `sys.getsizeof()`, and objects shared within a message, or within a sample,
+      are only counted once. Thus, interned strings and shared embedded messages cost nothing extra.
+    - `None`, booleans, and enumeration members are singletons, and they are not counted.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+from sys import getsizeof
+from typing import Any
+
+from pure_protobuf.helpers._dataclasses import SLOTS
+from pure_protobuf.message import BaseMessage
+
+
+@dataclass(**SLOTS)
+class FieldFootprint:
+    """Deep in-memory size of a single field."""
+
+    name: str
+    number: int
+
+    kind: str
+    """
+    Kind of the value: `string`, `bytes`, `list`, `map`, `message`, `scalar`, or `none`.
+
+    In a summary, it is the kind of the first set value.
+    """
+
+    size: int = 0
+    """Deep size in bytes, excluding the instance slot, which holds the value."""
+
+
+@dataclass(**SLOTS)
+class Footprint:
+    """Deep in-memory size of a message, or a sample of messages."""
+
+    message_type: type[BaseMessage]
+
+    count: int = 0
+    """Number of the measured messages."""
+
+    wire_size: int = 0
+    """Total serialized size in bytes."""
+
+    instance_size: int = 0
+    """Total size of the message instances themselves: the object header, slots, and `__dict__`, if any."""
+
+    fields: dict[str, FieldFootprint] = field(default_factory=dict)
+    """Field footprints by attribute name."""
+
+    @property
+    def size(self) -> int:
+        """Total deep in-memory size in bytes."""
+        return self.instance_size + sum(field_.size for field_ in self.fields.values())
+
+    @property
+    def ratio(self) -> float:
+        """In-memory size per serialized byte."""
+        return self.size / self.wire_size if self.wire_size else float("inf")
+
+    @property
+    def by_kind(self) -> dict[str, int]:
+        """Total field sizes by the value kind, along with the `instance` overhead."""
+        sizes = {"instance": self.instance_size}
+        for field_ in self.fields.values():
+            sizes[field_.kind] = sizes.get(field_.kind, 0) + field_.size
+        return sizes
+
+    def format(self) -> str:
+        """Format the footprint as a table, the largest fields first."""
+        total_size = self.size or 1
+        rows = [("field", "number", "kind", "bytes", "share")]
+        rows.append(("<instance>", "", "", str(self.instance_size), f"{self.instance_size / total_size:.1%}"))
+        for field_ in sorted(self.fields.values(), key=lambda field_: field_.size, reverse=True):
+            rows.append(
+                (field_.name, str(field_.number), field_.kind, str(field_.size), f"{field_.size / total_size:.1%}"),
+            )
+        rows.append(("<total>", "", "", str(self.size), f"{self.ratio:.2f}× wire size ({self.wire_size})"))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                value.ljust(width) if i in (0, 2) else value.rjust(width)
+                for i, (value, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
+
+    def __str__(self) -> str:  # noqa: D105
+        return self.format()
+
+
+def footprint(message: BaseMessage) -> Footprint:
+    """Measure the deep in-memory size of the message."""
+    return summarize((message,))
+
+
+def summarize(messages: Iterable[BaseMessage]) -> Footprint:
+    """
+    Measure the total deep in-memory size of the sample of messages of the same class.
+
+    Raises:
+        ValueError: the sample is empty, or contains messages of different classes
+    """
+    result = None
+    # The measured objects are kept alive, so that their identifiers do not get reused.
+    seen: dict[int, Any] = {}
+    for message in messages:
+        message_type = type(message)
+        if result is None:
+            result = Footprint(message_type)
+        elif message_type is not result.message_type:
+            raise ValueError(f"expected `{result.message_type.__qualname__}`, got `{message_type.__qualname__}`")
+
+        result.count += 1
+        result.wire_size += len(bytes(message))
+        seen[id(message)] = message
+        result.instance_size += _instance_size(message)
+        for number, (name, _) in message_type.__PROTOBUF_FIELDS_BY_NUMBER__.items():
+            value = getattr(message, name)
+            field_ = result.fields.get(name)
+            if field_ is None:
+                field_ = result.fields[name] = FieldFootprint(name=name, number=number, kind=_kind(value))
+            elif field_.kind == "none":
+                field_.kind = _kind(value)
+            field_.size += _deep_size(value, seen)
+
+    if result is None:
+        raise ValueError("the sample is empty")
+    return result
+
+
+def _instance_size(message: BaseMessage) -> int:
+    size = getsizeof(message)
+    instance_dict = getattr(message, "__dict__", None)
+    if instance_dict is not None:
+        # Not a slotted instance.
+        size += getsizeof(instance_dict)
+    return size
+
+
+def _kind(value: Any) -> str:
+    if value is None:
+        return "none"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "bytes"
+    if isinstance(value, BaseMessage):
+        return "message"
+    if isinstance(value, dict):
+        return "map"
+    if isinstance(value, (list, tuple)):
+        return "list"
+    return "scalar"
+
+
+def _deep_size(value: Any, seen: dict[int, Any]) -> int:
+    if value is None or isinstance(value, (bool, Enum)) or id(value) in seen:
+        return 0
+    seen[id(value)] = value
+
+    if isinstance(value, BaseMessage):
+        return _instance_size(value) + sum(
+            _deep_size(getattr(value, name), seen) for name, _ in value.__PROTOBUF_FIELDS_BY_NUMBER__.values()
+        )
+    size = getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(item, seen) for item in value)
+    elif isinstance(value, dict):
+        size += sum(_deep_size(key, seen) + _deep_size(item, seen) for key, item in value.items())
+    return size
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC
-from collections.abc import Mapping
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence, Sized
+from functools import partial
 from io import BytesIO
-from typing import IO, Any, ClassVar
+from itertools import islice
+from threading import RLock
+from typing import IO, TYPE_CHECKING, Any, Callable, ClassVar, Optional, Union, cast
+from weakref import WeakKeyDictionary, WeakSet
 
 from typing_extensions import Self
 
@@ -13,11 +18,18 @@ except ImportError:
     from get_annotations import get_annotations  # type: ignore[no-redef]
 
 from pure_protobuf._accumulators import AccumulateMessages
+from pure_protobuf._columns import decode_columns, encode_columns
+from pure_protobuf._compiled import install as install_codec
+from pure_protobuf._compiled import uninstall_inherited as uninstall_inherited_codec
+from pure_protobuf._construct import construct_trusted, get_default
 from pure_protobuf._mergers import MergeMessages
 from pure_protobuf.descriptors._field import _FieldDescriptor
 from pure_protobuf.descriptors.record import RecordDescriptor
+from pure_protobuf.exceptions import IncorrectValueError
 from pure_protobuf.helpers.itertools import ReadCallback
 from pure_protobuf.interfaces._skip import Skip, skip_no_operation
+from pure_protobuf.interfaces._vars import MessageT
+from pure_protobuf.interfaces.write import Write
 from pure_protobuf.io.bytes_ import skip_bytes
 from pure_protobuf.io.fixed32 import skip_fixed_32
 from pure_protobuf.io.fixed64 import skip_fixed_64
@@ -30,6 +42,10 @@ from pure_protobuf.io.wrappers import (
     WriteLengthDelimited,
     to_bytes,
 )
+from pure_protobuf.registry import register
+
+if TYPE_CHECKING:
+    from pure_protobuf.one_of import OneOf
 
 
 class BaseMessage(ABC):
@@ -39,6 +55,7 @@ class BaseMessage(ABC):
 
     __PROTOBUF_FIELDS_BY_NUMBER__: ClassVar[dict[int, tuple[str, _FieldDescriptor]]]
     __PROTOBUF_FIELDS_BY_NAME__: ClassVar[dict[str, _FieldDescriptor]]
+    __PROTOBUF_SCHEMA_BUILT__: ClassVar[bool]
 
     __PROTOBUF_SKIP__: ClassVar[Mapping[WireType, Skip]] = {
         WireType.VARINT: skip_varint,
@@ -50,25 +67,83 @@ class BaseMessage(ABC):
     }
     """Defines how to skip a field of the given wire type."""
 
+    __PROTOBUF_TRUSTED__: ClassVar[bool] = False
+    """
+    Enables the trusted decoding: decoded messages get constructed bypassing `__init__()` and validation.
+
+    The wire format has already typed the values, so it's safe as long as the class does not rely on
+    its `__init__()` or validators to transform the values.
+    """
+
     def __init_subclass__(cls) -> None:  # noqa: D105
-        cls.__PROTOBUF_FIELDS_BY_NUMBER__ = {}
-        cls.__PROTOBUF_FIELDS_BY_NAME__ = {}
+        # The schema gets built on the first access, since the type hints may be not resolvable yet.
+        cls.__PROTOBUF_FIELDS_BY_NUMBER__ = _LazySchema("__PROTOBUF_FIELDS_BY_NUMBER__")  # type: ignore[assignment]
+        cls.__PROTOBUF_FIELDS_BY_NAME__ = _LazySchema("__PROTOBUF_FIELDS_BY_NAME__")  # type: ignore[assignment]
+        cls.__PROTOBUF_SCHEMA_BUILT__ = False
+
+        register(cls)
+        uninstall_inherited_codec(cls)
+
+        # The parent's specialized setter is not aware of this class' fields.
+        with _SCHEMA_LOCK:
+            for base in cls.__mro__[1:]:
+                if base in _SETATTR_INSTALLED:
+                    del base.__setattr__
+                    _SETATTR_INSTALLED.discard(base)
+
+        for hook in _CLASS_HOOKS:
+            hook(cls, False)
+
+    @classmethod
+    def _build_schema(cls) -> None:
+        """
+        Build the field descriptors from the type hints.
 
-        type_hints: dict[str, Any] = get_annotations(cls, eval_str=True)
-        for name, hint in type_hints.items():
+        The schema is only published at the very end, after the codec and class hooks are installed.
+        Until then, the other threads wait for it in `_ensure_schema()`.
+        """
+
+        fields_by_number: dict[int, tuple[str, _FieldDescriptor]] = {}
+        fields_by_name: dict[str, _FieldDescriptor] = {}
+
+        for name, hint in _collect_type_hints(cls).items():
             descriptor = _FieldDescriptor.from_attribute(cls, hint)
             if descriptor is not None:
-                cls.__PROTOBUF_FIELDS_BY_NUMBER__[descriptor.number] = (name, descriptor)
-                cls.__PROTOBUF_FIELDS_BY_NAME__[name] = descriptor
+                fields_by_number[descriptor.number] = (name, descriptor)
+                fields_by_name[name] = descriptor
                 one_of = descriptor.one_of
                 if one_of is not None:
                     one_of._add_field(descriptor.number, name)
 
+        # Until published, the fields are only visible to the building thread.
+        pending = _SCHEMAS_BUILDING[cls]
+        pending["__PROTOBUF_FIELDS_BY_NAME__"] = fields_by_name
+        pending["__PROTOBUF_FIELDS_BY_NUMBER__"] = fields_by_number
+
+        install_codec(cls, fields_by_number)
+        _install_setattr(cls)
+        for hook in _CLASS_HOOKS:
+            hook(cls, True)
+        for name, value in pending.items():
+            # A hook may have already replaced the lazy attribute.
+            if isinstance(cls.__dict__.get(name), _LazySchema):
+                setattr(cls, name, value)
+        cls.__PROTOBUF_SCHEMA_BUILT__ = True
+
     @classmethod
     def read_from(cls, io: IO[bytes]) -> Self:
         """Read a message from the file."""
+        values = cls._read_values(io)
+        if cls.__PROTOBUF_TRUSTED__:
+            return construct_trusted(cls, values)
+        return cls(**values)
+
+    @classmethod
+    def _read_values(cls, io: IO[bytes]) -> dict[str, Any]:
+        """Read the message field values from the file."""
 
         values: dict[str, Any] = {}
+        which_one_of: dict[OneOf[Any], str] = {}
         while True:
             try:
                 tag = Tag.read_from(io)
@@ -90,9 +165,41 @@ class BaseMessage(ABC):
                 # Possibly update the one-of field.
                 one_of = descriptor.one_of
                 if one_of is not None:
-                    one_of._keep_values(values, descriptor.number)
+                    one_of._keep_values(values, which_one_of, name)
 
-        return cls(**values)
+        return values
+
+    @classmethod
+    def read_into(cls, instance: Self, io: IO[bytes]) -> Self:
+        """
+        Read a message from the file and merge it into the existing instance.
+
+        The fields present in the file follow the merge semantics: singular fields get overwritten,
+        repeated and map fields get extended in place, and embedded messages get merged recursively.
+        The other fields are left intact.
+
+        Returns:
+            The same instance.
+        """
+        if not isinstance(instance, cls):
+            raise TypeError(f"expected `{cls.__name__}`, got `{type(instance).__name__}`")
+        fields_by_name = cls.__PROTOBUF_FIELDS_BY_NAME__
+        for name, other in cls._read_values(io).items():
+            descriptor = fields_by_name[name]
+            value = descriptor.merge(getattr(instance, name), other)
+            setattr(instance, name, value)
+            one_of = descriptor.one_of
+            if one_of is not None and value is not None:
+                one_of._keep_attribute(instance, name)
+        return instance
+
+    def merge_from(self, buffer: bytes) -> None:
+        """
+        Read a message from the buffer and merge it into this instance.
+
+        This is functionally the same as calling `read_into(self, BytesIO(buffer))`.
+        """
+        type(self).read_into(self, BytesIO(buffer))
 
     @classmethod
     def loads(cls, buffer: bytes) -> Self:
@@ -103,18 +210,204 @@ class BaseMessage(ABC):
         """
         return cls.read_from(BytesIO(buffer))
 
+    @classmethod
+    def loads_dict(cls, buffer: bytes) -> dict[str, Any]:
+        """
+        Read the message field values from the buffer into a dictionary, without instantiating the message.
+
+        Returns:
+            Field values keyed by attribute names, in the declaration order.
+            Missing fields get the class defaults, like with `loads()`.
+
+        Notes:
+            - Embedded messages are still instantiated.
+            - Only **pydantic** models and dataclasses declare their defaults,
+              missing fields of the other classes are `None`.
+        """
+        values = cls._read_values(BytesIO(buffer))
+        return {
+            name: values[name] if name in values else get_default(cls, name) for name in cls.__PROTOBUF_FIELDS_BY_NAME__
+        }
+
+    @classmethod
+    def loads_tuple(cls, buffer: bytes) -> tuple[Any, ...]:
+        """
+        Read the message field values from the buffer into a tuple, without instantiating the message.
+
+        Returns:
+            Field values in the field number order. Missing fields get the class defaults, like with `loads()`.
+
+        Notes:
+            - Embedded messages are still instantiated.
+            - Only **pydantic** models and dataclasses declare their defaults,
+              missing fields of the other classes are `None`.
+        """
+        values = cls._read_values(BytesIO(buffer))
+        return tuple(
+            values[name] if name in values else get_default(cls, name)
+            for _, (name, _) in sorted(cls.__PROTOBUF_FIELDS_BY_NUMBER__.items())
+        )
+
+    @classmethod
+    def iter_field(cls, io: IO[bytes], name: str, others: Optional[dict[str, Any]] = None) -> Iterator[Any]:
+        """
+        Lazily read the items of a repeated or map field from the message in the file.
+
+        The items get yielded as they are read, so that the complete field value is never built.
+        For map fields, the items are the key-value pairs.
+
+        Args:
+            io: file to read the message from
+            name: attribute name of the repeated or map field
+            others: if specified, the other fields are read into this dictionary, otherwise, they are skipped.
+                The values are complete once the iteration is over.
+        """
+        try:
+            descriptor = cls.__PROTOBUF_FIELDS_BY_NAME__[name]
+        except KeyError:
+            raise IncorrectValueError(f"`{name}` is not a field of `{cls.__name__}`") from None
+        if not (descriptor.is_repeated or descriptor.is_map):
+            raise IncorrectValueError(f"`{name}` is neither a repeated nor a map field")
+        return cls._iter_field(io, descriptor, others)
+
+    @classmethod
+    def _iter_field(
+        cls,
+        io: IO[bytes],
+        descriptor: _FieldDescriptor[Any, Any],
+        others: Optional[dict[str, Any]],
+    ) -> Iterator[Any]:
+        which_one_of: dict[OneOf[Any], str] = {}
+        while True:
+            try:
+                tag = Tag.read_from(io)
+            except EOFError:
+                return
+            if tag.field_number == descriptor.number:
+                yield from descriptor.read(io, tag.wire_type)
+                continue
+            try:
+                other_name, other = cls.__PROTOBUF_FIELDS_BY_NUMBER__[tag.field_number]
+            except KeyError:
+                cls.__PROTOBUF_SKIP__[tag.wire_type](io)
+                continue
+            if others is None:
+                # The field is known, so it is skipped without being counted as unknown.
+                BaseMessage.__PROTOBUF_SKIP__[tag.wire_type](io)
+                continue
+            others[other_name] = other.accumulate(others.get(other_name), other.read(io, tag.wire_type))
+            one_of = other.one_of
+            if one_of is not None:
+                one_of._keep_values(others, which_one_of, other_name)
+
+    @classmethod
+    def decode_columns(
+        cls,
+        frames: Iterable[bytes],
+        *,
+        numpy: bool = False,
+    ) -> dict[str, Union[list[Any], array[Any]]]:
+        """
+        Read a batch of serialized messages into per-field columns, without instantiating the messages.
+
+        Singular non-optional fields of fixed-width and variable-length numeric types get decoded
+        into [`array`](https://docs.python.org/3/library/array.html) columns. The other fields,
+        including booleans, get decoded into lists.
+
+        The missing values are filled in with the field defaults, as declared by dataclasses and **pydantic** models.
+        Without a declared default, they are zeros in the array columns, empty lists and dictionaries
+        for the repeated and map fields, and `None` otherwise.
+
+        Args:
+            frames: serialized messages
+            numpy: convert the array columns into NumPy arrays, requires `numpy` to be installed
+
+        Returns:
+            Columns keyed by attribute names.
+        """
+        return decode_columns(cls, frames, numpy=numpy)
+
+    @classmethod
+    def encode_columns(cls, columns: Mapping[str, Sequence[Any]]) -> list[bytes]:
+        """
+        Serialize a batch of messages from the parallel per-field columns, without instantiating the messages.
+
+        The `i`-th message is built from the `i`-th items of the columns. Fields without a column
+        and `None` items are not serialized. Columns may also be arrays, including NumPy ones.
+
+        Args:
+            columns: equal-length columns keyed by attribute names
+
+        Returns:
+            Serialized messages, one per row.
+        """
+        return encode_columns(cls, columns)
+
     def write_to(self, io: IO[bytes]) -> None:
         """Write the message to the file."""
         for _, (name, descriptor) in self.__PROTOBUF_FIELDS_BY_NUMBER__.items():
             descriptor.write(getattr(self, name), io)
 
+    @classmethod
+    def write_field(cls, io: IO[bytes], name: str, value: Any) -> None:
+        """
+        Write a single field of the message into the file.
+
+        A message is a concatenation of its fields, so it may be written field by field, for example,
+        when a repeated field is too large to be materialized. Repeated field values may be any iterables,
+        including generators: unpacked values get written one by one as they are produced, and packed values
+        get written in packed records of up to 1024 items each.
+
+        Args:
+            io: file to write into
+            name: attribute name of the field
+            value: field value
+        """
+        try:
+            descriptor = cls.__PROTOBUF_FIELDS_BY_NAME__[name]
+        except KeyError:
+            raise IncorrectValueError(f"`{name}` is not a field of `{cls.__name__}`") from None
+        if descriptor.is_repeated and descriptor.is_packed and value is not None and not isinstance(value, Sized):
+            # A packed record needs its length upfront, thus the items are written chunk by chunk.
+            values = iter(value)
+            while True:
+                chunk = list(islice(values, _PACKED_CHUNK_SIZE))
+                if not chunk:
+                    break
+                descriptor.write(chunk, io)
+        else:
+            descriptor.write(value, io)
+
+    def byte_size(self) -> int:
+        """
+        Calculate the exact serialized size of the message, without serializing it.
+
+        This is the same as `len(bytes(message))`, but the size is summed up over the fields.
+        """
+        return sum(
+            descriptor.write.size(getattr(self, name))
+            for name, descriptor in self.__PROTOBUF_FIELDS_BY_NUMBER__.values()
+        )
+
+    def estimate_size(self) -> int:
+        """
+        Calculate an upper bound of the serialized size of the message.
+
+        It is cheaper than `byte_size()`: for example, strings are not encoded, and integers are assumed
+        to take the maximum varint size. Useful to check a message against a size limit.
+        """
+        return sum(
+            descriptor.write.max_size(getattr(self, name))
+            for name, descriptor in self.__PROTOBUF_FIELDS_BY_NUMBER__.values()
+        )
+
     def __bytes__(self) -> bytes:
         """
         Convert the message to a bytestring.
 
         This is functionally the same as calling `dumps()` or `write_to(BytesIO(…))`.
         """
-        return to_bytes(BaseMessage.write_to, self)
+        return to_bytes(type(self).write_to, self)
 
     def dumps(self) -> bytes:
         """
@@ -124,19 +417,193 @@ class BaseMessage(ABC):
         """
         return bytes(self)
 
-    def __setattr__(self, name: str, value: Any) -> None:  # noqa: D105
-        super().__setattr__(name, value)
-        descriptor = self.__PROTOBUF_FIELDS_BY_NAME__[name]
-        if (one_of := descriptor.one_of) is not None and value is not None:
-            one_of._keep_attribute(self, descriptor.number)
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Assign the attribute via the specialized setter of the message class.
+
+        The setter is made and, where possible, installed into the class along with the schema,
+        see `_install_setattr()`. This method only gets called when it could not be installed,
+        or when the schema is not built yet.
+        """
+        cls = type(self)
+        try:
+            setattr_ = _SETTERS[cls]
+        except KeyError:
+            _ensure_schema(cls)
+            setattr_ = _SETTERS[cls]
+        setattr_(self, name, value)
 
     @classmethod
     def _init_embedded_descriptor(cls) -> RecordDescriptor[Self]:
         accumulate = AccumulateMessages(cls)
+        # The instrumentation replaces `read_from()`, so it needs to be looked up on each call.
+        read_message = partial(_read_message, cls) if _LATE_BOUND_READS else cls.read_from
         return RecordDescriptor(
             wire_type=WireType.LEN,
-            write=WriteLengthDelimited(cls.write_to),
-            read=ReadStrictlyTyped(ReadLengthDelimited(ReadCallback(cls.read_from)), WireType.LEN),
+            write=WriteLengthDelimited(_write_message),
+            read=ReadStrictlyTyped(ReadLengthDelimited(ReadCallback(read_message)), WireType.LEN),
             accumulate=accumulate,
             merge=MergeMessages(accumulate),
         )
+
+
+def _read_message(message_type: type[MessageT], io: IO[bytes]) -> MessageT:
+    """Read the embedded message, looking up its `read_from()` on each call, since it may get instrumented later."""
+    return message_type.read_from(io)
+
+
+_LATE_BOUND_READS = False
+"""Whether the embedded message descriptors should look up `read_from()` on each call, set by the instrumentation."""
+
+
+def _set_late_bound_reads(enabled: bool) -> None:
+    global _LATE_BOUND_READS  # noqa: PLW0603
+    _LATE_BOUND_READS = enabled
+
+
+class _WriteMessage(Write[BaseMessage]):
+    """Write the embedded message, looking up its `write_to()` on each call, since it may get compiled later."""
+
+    __slots__ = ()
+
+    def __call__(self, message: BaseMessage, io: IO[bytes]) -> None:
+        message.write_to(io)
+
+    def size(self, message: BaseMessage) -> int:
+        return message.byte_size()
+
+    def max_size(self, message: BaseMessage) -> int:
+        return message.estimate_size()
+
+
+_write_message = _WriteMessage()
+
+
+class _LazySchema:
+    """
+    Builds the message schema on the first access and then gets replaced with the built attribute.
+
+    The building is thread-safe and only happens once per message class.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type[BaseMessage]) -> Any:
+        _ensure_schema(owner)
+        value = owner.__dict__[self.name]
+        if value is not self:
+            return value
+        # Only the building thread may get here, while the schema is not yet published.
+        try:
+            return _SCHEMAS_BUILDING[owner][self.name]
+        except KeyError:
+            raise RuntimeError(f"the schema of `{owner.__qualname__}` is accessed while it is being built") from None
+
+
+_PACKED_CHUNK_SIZE = 1024
+"""Maximum number of items in a packed record, which is written from an iterator by `write_field()`."""
+
+_SCHEMA_LOCK = RLock()
+"""Guards the schema building."""
+
+_SCHEMAS_BUILDING: dict[type[BaseMessage], dict[str, Any]] = {}
+"""
+Not yet published schema attributes of the message classes,
+whose schemas are being built by the thread holding the `_SCHEMA_LOCK`.
+"""
+
+_CLASS_HOOKS: list[Callable[[type[BaseMessage], bool], None]] = []
+"""
+Called on each message class definition, and once again after its schema gets built.
+
+The second argument tells whether the schema is available, since the hooks are called before
+the schema gets published. A hook may replace the schema attributes, which then do not get published.
+"""
+
+
+def _is_schema_built(message_type: type[BaseMessage]) -> bool:
+    return message_type.__dict__.get("__PROTOBUF_SCHEMA_BUILT__", False)  # type: ignore[no-any-return]
+
+
+def _ensure_schema(message_type: type[BaseMessage]) -> None:
+    """Build the message schema, unless it is already built, or it is being built by the current thread."""
+    if not _is_schema_built(message_type):
+        with _SCHEMA_LOCK:
+            if not _is_schema_built(message_type) and message_type not in _SCHEMAS_BUILDING:
+                _SCHEMAS_BUILDING[message_type] = {}
+                try:
+                    message_type._build_schema()
+                finally:
+                    del _SCHEMAS_BUILDING[message_type]
+
+
+def _collect_type_hints(message_type: type[BaseMessage]) -> dict[str, Any]:
+    """
+    Collect the field type hints of the message class, including those of its parent message classes.
+
+    The subclasses may redefine the parent fields, in which case the subclass' hint wins.
+    """
+    type_hints: dict[str, Any] = {}
+    for base in reversed(message_type.__mro__):
+        if base is not BaseMessage and issubclass(base, BaseMessage):
+            type_hints.update(get_annotations(base, eval_str=True))
+    return type_hints
+
+
+_SETATTR_INSTALLED: WeakSet[type[BaseMessage]] = WeakSet()
+"""Message classes with an installed specialized `__setattr__()`."""
+
+_SETTERS: WeakKeyDictionary[type[BaseMessage], Callable[[BaseMessage, str, Any], None]] = WeakKeyDictionary()
+"""Specialized attribute setters per message class, whether they're installed or not."""
+
+
+def _install_setattr(message_type: type[BaseMessage]) -> None:
+    """
+    Make the specialized setter, and install it into the class, if possible.
+
+    Classes without one-of groups don't need any special handling on the attribute assignment,
+    so they get the next setter from the MRO. Those with one-of groups get the setter,
+    which only looks after their one-of members.
+
+    Called from `_build_schema()` under `_SCHEMA_LOCK`. The setter cannot be installed
+    in `__init_subclass__()`, because frozen dataclasses forbid the class to define its own `__setattr__()`
+    at the decoration time. It is not installed either when the class overrides `__setattr__()` on its own,
+    or has subclasses, which would inherit it: then, `BaseMessage.__setattr__()` looks it up.
+    """
+    setattr_ = _SETTERS[message_type] = _make_setattr(message_type)
+    if message_type.__setattr__ is BaseMessage.__setattr__ and not message_type.__subclasses__():
+        message_type.__setattr__ = setattr_  # type: ignore[method-assign, assignment]
+        _SETATTR_INSTALLED.add(message_type)
+
+
+def _make_setattr(message_type: type[BaseMessage]) -> Callable[[BaseMessage, str, Any], None]:
+    """Make the attribute setter specialized for the message class."""
+
+    mro = message_type.__mro__
+    base_setattr = next(
+        base.__dict__["__setattr__"] for base in mro[mro.index(BaseMessage) + 1 :] if "__setattr__" in base.__dict__
+    )
+    one_of_members = {
+        name: descriptor.one_of
+        for name, descriptor in message_type.__PROTOBUF_FIELDS_BY_NAME__.items()
+        if descriptor.one_of is not None
+    }
+    if not one_of_members:
+        return cast(Callable[[BaseMessage, str, Any], None], base_setattr)
+
+    def __setattr__(self: BaseMessage, name: str, value: Any) -> None:  # noqa: N807
+        base_setattr(self, name, value)
+        try:
+            one_of = one_of_members[name]
+        except KeyError:
+            pass
+        else:
+            if value is not None:
+                one_of._keep_attribute(self, name)
+            else:
+                one_of._forget_attribute(self, name)
+
+    return __setattr__
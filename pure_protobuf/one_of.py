@@ -3,10 +3,17 @@ from __future__ import annotations
 from collections.abc import MutableMapping
 from typing import Any, Callable, Generic, Optional, TypeVar
 
-from pure_protobuf.message import BaseMessage
+from pure_protobuf.message import BaseMessage, _ensure_schema
 
 OneOfT = TypeVar("OneOfT")
 
+ONE_OF_SLOT = "__protobuf_one_of__"
+"""
+Slot, which message classes may declare to keep their one-of discriminators in.
+
+Without the slot, a message has to check each member to find the assigned one.
+"""
+
 
 class OneOf(Generic[OneOfT]):
     """
@@ -14,7 +21,7 @@ class OneOf(Generic[OneOfT]):
         - https://developers.google.com/protocol-buffers/docs/proto3#oneof.
     """
 
-    __slots__ = ("_fields",)
+    __slots__ = ("_fields", "_which_key")
 
     def __init__(self) -> None:
         """
@@ -24,23 +31,52 @@ class OneOf(Generic[OneOfT]):
         via the [`one_of`][pure_protobuf.annotations.Field.one_of] parameter.
         """
         self._fields: list[tuple[int, str]] = []
+        # Key of the discriminator in the `ONE_OF_SLOT` mapping.
+        self._which_key = str(id(self))
+
+    def __set_name__(self, owner: type[Any], name: str) -> None:  # noqa: D105
+        self._which_key = name
 
     def _add_field(self, number: int, name: str) -> None:
-        self._fields.append((number, name))
+        if (number, name) not in self._fields:
+            # The fields may get re-added by a subclass.
+            self._fields.append((number, name))
 
     def _keep_values(
         self,
         values: MutableMapping[str, Any],
-        keep_number: int,
+        which: dict[OneOf[Any], str],
+        keep_name: str,
     ) -> None:
-        for other_number, other_name in self._fields:
-            if other_number != keep_number:
-                values.pop(other_name, None)
+        """
+        Remove the previously read member from the values.
 
-    def _keep_attribute(self, message: BaseMessage, keep_number: int) -> None:
-        for other_number, other_name in self._fields:
-            if other_number != keep_number:
-                super(BaseMessage, message).__setattr__(other_name, None)
+        Args:
+            values: values being read
+            which: names of the members read so far, per one-of group
+            keep_name: name of the member that has just been read
+        """
+        other_name = which.get(self)
+        if other_name is not None and other_name != keep_name:
+            del values[other_name]
+        which[self] = keep_name
+
+    def _keep_attribute(self, message: BaseMessage, keep_name: str) -> None:
+        """Reset the previously assigned member and remember the newly assigned one."""
+        other_name = self._get_which(message)
+        if other_name is _UNKNOWN:
+            # The discriminator is not known, so the only way is to reset all the other members.
+            for _, other_name in self._fields:
+                if other_name != keep_name:
+                    super(BaseMessage, message).__setattr__(other_name, None)
+        elif other_name is not None and other_name != keep_name:
+            super(BaseMessage, message).__setattr__(other_name, None)
+        self._set_which(message, keep_name)
+
+    def _forget_attribute(self, message: BaseMessage, name: str) -> None:
+        """Forget the member, if it was the assigned one, because it has just been reset to `None`."""
+        if self._get_which(message) == name:
+            self._set_which(message, None)
 
     def __get__(self, instance: Any, type_: type[Any]) -> Optional[OneOfT]:  # noqa: D105
         if not isinstance(instance, BaseMessage):
@@ -64,8 +100,44 @@ class OneOf(Generic[OneOfT]):
 
     def _which_one_of(self, instance: BaseMessage) -> Optional[str]:
         """Return which of the attributes is actually set."""
+        name = self._get_which(instance)
+        if name is _UNKNOWN:
+            name = self._scan(instance)
+            self._set_which(instance, name)
+        return name  # type: ignore[no-any-return]
+
+    def _get_which(self, message: BaseMessage) -> Any:
+        """
+        Get the remembered name of the assigned member from the `ONE_OF_SLOT`.
+
+        Returns:
+            `_UNKNOWN`, if the message has no such slot, or the discriminator is missing or cannot be trusted.
+        """
+        which = getattr(message, ONE_OF_SLOT, None)
+        if which is None:
+            return _UNKNOWN
+        name = which.get(self._which_key, _UNKNOWN)
+        if name is not _UNKNOWN and name is not None and getattr(message, name) is None:
+            # The member has been reset bypassing the setter.
+            return _UNKNOWN
+        return name
+
+    def _set_which(self, message: BaseMessage, name: Optional[str]) -> None:
+        """Remember the name of the assigned member, if the message declares the `ONE_OF_SLOT`."""
+        if hasattr(type(message), ONE_OF_SLOT):
+            # The mapping is replaced rather than updated, since a copied message shares it.
+            which = getattr(message, ONE_OF_SLOT, None) or {}
+            object.__setattr__(message, ONE_OF_SLOT, {**which, self._which_key: name})
+
+    def _scan(self, instance: BaseMessage) -> Optional[str]:
+        """Find the assigned member by checking each of them."""
+        # The members are only known once the message schema is built.
+        _ensure_schema(type(instance))
         for _, name in self._fields:
-            value = getattr(instance, name)
-            if value is not None:
+            if getattr(instance, name) is not None:
                 return name
         return None
+
+
+_UNKNOWN: Any = object()
+"""Marks the missing discriminator."""
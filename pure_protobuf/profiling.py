@@ -0,0 +1,288 @@
+"""
+Per-field cost profiler.
+
+While profiling, the field descriptors of the message classes get wrapped by the measuring ones,
+so that the encoding and decoding time and bytes are attributed to each field.
+
+Notes:
+    - Profiling is process-wide and noticeably slows the messages down, it is meant for the offline analysis.
+    - Compiled codecs are bypassed while profiling, because they inline the fields.
+    - Costs of an embedded message field include the costs of the embedded message's own fields.
+    - Bytes are counted only for the file objects, which support `tell()`, like `BytesIO`.
+      They include the field tags.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from threading import RLock
+from time import perf_counter
+from typing import IO, Any, Callable, Optional
+
+from pure_protobuf._compiled import _CODECS_INSTALLED
+from pure_protobuf.descriptors._field import _FieldDescriptor
+from pure_protobuf.helpers._dataclasses import SLOTS
+from pure_protobuf.interfaces._repr import ReprWithInner
+from pure_protobuf.interfaces._vars import FieldT, RecordT
+from pure_protobuf.interfaces.read import ReadTyped
+from pure_protobuf.interfaces.write import Write
+from pure_protobuf.io.varint import get_unsigned_varint_size
+from pure_protobuf.io.wire_type import WireType
+from pure_protobuf.message import _CLASS_HOOKS, BaseMessage, _is_schema_built
+
+
+@dataclass(**SLOTS)
+class FieldCost:
+    """Accumulated costs of a single field."""
+
+    message_type: type[BaseMessage]
+    name: str
+    number: int
+
+    encode_calls: int = 0
+    """
+    Number of the field writes: one per encoded message, including the empty fields.
+
+    A repeated field is written by a single call, even if it is unpacked and takes a record per item.
+    """
+
+    encode_bytes: int = 0
+    encode_seconds: float = 0.0
+
+    decode_calls: int = 0
+    """
+    Number of the field records read: a packed field is a single record,
+    and an unpacked repeated field takes a record per item.
+
+    Unlike the writes, the missing fields are not read at all.
+    """
+
+    decode_bytes: int = 0
+    decode_seconds: float = 0.0
+
+    @property
+    def total_seconds(self) -> float:
+        """Total encoding and decoding time."""
+        return self.encode_seconds + self.decode_seconds
+
+    @property
+    def total_bytes(self) -> int:
+        """Total encoded and decoded bytes."""
+        return self.encode_bytes + self.decode_bytes
+
+
+@dataclass(**SLOTS)
+class Report:
+    """Field costs of the profiled message classes."""
+
+    costs: list[FieldCost] = field(default_factory=list)
+
+    def sorted(self, key: Callable[[FieldCost], Any] = lambda cost: cost.total_seconds) -> list[FieldCost]:
+        """Get the field costs, the most expensive first."""
+        return sorted(self.costs, key=key, reverse=True)
+
+    def format(self, key: Callable[[FieldCost], Any] = lambda cost: cost.total_seconds) -> str:
+        """Format the costs as a table, the most expensive fields first."""
+        header = ("field", "number", "encodes", "encode bytes", "encode ms", "decodes", "decode bytes", "decode ms")
+        rows = [header]
+        for cost in self.sorted(key):
+            rows.append(
+                (
+                    f"{cost.message_type.__qualname__}.{cost.name}",
+                    str(cost.number),
+                    str(cost.encode_calls),
+                    str(cost.encode_bytes),
+                    f"{cost.encode_seconds * 1000.0:.3f}",
+                    str(cost.decode_calls),
+                    str(cost.decode_bytes),
+                    f"{cost.decode_seconds * 1000.0:.3f}",
+                ),
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                value.ljust(width) if i == 0 else value.rjust(width)
+                for i, (value, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
+
+    def __str__(self) -> str:  # noqa: D105
+        return self.format()
+
+
+@contextmanager
+def profile(*message_types: type[BaseMessage]) -> Iterator[Report]:
+    """
+    Profile the fields within the context.
+
+    Args:
+        message_types: message classes to profile, by default – all of them,
+            including the ones, which get first used in the context
+
+    Returns:
+        Report, which gets filled in while profiling.
+    """
+    with _LOCK:
+        if _PROFILER.is_active:
+            raise RuntimeError("the profiler is already active")
+        _PROFILER.start(message_types)
+    try:
+        yield _PROFILER.report
+    finally:
+        with _LOCK:
+            _PROFILER.stop()
+
+
+class _ProfiledWrite(Write[FieldT], ReprWithInner):
+    __slots__ = ("inner", "cost")
+
+    inner: Write[FieldT]
+
+    # noinspection PyProtocol
+    def __init__(self, inner: Write[FieldT], cost: FieldCost) -> None:
+        self.inner = inner
+        self.cost = cost
+
+    def __call__(self, value: FieldT, io: IO[bytes]) -> None:
+        cost = self.cost
+        start_position = _tell(io)
+        start_time = perf_counter()
+        try:
+            self.inner(value, io)
+        finally:
+            cost.encode_seconds += perf_counter() - start_time
+            cost.encode_calls += 1
+            if start_position is not None:
+                end_position = _tell(io)
+                if end_position is not None:
+                    cost.encode_bytes += end_position - start_position
+
+    def size(self, value: FieldT) -> int:
+        return self.inner.size(value)
+
+    def max_size(self, value: FieldT) -> int:
+        return self.inner.max_size(value)
+
+
+class _ProfiledRead(ReadTyped[RecordT], ReprWithInner):
+    __slots__ = ("inner", "cost")
+
+    inner: ReadTyped[RecordT]
+
+    # noinspection PyProtocol
+    def __init__(self, inner: ReadTyped[RecordT], cost: FieldCost) -> None:
+        self.inner = inner
+        self.cost = cost
+
+    def __call__(self, io: IO[bytes], actual_wire_type: WireType) -> Iterator[RecordT]:
+        cost = self.cost
+        start_position = _tell(io)
+        start_time = perf_counter()
+        try:
+            # The values are read lazily, so they need to be consumed here to be measured.
+            values = list(self.inner(io, actual_wire_type))
+        finally:
+            cost.decode_seconds += perf_counter() - start_time
+            cost.decode_calls += 1
+            if start_position is not None:
+                end_position = _tell(io)
+                if end_position is not None:
+                    cost.decode_bytes += end_position - start_position + get_unsigned_varint_size(cost.number << 3)
+        return iter(values)
+
+
+class _Profiler:
+    __slots__ = ("is_active", "message_types", "report", "saved")
+
+    def __init__(self) -> None:
+        self.is_active = False
+        self.message_types: Optional[frozenset[type[BaseMessage]]] = None
+        self.report = Report()
+        self.saved: dict[type[BaseMessage], dict[str, Any]] = {}
+        """Original own attributes of the profiled message classes."""
+
+    def start(self, message_types: Iterable[type[BaseMessage]]) -> None:
+        self.is_active = True
+        self.message_types = frozenset(message_types) or None
+        self.report = Report()
+        self.saved = {}
+        _CLASS_HOOKS.append(self.hook)
+        if self.message_types is not None:
+            for message_type in self.message_types:
+                self.wrap(message_type)
+        else:
+            pending = BaseMessage.__subclasses__()
+            while pending:
+                message_type = pending.pop()
+                if _is_schema_built(message_type):
+                    self.wrap(message_type)
+                pending.extend(message_type.__subclasses__())
+
+    def stop(self) -> None:
+        _CLASS_HOOKS.remove(self.hook)
+        for message_type, saved in self.saved.items():
+            for name, value in saved.items():
+                if value is _MISSING:
+                    delattr(message_type, name)
+                else:
+                    setattr(message_type, name, value)
+        self.saved = {}
+        self.is_active = False
+
+    def hook(self, message_type: type[BaseMessage], is_built: bool) -> None:
+        with _LOCK:
+            if (
+                is_built
+                and self.is_active
+                and message_type not in self.saved
+                and (self.message_types is None or message_type in self.message_types)
+            ):
+                self.wrap(message_type)
+
+    def wrap(self, message_type: type[BaseMessage]) -> None:
+        # Accessing the lazy schema builds it, which calls the hook first.
+        original_fields = message_type.__PROTOBUF_FIELDS_BY_NUMBER__
+        if message_type in self.saved:
+            return
+        fields_by_number: dict[int, tuple[str, _FieldDescriptor[Any, Any]]] = {}
+        for number, (name, descriptor) in original_fields.items():
+            cost = FieldCost(message_type=message_type, name=name, number=number)
+            self.report.costs.append(cost)
+            profiled = replace(
+                descriptor,
+                write=_ProfiledWrite(descriptor.write, cost),
+                read=_ProfiledRead(descriptor.read, cost),
+            )
+            fields_by_number[number] = (name, profiled)
+
+        saved = self.saved[message_type] = {}
+        replacements: dict[str, Any] = {
+            "__PROTOBUF_FIELDS_BY_NUMBER__": fields_by_number,
+            "__PROTOBUF_FIELDS_BY_NAME__": dict(fields_by_number.values()),
+        }
+        if message_type in _CODECS_INSTALLED:
+            replacements["write_to"] = BaseMessage.write_to
+            replacements["_read_values"] = BaseMessage.__dict__["_read_values"]
+        # The schema may be not yet published, when this is called from the hook.
+        saved["__PROTOBUF_FIELDS_BY_NUMBER__"] = original_fields
+        saved["__PROTOBUF_FIELDS_BY_NAME__"] = message_type.__PROTOBUF_FIELDS_BY_NAME__
+        for name, value in replacements.items():
+            saved.setdefault(name, message_type.__dict__.get(name, _MISSING))
+            setattr(message_type, name, value)
+
+
+_PROFILER = _Profiler()
+
+_LOCK = RLock()
+
+_MISSING = object()
+
+
+def _tell(io: IO[bytes]) -> Optional[int]:
+    try:
+        return io.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
@@ -0,0 +1,67 @@
+"""
+Registry of the message types by their type URLs, used to resolve `Any_` messages.
+
+Every message class gets registered automatically under its default `import://<module>/<qualified name>` URL.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union
+from urllib.parse import ParseResult, urlparse
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+if TYPE_CHECKING:
+    from pure_protobuf.message import BaseMessage
+
+_MESSAGE_TYPES: WeakValueDictionary[ParseResult, type[BaseMessage]] = WeakValueDictionary()
+"""Registered message types by their type URLs."""
+
+_TYPE_URLS: WeakKeyDictionary[type[BaseMessage], ParseResult] = WeakKeyDictionary()
+"""Type URLs of the registered message types."""
+
+
+def register(message_type: type[BaseMessage], type_url: Union[str, ParseResult, None] = None) -> None:
+    """
+    Register the message type under the type URL.
+
+    The latest registered URL gets used to pack the message into `Any_`.
+    The default one is still resolved, though.
+
+    Args:
+        message_type: message class
+        type_url: type URL, by default: `import://<module>/<qualified name>`
+    """
+    if type_url is None:
+        type_url = ParseResult(
+            scheme="import",
+            netloc=message_type.__module__,
+            path=f"/{message_type.__qualname__}",
+            params="",
+            query="",
+            fragment="",
+        )
+    elif isinstance(type_url, str):
+        type_url = urlparse(type_url)
+    _MESSAGE_TYPES[type_url] = message_type
+    _TYPE_URLS[message_type] = type_url
+
+
+def resolve(type_url: Union[str, ParseResult]) -> Optional[type[BaseMessage]]:
+    """
+    Look up the message type by its type URL.
+
+    Returns:
+        The registered message type, or `None` if there is none.
+    """
+    if isinstance(type_url, str):
+        type_url = urlparse(type_url)
+    return _MESSAGE_TYPES.get(type_url)
+
+
+def get_type_url(message_type: type[BaseMessage]) -> ParseResult:
+    """Get the type URL of the message type, registering it under the default URL if needed."""
+    try:
+        return _TYPE_URLS[message_type]
+    except KeyError:
+        register(message_type)
+        return _TYPE_URLS[message_type]
@@ -0,0 +1,260 @@
+"""
+Deterministic random messages for the benchmarks, load, and fuzz-style tests.
+
+The generator walks the field descriptors of a message class, so the produced instances are valid
+for the actual schema, including the nested messages, maps, and one-of groups.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import IntEnum
+from random import Random
+from struct import Struct
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
+from urllib.parse import ParseResult, urlparse
+
+from typing_extensions import Self
+from typing_extensions import get_args as get_type_args
+
+from pure_protobuf.annotations import ZigZagInt, double, fixed32, fixed64, sfixed32, sfixed64, uint
+from pure_protobuf.exceptions import UnsupportedAnnotationError
+from pure_protobuf.helpers._dataclasses import KW_ONLY, SLOTS
+from pure_protobuf.helpers.datetime import EPOCH
+from pure_protobuf.interfaces._vars import MessageT
+from pure_protobuf.message import BaseMessage
+
+if TYPE_CHECKING:
+    from pure_protobuf.descriptors._field import _FieldDescriptor
+
+
+@dataclass(frozen=True, **SLOTS, **KW_ONLY)
+class SizeProfile:
+    """Controls the shape of the generated messages."""
+
+    repeated_length: tuple[int, int] = (0, 8)
+    """Inclusive bounds of the repeated field lengths and map sizes."""
+
+    string_length: tuple[int, int] = (0, 32)
+    """Inclusive bounds of the string lengths in characters."""
+
+    bytes_length: tuple[int, int] = (0, 64)
+    """Inclusive bounds of the byte string lengths."""
+
+    max_depth: int = 4
+    """
+    Maximum nesting depth of the embedded messages.
+
+    At the maximum depth, optional embedded messages are left unset, and repeated ones are left empty.
+    """
+
+    max_messages: int = 64
+    """
+    Maximum number of the embedded messages in a single top-level message.
+
+    Once exhausted, optional embedded messages are left unset, and repeated ones are left empty.
+    """
+
+    presence: float = 0.8
+    """Probability of an optional field, or a one-of group, being set."""
+
+    one_of_weights: Optional[Mapping[str, float]] = None
+    """Relative weights of the one-of members by attribute name, the members are equally likely by default."""
+
+
+SMALL = SizeProfile(repeated_length=(0, 4), string_length=(0, 16), bytes_length=(0, 16), max_depth=2, max_messages=8)
+"""Small messages, like RPC acknowledgements."""
+
+MEDIUM = SizeProfile()
+"""Medium-sized messages, like typical API payloads."""
+
+LARGE = SizeProfile(
+    repeated_length=(16, 256),
+    string_length=(16, 256),
+    bytes_length=(64, 1024),
+    max_depth=6,
+    max_messages=1024,
+)
+"""Large messages, like batch exports."""
+
+_SIZE_PROFILES = {"small": SMALL, "medium": MEDIUM, "large": LARGE}
+
+
+class Corpus(NamedTuple):
+    """Generated messages along with their serialized representations."""
+
+    messages: list[Any]
+    encoded: list[bytes]
+
+
+def generate(
+    message_type: type[MessageT],
+    seed: int = 0,
+    size_profile: Union[SizeProfile, str] = MEDIUM,
+) -> MessageT:
+    """
+    Generate a random message instance.
+
+    Args:
+        message_type: message class
+        seed: random seed, the same seed produces the same message
+        size_profile: `SizeProfile`, or one of the predefined profile names: `small`, `medium`, or `large`
+    """
+    return _Generator(Random(seed), _get_size_profile(size_profile)).top_level_message(message_type)
+
+
+def generate_corpus(
+    message_type: type[MessageT],
+    count: int,
+    seed: int = 0,
+    size_profile: Union[SizeProfile, str] = MEDIUM,
+) -> Corpus:
+    """Generate the specified number of random messages and serialize them."""
+    generator = _Generator(Random(seed), _get_size_profile(size_profile))
+    messages = [generator.top_level_message(message_type) for _ in range(count)]
+    return Corpus(messages, [bytes(message) for message in messages])
+
+
+def _get_size_profile(size_profile: Union[SizeProfile, str]) -> SizeProfile:
+    if isinstance(size_profile, SizeProfile):
+        return size_profile
+    try:
+        return _SIZE_PROFILES[size_profile]
+    except KeyError:
+        raise ValueError(f"unknown size profile `{size_profile}`") from None
+
+
+def _unsigned(bits: int) -> Callable[[Random], int]:
+    # The bit length is uniform, so that the varints of all the sizes are equally represented.
+    return lambda random: random.getrandbits(random.randint(0, bits))
+
+
+def _signed(bits: int) -> Callable[[Random], int]:
+    def generate(random: Random) -> int:
+        value = random.getrandbits(random.randint(0, bits - 1))
+        return ~value if random.getrandbits(1) else value
+
+    return generate
+
+
+_FLOAT = Struct("<f")
+
+_SCALARS: dict[Any, Callable[[Random], Any]] = {
+    bool: lambda random: bool(random.getrandbits(1)),
+    double: lambda random: random.uniform(-1e9, 1e9),
+    # Round to the nearest 32-bit float, so that the value survives the round trip.
+    float: lambda random: _FLOAT.unpack(_FLOAT.pack(random.uniform(-1e6, 1e6)))[0],
+    int: _signed(64),
+    fixed32: _unsigned(32),
+    fixed64: _unsigned(64),
+    sfixed32: _signed(32),
+    sfixed64: _signed(64),
+    uint: _unsigned(64),
+    ZigZagInt: _signed(64),
+    datetime: lambda random: EPOCH
+    + timedelta(seconds=random.randint(0, 4_102_444_800), microseconds=random.randint(0, 999_999)),
+    ParseResult: lambda random: urlparse(f"https://example.com/{random.getrandbits(32):08x}"),
+    timedelta: lambda random: timedelta(
+        seconds=random.randint(-315_360_000, 315_360_000),
+        microseconds=random.randint(0, 999_999),
+    ),
+}
+"""Scalar value factories by the type hint."""
+
+_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-.äöüßéñ€日本語"
+"""String characters, including the multibyte ones."""
+
+
+class _Generator:
+    __slots__ = ("random", "profile", "budget")
+
+    def __init__(self, random: Random, profile: SizeProfile) -> None:
+        self.random = random
+        self.profile = profile
+        self.budget = 0
+        """Number of the embedded messages, which may still be generated."""
+
+    def top_level_message(self, message_type: type[MessageT]) -> MessageT:
+        self.budget = self.profile.max_messages
+        return self.message(message_type, 0)
+
+    def message(self, message_type: type[MessageT], depth: int) -> MessageT:
+        random = self.random
+        profile = self.profile
+        values: dict[str, Any] = {}
+        one_of_members: dict[Any, list[str]] = {}
+        for name, descriptor in message_type.__PROTOBUF_FIELDS_BY_NUMBER__.values():
+            if descriptor.one_of is not None:
+                one_of_members.setdefault(descriptor.one_of, []).append(name)
+            elif descriptor.is_optional and random.random() >= profile.presence:
+                values[name] = None
+            else:
+                values[name] = self.field(descriptor, message_type, depth)
+
+        fields_by_name = message_type.__PROTOBUF_FIELDS_BY_NAME__
+        for members in one_of_members.values():
+            for name in members:
+                values[name] = None
+            if random.random() >= profile.presence:
+                continue
+            weights = profile.one_of_weights
+            if weights is not None:
+                (name,) = random.choices(members, [weights.get(name, 1.0) for name in members])
+            else:
+                name = random.choice(members)
+            values[name] = self.field(fields_by_name[name], message_type, depth)
+
+        return message_type(**values)
+
+    def field(self, descriptor: _FieldDescriptor[Any, Any], message_type: type[BaseMessage], depth: int) -> Any:
+        if descriptor.is_map:
+            key_hint, value_hint = get_type_args(descriptor.inner_hint)
+            value_hint = _resolve_self(value_hint, message_type)
+            return {self.value(key_hint, depth): self.value(value_hint, depth) for _ in self.repeat(value_hint, depth)}
+        hint = _resolve_self(descriptor.inner_hint, message_type)
+        if descriptor.is_repeated:
+            return [self.value(hint, depth) for _ in self.repeat(hint, depth)]
+        if descriptor.is_optional and self.is_exhausted(depth) and _is_message(hint):
+            return None
+        return self.value(hint, depth)
+
+    def repeat(self, hint: Any, depth: int) -> Iterator[None]:
+        """Iterate over the repeated items, while the embedded message budget lasts."""
+        is_message = _is_message(hint)
+        for _ in range(self.random.randint(*self.profile.repeated_length)):
+            if is_message and self.is_exhausted(depth):
+                return
+            yield None
+
+    def is_exhausted(self, depth: int) -> bool:
+        return depth >= self.profile.max_depth or self.budget <= 0
+
+    def value(self, hint: Any, depth: int) -> Any:
+        random = self.random
+        try:
+            scalar = _SCALARS.get(hint)
+        except TypeError:
+            # Unhashable type hint.
+            scalar = None
+        if scalar is not None:
+            return scalar(random)
+        if hint is str:
+            return "".join(random.choices(_ALPHABET, k=random.randint(*self.profile.string_length)))
+        if hint in (bytes, bytearray, memoryview):
+            return hint(random.randbytes(random.randint(*self.profile.bytes_length)))
+        if isinstance(hint, type) and issubclass(hint, IntEnum):
+            return random.choice(list(hint))
+        if _is_message(hint):
+            self.budget -= 1
+            return self.message(hint, depth + 1)
+        raise UnsupportedAnnotationError(f"cannot generate values of `{hint!r}`")
+
+
+def _resolve_self(hint: Any, message_type: type[BaseMessage]) -> Any:
+    return message_type if hint is Self else hint
+
+
+def _is_message(hint: Any) -> bool:
+    return isinstance(hint, type) and issubclass(hint, BaseMessage)
@@ -4,15 +4,16 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from io import BytesIO
 from typing import Annotated, Any, Optional, cast
 from urllib.parse import ParseResult
 
 from pure_protobuf.annotations import Field
 from pure_protobuf.helpers._dataclasses import KW_ONLY, SLOTS
-from pure_protobuf.helpers.datetime import split_seconds, unsplit_seconds
+from pure_protobuf.helpers.datetime import split_datetime, split_timedelta, unsplit_datetime, unsplit_timedelta
 from pure_protobuf.message import BaseMessage
+from pure_protobuf.registry import get_type_url, resolve
 
 
 @dataclass(**KW_ONLY, **SLOTS)
@@ -34,12 +35,12 @@ class Timestamp(_TimeSpan):
     @classmethod
     def from_datetime(cls, value: datetime) -> Timestamp:
         """Convert the `datetime` to `Timestamp`."""
-        seconds, nanos = split_seconds(value.timestamp())
+        seconds, nanos = split_datetime(value)
         return cls(seconds=seconds, nanos=nanos)
 
     def into_datetime(self) -> datetime:
         """Convert to `datetime`."""
-        return datetime.fromtimestamp(unsplit_seconds(self.seconds, self.nanos), tz=timezone.utc)
+        return unsplit_datetime(self.seconds, self.nanos)
 
 
 @dataclass(**KW_ONLY, **SLOTS)
@@ -52,12 +53,12 @@ class Duration(_TimeSpan):
     @classmethod
     def from_timedelta(cls, value: timedelta) -> Duration:
         """Convert the `timedelta` into `Duration`."""
-        seconds, nanos = split_seconds(value.total_seconds())
+        seconds, nanos = split_timedelta(value)
         return cls(seconds=seconds, nanos=nanos)
 
     def into_timedelta(self) -> timedelta:
         """Convert into `timedelta`."""
-        return timedelta(seconds=unsplit_seconds(self.seconds, self.nanos))
+        return unsplit_timedelta(self.seconds, self.nanos)
 
 
 @dataclass(**KW_ONLY, **SLOTS)
@@ -77,17 +78,7 @@ class Any_(BaseMessage):  # noqa: N801
         """Convert the message into its `Any_` representation."""
 
         # noinspection PyArgumentList
-        return cls(
-            type_url=ParseResult(
-                scheme="import",
-                netloc=message.__module__,
-                path=f"/{type(message).__qualname__}",
-                params="",
-                query="",
-                fragment="",
-            ),
-            value=bytes(message),
-        )
+        return cls(type_url=get_type_url(type(message)), value=bytes(message))
 
     def into_message(
         self,
@@ -97,6 +88,9 @@ class Any_(BaseMessage):  # noqa: N801
         """
         Reconstructs a message from the current `Any_` representation.
 
+        The message type is looked up in the [registry][pure_protobuf.registry] first.
+        Otherwise, its module gets imported.
+
         Args:
             locals_: forwarded to the `__import__` call
             globals_: forwarded to the `__import__` call
@@ -105,6 +99,10 @@ class Any_(BaseMessage):  # noqa: N801
             - https://developers.google.com/protocol-buffers/docs/proto3#any
         """
 
+        class_ = resolve(self.type_url)
+        if class_ is not None:
+            return class_.loads(self.value)
+
         module = __import__(
             self.type_url.netloc,
             fromlist=[self.type_url.path],
@@ -5,7 +5,7 @@ from pytest import mark, raises
 
 from pure_protobuf.annotations import Field, uint
 from pure_protobuf.descriptors._field import _FieldDescriptor
-from pure_protobuf.exceptions import IncorrectAnnotationError
+from pure_protobuf.exceptions import IncorrectAnnotationError, UnsupportedAnnotationError
 from pure_protobuf.io.wrappers import to_bytes
 from pure_protobuf.message import BaseMessage
 from tests import pytest_test_id
@@ -23,6 +23,10 @@ def test_from_attribute_ignored(hint: Any) -> None:
     [
         Annotated[int, Field(0)],
         Annotated[int, Field(19000)],
+        Annotated[dict[str, int], Field(1, packed=True)],
+        Annotated[int, Field(1, open_enum=True)],
+        Annotated[bytes, Field(1, intern=True)],
+        Annotated[dict[int, int], Field(1, intern=True)],
     ],
 )
 def test_from_inner_hint_incorrect(hint: Any) -> None:
@@ -30,6 +34,12 @@ def test_from_inner_hint_incorrect(hint: Any) -> None:
         _FieldDescriptor.from_attribute(BaseMessage, hint)
 
 
+@mark.parametrize("hint", [Annotated[dict[float, int], Field(1)], Annotated[dict[bytes, int], Field(1)]])
+def test_from_attribute_unsupported(hint: Any) -> None:
+    with raises(UnsupportedAnnotationError):
+        _FieldDescriptor.from_attribute(BaseMessage, hint)
+
+
 @mark.parametrize(
     ("hint", "value", "expected"),
     [
@@ -47,6 +57,8 @@ def test_from_inner_hint_incorrect(hint: Any) -> None:
         ),
         (Annotated[list[int], Field(1, packed=False)], [1, 2], b"\x08\x01\x08\x02"),
         (Annotated[int, Field(1)], -2, b"\x08\xfe\xff\xff\xff\xff\xff\xff\xff\xff\x01"),
+        (Annotated[dict[str, int], Field(1)], {"a": 1, "b": 2}, b"\x0a\x05\x0a\x01a\x10\x01\x0a\x05\x0a\x01b\x10\x02"),
+        (Annotated[Optional[dict[int, bool]], Field(2)], None, b""),
         # TODO: cyclic dependencies, https://github.com/eigenein/protobuf/issues/108.
     ],
     ids=pytest_test_id,
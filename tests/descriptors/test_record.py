@@ -4,6 +4,7 @@ from urllib.parse import ParseResult
 
 from pytest import mark, raises
 
+from pure_protobuf.annotations import fixed64, sfixed64
 from pure_protobuf.descriptors.record import (
     FLOAT_DESCRIPTOR,
     URL_DESCRIPTOR,
@@ -64,3 +65,19 @@ class TestStruct:
 def test_url(url: ParseResult, encoded: bytes) -> None:
     assert to_bytes(URL_DESCRIPTOR.write, url) == encoded
     assert next(URL_DESCRIPTOR.read(BytesIO(encoded), WireType.LEN)) == url
+
+
+@mark.parametrize(
+    ("inner_hint", "value", "encoded"),
+    [
+        (fixed64, 2**64 - 1, b"\xff\xff\xff\xff\xff\xff\xff\xff"),
+        (fixed64, 2**63, b"\x00\x00\x00\x00\x00\x00\x00\x80"),
+        (sfixed64, -1, b"\xff\xff\xff\xff\xff\xff\xff\xff"),
+        (sfixed64, -(2**63), b"\x00\x00\x00\x00\x00\x00\x00\x80"),
+        (sfixed64, 2**32, b"\x00\x00\x00\x00\x01\x00\x00\x00"),
+    ],
+)
+def test_fixed64(inner_hint: Any, value: int, encoded: bytes) -> None:
+    descriptor = RecordDescriptor._from_inner_type_hint(BaseMessage, inner_hint)
+    assert to_bytes(descriptor.write, value) == encoded
+    assert next(descriptor.read(BytesIO(encoded), WireType.I64)) == value
@@ -1,6 +1,15 @@
+from datetime import datetime, timedelta, timezone
+
 from pytest import mark
 
-from pure_protobuf.helpers.datetime import split_seconds, unsplit_seconds
+from pure_protobuf.helpers.datetime import (
+    split_datetime,
+    split_seconds,
+    split_timedelta,
+    unsplit_datetime,
+    unsplit_seconds,
+    unsplit_timedelta,
+)
 
 
 @mark.parametrize(
@@ -21,3 +30,36 @@ def test_split_seconds(total_seconds: float, seconds: int, nanos: int) -> None:
 )
 def test_unsplit_seconds(total_seconds: float, seconds: int, nanos: int) -> None:
     assert unsplit_seconds(seconds, nanos) == total_seconds
+
+
+@mark.parametrize(
+    ("value", "seconds", "nanos"),
+    [
+        (datetime(1970, 1, 1, tzinfo=timezone.utc), 0, 0),
+        (datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc), 1_700_000_000, 123_456_000),
+        (datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=timezone.utc), -1, 500_000_000),
+        (datetime(1970, 1, 1, 1, tzinfo=timezone(timedelta(hours=1))), 0, 0),
+    ],
+)
+def test_split_datetime(value: datetime, seconds: int, nanos: int) -> None:
+    assert split_datetime(value) == (seconds, nanos)
+    assert unsplit_datetime(seconds, nanos) == value
+
+
+@mark.parametrize(
+    ("value", "seconds", "nanos"),
+    [
+        (timedelta(), 0, 0),
+        (timedelta(seconds=42, microseconds=5), 42, 5000),
+        (timedelta(seconds=-42, microseconds=-5), -42, -5000),
+        (timedelta(microseconds=-1), 0, -1000),
+    ],
+)
+def test_split_timedelta(value: timedelta, seconds: int, nanos: int) -> None:
+    assert split_timedelta(value) == (seconds, nanos)
+    assert unsplit_timedelta(seconds, nanos) == value
+
+
+def test_unsplit_truncates_nanos() -> None:
+    assert unsplit_timedelta(0, 1999) == timedelta(microseconds=1)
+    assert unsplit_timedelta(0, -1999) == timedelta(microseconds=-1)
@@ -1,10 +1,10 @@
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import Any, Optional, Union
 
 from pytest import mark
 
-from pure_protobuf.helpers._typing import extract_optional, extract_repeated
+from pure_protobuf.helpers._typing import extract_mapping, extract_optional, extract_repeated
 
 
 @mark.parametrize(
@@ -31,6 +31,19 @@ def test_extract_repeated(hint: Any, expected_flag: bool, expected_inner: Any) -
     assert extract_repeated(hint) == (expected_inner, expected_flag)
 
 
+@mark.parametrize(
+    ("hint", "expected"),
+    [
+        (int, None),
+        (list[int], None),
+        (dict[str, int], (str, int)),
+        (Mapping[int, bytes], (int, bytes)),
+    ],
+)
+def test_extract_mapping(hint: Any, expected: Any) -> None:
+    assert extract_mapping(hint) == expected
+
+
 @mark.skipif(sys.version_info < (3, 10), reason="Union syntax requires Python 3.10+")
 def test_extract_optional_union_syntax() -> None:
     assert extract_optional(int | None) == (int, True)  # type: ignore
@@ -1,7 +1,10 @@
+from io import BytesIO
+from sys import intern
+
 from pytest import mark
 from pytest_benchmark.fixture import BenchmarkFixture
 
-from pure_protobuf.io.bytes_ import read_bytes, read_string, write_bytes, write_string
+from pure_protobuf.io.bytes_ import ReadInternedString, read_bytes, read_string, write_bytes, write_string
 from pure_protobuf.io.wrappers import to_bytes
 
 BYTES_CASES = [
@@ -16,6 +19,11 @@ def test_write_bytes(value: bytes, bytes_: bytes, benchmark: BenchmarkFixture) -
     assert benchmark(to_bytes, write_bytes, value) == bytes_
 
 
+@mark.parametrize(("value", "bytes_"), BYTES_CASES)
+def test_bytes_size(value: bytes, bytes_: bytes) -> None:
+    assert write_bytes.size(value) == len(bytes_)
+
+
 @mark.parametrize(("value", "bytes_"), BYTES_CASES)
 def test_read_bytes(value: bytes, bytes_: bytes, benchmark: BenchmarkFixture, bytes_io) -> None:  # noqa: ANN001
     assert benchmark.pedantic(read_bytes, setup=bytes_io(bytes_)) == value
@@ -26,6 +34,12 @@ STRING_CASES = [
 ]
 
 
+@mark.parametrize(("value", "bytes_"), [*STRING_CASES, ("testing", b"\x07testing")])
+def test_string_size(value: str, bytes_: bytes) -> None:
+    assert write_string.size(value) == len(bytes_)
+    assert write_string.max_size(value) >= len(bytes_)
+
+
 @mark.parametrize(("value", "bytes_"), STRING_CASES)
 def test_write_string(value: str, bytes_: bytes, benchmark: BenchmarkFixture) -> None:  # noqa: ANN001
     assert benchmark(to_bytes, write_string, value) == bytes_
@@ -34,3 +48,23 @@ def test_write_string(value: str, bytes_: bytes, benchmark: BenchmarkFixture) ->
 @mark.parametrize(("value", "bytes_"), STRING_CASES)
 def test_read_string(value: str, bytes_: bytes, benchmark: BenchmarkFixture, bytes_io) -> None:  # noqa: ANN001
     assert benchmark.pedantic(read_string, setup=bytes_io(bytes_)) == value
+
+
+def test_read_interned_string() -> None:
+    # Already interned, but by another object.
+    interned = intern("".join(("region", "-1")))
+
+    read = ReadInternedString(maxsize=2)
+    io = BytesIO(b"\x08region-1\x08region-2\x08region-1\x08region-3\x08region-2")
+    first_1 = read(io)
+    first_2 = read(io)
+    second_1 = read(io)
+    assert first_1 == "region-1"
+    assert first_1 is second_1
+    assert first_1 is not interned
+
+    # `region-2` is the least recently used, so it gets evicted.
+    assert read(io) == "region-3"
+    second_2 = read(io)
+    assert second_2 == first_2
+    assert second_2 is not first_2
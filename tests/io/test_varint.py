@@ -32,6 +32,11 @@ def test_write_unsigned_varint(value: int, bytes_: bytes, benchmark: BenchmarkFi
     assert benchmark(to_bytes, write_unsigned_varint, value) == bytes_
 
 
+@mark.parametrize(("value", "bytes_"), UVARINT_CASES, ids=pytest_test_id)
+def test_unsigned_varint_size(value: int, bytes_: bytes) -> None:
+    assert write_unsigned_varint.size(value) == len(bytes_)
+
+
 @mark.parametrize(("value", "bytes_"), UVARINT_CASES, ids=pytest_test_id)
 def test_read_unsigned_varint(value: int, bytes_: bytes, benchmark: BenchmarkFixture, bytes_io) -> None:  # noqa: ANN001
     assert benchmark.pedantic(read_unsigned_varint, setup=bytes_io(bytes_)) == value
@@ -50,6 +55,11 @@ def test_write_zigzag_varint(value: int, bytes_: bytes, benchmark: BenchmarkFixt
     assert benchmark(to_bytes, WriteZigZagVarint(), value) == bytes_
 
 
+@mark.parametrize(("value", "bytes_"), SIGNED_VARINT_TESTS, ids=pytest_test_id)
+def test_zigzag_varint_size(value: int, bytes_: bytes) -> None:
+    assert WriteZigZagVarint().size(value) == len(bytes_)
+
+
 @mark.parametrize(("value", "bytes_"), SIGNED_VARINT_TESTS, ids=pytest_test_id)
 def test_read_zigzag_varint(
     value: int,
@@ -71,6 +81,13 @@ def test_write_twos_compliment_varint(value: int, bytes_: bytes, benchmark: Benc
     assert benchmark(to_bytes, WriteTwosComplimentVarint(), value) == bytes_
 
 
+@mark.parametrize(("value", "bytes_"), TWOS_COMPLIMENT_TESTS, ids=pytest_test_id)
+def test_twos_compliment_varint_size(value: int, bytes_: bytes) -> None:
+    write = WriteTwosComplimentVarint()
+    assert write.size(value) == len(bytes_)
+    assert write.max_size(value) >= len(bytes_)
+
+
 @mark.parametrize(("value", "bytes_"), TWOS_COMPLIMENT_TESTS, ids=pytest_test_id)
 def test_read_twos_compliment_varint(
     value: int,
@@ -98,6 +115,46 @@ def test_read_enum_error(bytes_: bytes) -> None:
         next(ReadEnum(ExampleEnum)(BytesIO(bytes_)))
 
 
+@mark.parametrize(
+    ("value", "bytes_"),
+    [
+        *ENUM_CASES,
+        (3, b"\x03"),
+        (-1, b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01"),
+    ],
+)
+def test_read_open_enum(value: int, bytes_: bytes) -> None:
+    assert next(ReadEnum(ExampleEnum, open_=True)(BytesIO(bytes_))) == value
+
+
+def test_read_enum_missing() -> None:
+    class Enum(IntEnum):
+        FOO = 1
+
+        @classmethod
+        def _missing_(cls, value: object) -> "Enum":
+            return cls.FOO
+
+    assert next(ReadEnum(Enum)(BytesIO(b"\x02"))) is Enum.FOO
+
+
+class NegativeEnum(IntEnum):
+    MINUS_ONE = -1
+
+
+def test_read_negative_enum() -> None:
+    assert next(ReadEnum(NegativeEnum)(BytesIO(b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01"))) is NegativeEnum.MINUS_ONE
+
+
 @mark.parametrize(("value", "bytes_"), ENUM_CASES)
 def test_write_enum(value: ExampleEnum, bytes_: bytes) -> None:
     assert to_bytes(WriteEnum[ExampleEnum](), value) == bytes_
+
+
+def test_write_negative_enum() -> None:
+    assert to_bytes(WriteEnum[NegativeEnum](), NegativeEnum.MINUS_ONE) == b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01"
+
+
+def test_enum_size() -> None:
+    assert WriteEnum[ExampleEnum]().size(ExampleEnum.FOO) == 1
+    assert WriteEnum[NegativeEnum]().size(NegativeEnum.MINUS_ONE) == 10
@@ -0,0 +1,106 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Optional
+
+from pydantic import BaseModel
+from pytest import importorskip, mark, raises
+
+from pure_protobuf.annotations import Field, double, uint
+from pure_protobuf.exceptions import IncorrectValueError
+from pure_protobuf.message import BaseMessage
+
+
+@dataclass
+class Message(BaseMessage):
+    a: Annotated[int, Field(1)] = 0
+    b: Annotated[Optional[str], Field(2)] = None
+    c: Annotated[list[uint], Field(3)] = field(default_factory=list)
+    d: Annotated[double, Field(4)] = double(0.0)
+    e: Annotated[dict[str, int], Field(5)] = field(default_factory=dict)
+
+
+FRAMES = [
+    bytes(Message(a=1, b="foo", c=[uint(1), uint(2)], d=double(1.5))),
+    bytes(Message(a=-5)),
+    b"",
+]
+
+
+def test_decode_columns() -> None:
+    assert Message.decode_columns(FRAMES) == {
+        "a": array("q", [1, -5, 0]),
+        "b": ["foo", None, None],
+        "c": [[1, 2], [], []],
+        "d": array("d", [1.5, 0.0, 0.0]),
+        "e": [{}, {}, {}],
+    }
+
+
+def test_decode_columns_defaults() -> None:
+    @dataclass
+    class WithDefaults(BaseMessage):
+        a: Annotated[int, Field(1)] = 42
+        b: Annotated[str, Field(2)] = "foo"
+        c: Annotated[list[int], Field(3)] = field(default_factory=lambda: [1])
+        d: Annotated[bool, Field(4)] = True
+
+    columns = WithDefaults.decode_columns([b"\x08\x01\x20\x00", b""])
+    assert columns == {
+        "a": array("q", [1, 42]),
+        "b": ["foo", "foo"],
+        "c": [[1], [1]],
+        "d": [False, True],
+    }
+    assert all(isinstance(value, bool) for value in columns["d"])
+    # Each missing value gets its own instance from the default factory.
+    assert columns["c"][0] is not columns["c"][1]
+
+
+def test_decode_columns_pydantic_defaults() -> None:
+    class Model(BaseMessage, BaseModel):
+        a: Annotated[int, Field(1)] = 42
+        b: Annotated[bool, Field(2)] = True
+
+    assert Model.decode_columns([b"\x08\x01", b"\x10\x00"]) == {"a": array("q", [1, 42]), "b": [True, False]}
+
+
+def test_decode_columns_empty() -> None:
+    assert Message.decode_columns([]) == {"a": array("q"), "b": [], "c": [], "d": array("d"), "e": []}
+
+
+def test_decode_columns_numpy() -> None:
+    numpy = importorskip("numpy")
+    columns: dict[str, Any] = Message.decode_columns(FRAMES, numpy=True)
+    assert columns["a"].dtype == numpy.int64
+    assert columns["a"].tolist() == [1, -5, 0]
+    assert columns["b"] == ["foo", None, None]
+
+
+def test_encode_columns() -> None:
+    columns = Message.decode_columns(FRAMES)
+    assert Message.encode_columns(columns) == [
+        bytes(Message(a=1, b="foo", c=[uint(1), uint(2)], d=double(1.5))),
+        bytes(Message(a=-5)),
+        bytes(Message()),
+    ]
+
+
+def test_encode_columns_missing_column() -> None:
+    assert Message.encode_columns({"b": ["foo", None]}) == [b"\x12\x03foo", b""]
+
+
+def test_encode_columns_numpy() -> None:
+    numpy = importorskip("numpy")
+    assert Message.encode_columns({"a": numpy.array([1, 150])}) == [b"\x08\x01", b"\x08\x96\x01"]
+
+
+@mark.parametrize(
+    "columns",
+    [
+        {"unknown": [1]},
+        {"a": [1, 2], "b": ["foo"]},
+    ],
+)
+def test_encode_columns_incorrect(columns: dict[str, list[Any]]) -> None:
+    with raises(IncorrectValueError):
+        Message.encode_columns(columns)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Annotated, Optional
 
+from pytest import raises
+
 from pure_protobuf.annotations import Field, ZigZagInt, uint
 from pure_protobuf.message import BaseMessage
 from pure_protobuf.one_of import OneOf
@@ -277,3 +279,107 @@ def test_one_of_merged() -> None:
     assert message.child.bar == 2
     assert message.child.foo is None
     assert message.child.which_foo_or_bar() == "bar"
+
+
+def test_map() -> None:
+    @dataclass
+    class Child(BaseMessage):
+        payload: Annotated[int, Field(1)] = 0
+
+    @dataclass
+    class Message(BaseMessage):
+        labels: Annotated[dict[str, uint], Field(1)] = field(default_factory=dict)
+        children: Annotated[dict[ZigZagInt, Child], Field(2)] = field(default_factory=dict)
+
+    message = Message(labels={"foo": uint(1), "bar": uint(2)}, children={ZigZagInt(-1): Child(payload=42)})
+    encoded = bytes(message)
+    assert encoded == bytes.fromhex("0a07 0a03666f6f 1001 0a07 0a03626172 1002 1206 0801 1202082a")
+    assert Message.loads(encoded) == message
+
+
+def test_map_last_key_wins() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        labels: Annotated[dict[str, int], Field(1)] = field(default_factory=dict)
+
+    # fmt: off
+    assert Message.loads(
+        b"\x0a\x05\x0a\x01a\x10\x01"  # a: 1
+        b"\x0a\x05\x0a\x01b\x10\x02"  # b: 2
+        b"\x0a\x05\x0a\x01a\x10\x03",  # a: 3
+    ) == Message(labels={"a": 3, "b": 2})
+    # fmt: on
+
+
+def test_map_entry_missing_key_or_value() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        labels: Annotated[dict[str, int], Field(1)] = field(default_factory=dict)
+
+    # fmt: off
+    assert Message.loads(
+        b"\x0a\x02\x10\x01"  # "": 1
+        b"\x0a\x03\x0a\x01a",  # a: 0
+    ) == Message(labels={"": 1, "a": 0})
+    # fmt: on
+
+
+def test_loads_dict_and_tuple() -> None:
+    @dataclass
+    class Child(BaseMessage):
+        payload: Annotated[int, Field(1)] = 0
+
+    @dataclass
+    class Message(BaseMessage):
+        b: Annotated[Optional[str], Field(2)] = None
+        a: Annotated[int, Field(1)] = 0
+        c: Annotated[Optional[Child], Field(3)] = None
+        d: Annotated[list[int], Field(4)] = field(default_factory=list)
+
+    encoded = b"\x08\x96\x01\x1a\x02\x08\x2a"
+    assert Message.loads(encoded) == Message(a=150, c=Child(payload=42))
+    assert list(Message.loads_dict(encoded).items()) == [("b", None), ("a", 150), ("c", Child(payload=42)), ("d", [])]
+    assert Message.loads_tuple(encoded) == (150, None, Child(payload=42), [])
+
+
+def test_write_declaration_order() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        b: Annotated[int, Field(2)] = 0
+        a: Annotated[int, Field(1)] = 0
+
+    assert bytes(Message(a=1, b=2)) == b"\x10\x02\x08\x01"
+
+
+def test_trusted() -> None:
+    @dataclass(frozen=True)
+    class Message(BaseMessage):
+        __PROTOBUF_TRUSTED__ = True
+
+        foo_or_bar = OneOf[Optional[int]]()
+
+        foo: Annotated[Optional[int], Field(1, one_of=foo_or_bar)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=foo_or_bar)] = 42
+        qux: Annotated[list[int], Field(3)] = field(default_factory=list)
+
+        def __post_init__(self) -> None:
+            raise AssertionError("`__post_init__()` must not be called")
+
+    message = Message.loads(b"\x08\x01\x1a\x01\x02")
+    assert message.foo == 1
+    assert message.bar is None
+    assert message.qux == [2]
+
+    # Default factory must be called for each message.
+    assert Message.loads(b"").qux is not Message.loads(b"").qux
+
+
+def test_trusted_missing_value() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        __PROTOBUF_TRUSTED__ = True
+
+        foo: Annotated[int, Field(1)]
+
+    with raises(TypeError):
+        Message.loads(b"")
@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Annotated, Any
+
+from pytest import raises
+
+from pure_protobuf.annotations import Field
+from pure_protobuf.exceptions import IncorrectValueError
+from pure_protobuf.message import BaseMessage
+
+
+@dataclass
+class Item(BaseMessage):
+    name: Annotated[str, Field(1)] = ""
+
+
+@dataclass
+class Snapshot(BaseMessage):
+    version: Annotated[int, Field(1)] = 0
+    items: Annotated[list[Item], Field(2)] = field(default_factory=list)
+    values: Annotated[list[int], Field(3)] = field(default_factory=list)
+    labels: Annotated[dict[str, int], Field(4)] = field(default_factory=dict)
+
+
+SNAPSHOT = Snapshot(version=7, items=[Item(name="a"), Item(name="b")], values=[1, 2, 3], labels={"x": 1})
+
+
+def test_iter_field_lazily() -> None:
+    io = BytesIO(bytes(SNAPSHOT) + b"\x28\x01")  # with an unknown field
+    items = Snapshot.iter_field(io, "items")
+    assert next(items) == Item(name="a")
+    position = io.tell()
+    assert position < len(io.getvalue())
+    assert next(items) == Item(name="b")
+    assert io.tell() > position
+    assert list(items) == []
+
+
+def test_iter_field_others() -> None:
+    others: dict[str, Any] = {}
+    assert list(Snapshot.iter_field(BytesIO(bytes(SNAPSHOT)), "values", others)) == [1, 2, 3]
+    assert others == {"version": 7, "items": SNAPSHOT.items, "labels": {"x": 1}}
+
+
+def test_iter_map_field() -> None:
+    assert list(Snapshot.iter_field(BytesIO(bytes(SNAPSHOT)), "labels")) == [("x", 1)]
+
+
+def test_iter_field_incorrect() -> None:
+    with raises(IncorrectValueError):
+        Snapshot.iter_field(BytesIO(), "version")
+    with raises(IncorrectValueError):
+        Snapshot.iter_field(BytesIO(), "missing")
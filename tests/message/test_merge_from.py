@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Annotated, ClassVar, Optional
+
+from pytest import raises
+
+from pure_protobuf.annotations import Field
+from pure_protobuf.message import BaseMessage
+from pure_protobuf.one_of import OneOf
+
+
+@dataclass
+class Child(BaseMessage):
+    a: Annotated[int, Field(1)] = 0
+    b: Annotated[Optional[str], Field(2)] = None
+
+
+@dataclass
+class Message(BaseMessage):
+    payload: ClassVar[OneOf] = OneOf()
+
+    number: Annotated[Optional[int], Field(1)] = None
+    values: Annotated[list[int], Field(2)] = field(default_factory=list)
+    labels: Annotated[dict[str, int], Field(3)] = field(default_factory=dict)
+    child: Annotated[Optional[Child], Field(4)] = None
+    foo: Annotated[Optional[int], Field(5, one_of=payload)] = None
+    bar: Annotated[Optional[int], Field(6, one_of=payload)] = None
+
+
+def test_merge_from() -> None:
+    values = [1]
+    child = Child(a=1, b="x")
+    message = Message(number=1, values=values, labels={"x": 1}, child=child, foo=1)
+
+    message.merge_from(bytes(Message(values=[2], labels={"y": 2}, child=Child(a=2, b="y"), bar=2)))
+
+    assert message == Message(number=1, values=[1, 2], labels={"x": 1, "y": 2}, child=Child(a=2, b="y"), bar=2)
+    assert message.foo is None
+    assert message.values is values
+    assert message.child is child
+
+
+def test_merge_from_keeps_absent_fields() -> None:
+    message = Message(number=1)
+    message.merge_from(b"")
+    assert message == Message(number=1)
+
+
+def test_read_into() -> None:
+    scratch = Message()
+    assert Message.read_into(scratch, BytesIO(b"\x08\x05")) is scratch
+    assert scratch.number == 5
+
+
+def test_read_into_wrong_type() -> None:
+    with raises(TypeError):
+        Message.read_into(Child(), BytesIO(b""))  # type: ignore[arg-type]
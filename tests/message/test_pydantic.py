@@ -1,7 +1,7 @@
 from io import BytesIO
 from typing import Annotated, ClassVar, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 from pure_protobuf.annotations import Field, ZigZagInt
 from pure_protobuf.message import BaseMessage
@@ -69,3 +69,49 @@ def test_one_of_merged() -> None:
     assert message.child.bar == 2
     assert message.child.foo is None
     assert message.child.which_foo_or_bar() == "bar"
+
+
+def test_trusted() -> None:
+    class Message(BaseMessage, BaseModel):
+        __PROTOBUF_TRUSTED__ = True
+
+        foo_or_bar: ClassVar[OneOf] = OneOf()
+
+        foo: Annotated[Optional[int], Field(1, one_of=foo_or_bar)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=foo_or_bar)] = 42
+        qux: Annotated[list[int], Field(3)] = []
+
+        @field_validator("qux")
+        @classmethod
+        def validate_qux(cls, value: list[int]) -> list[int]:
+            raise AssertionError("validator must not be called")
+
+    message = Message.loads(b"\x08\x01")
+    assert message.foo == 1
+    assert message.bar is None
+    assert message.qux == []
+
+
+def test_loads_dict_defaults() -> None:
+    class Message(BaseMessage, BaseModel):
+        a: Annotated[int, Field(1)] = 0
+        b: Annotated[str, Field(2)] = "default"
+        c: Annotated[list[int], Field(3)] = []
+
+    assert Message.loads_dict(b"\x08\x01") == {"a": 1, "b": "default", "c": []}
+
+
+def test_one_of_model_copy() -> None:
+    class Message(BaseMessage, BaseModel):
+        foo_or_bar: ClassVar[OneOf] = OneOf()
+        which_foo_or_bar: ClassVar = foo_or_bar.which_one_of_getter()
+
+        foo: Annotated[Optional[int], Field(1, one_of=foo_or_bar)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=foo_or_bar)] = None
+
+    message = Message(foo=5)
+    assert message.which_foo_or_bar() == "foo"
+
+    copied = message.model_copy(update={"foo": None, "bar": 2})
+    assert copied.which_foo_or_bar() == "bar"
+    assert copied.foo_or_bar == 2
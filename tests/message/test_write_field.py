@@ -0,0 +1,61 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Annotated
+
+from pytest import raises
+
+from pure_protobuf.annotations import Field
+from pure_protobuf.exceptions import IncorrectValueError
+from pure_protobuf.message import BaseMessage
+
+
+@dataclass
+class Item(BaseMessage):
+    name: Annotated[str, Field(1)] = ""
+
+
+@dataclass
+class Snapshot(BaseMessage):
+    version: Annotated[int, Field(1)] = 0
+    items: Annotated[list[Item], Field(2)] = field(default_factory=list)
+    values: Annotated[list[int], Field(3)] = field(default_factory=list)
+
+
+def test_write_field_streams_unpacked() -> None:
+    io = BytesIO()
+    positions = []
+
+    def generate_items() -> Iterator[Item]:
+        for i in range(3):
+            positions.append(io.tell())
+            yield Item(name=str(i))
+
+    Snapshot.write_field(io, "version", 1)
+    Snapshot.write_field(io, "items", generate_items())
+    Snapshot.write_field(io, "values", [])
+
+    # Each item has been written before the next one is produced.
+    assert positions == [2, 7, 12]
+    expected = Snapshot(version=1, items=[Item(name="0"), Item(name="1"), Item(name="2")])
+    assert io.getvalue() == bytes(expected)
+
+
+def test_write_field_packed_iterator() -> None:
+    io = BytesIO()
+    Snapshot.write_field(io, "values", iter(range(2500)))
+    assert io.getvalue().count(b"\x1a") >= 3
+    assert Snapshot.loads(io.getvalue()) == Snapshot(values=list(range(2500)))
+
+
+def test_write_field_packed_list() -> None:
+    io = BytesIO()
+    Snapshot.write_field(io, "version", 0)
+    Snapshot.write_field(io, "items", [])
+    Snapshot.write_field(io, "values", [1, 2, 3])
+    assert io.getvalue() == bytes(Snapshot(values=[1, 2, 3]))
+
+
+def test_write_field_unknown() -> None:
+    with raises(IncorrectValueError):
+        Snapshot.write_field(BytesIO(), "missing", 1)
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from typing import IO, Annotated
+
+from pytest import raises
+
+from pure_protobuf.annotations import Field
+from pure_protobuf.batch import BatchWriter, read_frame
+from pure_protobuf.exceptions import IncorrectValueError, MessageTooLargeError
+from pure_protobuf.message import BaseMessage
+
+
+@dataclass
+class Message(BaseMessage):
+    payload: Annotated[bytes, Field(1)] = b""
+
+
+def test_batch_writer() -> None:
+    frames: list[bytes] = []
+    messages = [Message(payload=bytes(size)) for size in (1, 2, 3, 4, 5)]
+
+    # Delimited sizes are 4, 5, 6, 7, and 8 bytes.
+    with BatchWriter(12, frames.append) as writer:
+        for message in messages:
+            writer.write(message)
+        assert (writer.count, writer.size) == (1, 8)
+
+    assert [len(frame) for frame in frames] == [9, 6, 7, 8]
+    assert [message for frame in frames for message in read_frame(Message, frame)] == messages
+
+
+def test_exact_fit() -> None:
+    frames: list[bytes] = []
+    with BatchWriter(8, frames.append) as writer:
+        writer.write(Message(payload=b"\x00" * 5))
+        writer.write(Message(payload=b""))
+    assert frames == [b"\x07\x0a\x05\x00\x00\x00\x00\x00", b"\x02\x0a\x00"]
+
+
+def test_oversized_raises() -> None:
+    frames: list[bytes] = []
+    writer = BatchWriter(8, frames.append)
+    writer.write(Message(payload=b""))
+    with raises(MessageTooLargeError):
+        writer.write(Message(payload=b"\x00" * 6))
+    writer.flush()
+    assert frames == [b"\x02\x0a\x00"]
+
+
+def test_oversized_callback() -> None:
+    oversized: list[tuple[BaseMessage, int]] = []
+    frames: list[bytes] = []
+    message = Message(payload=b"\x00" * 6)
+    with BatchWriter(8, frames.append, on_oversized=lambda message, size: oversized.append((message, size))) as writer:
+        writer.write(message)
+    assert oversized == [(message, 9)]
+    assert frames == []
+
+
+def test_no_flush_on_error() -> None:
+    frames: list[bytes] = []
+
+    def write_and_fail() -> None:
+        with BatchWriter(8, frames.append) as writer:
+            writer.write(Message())
+            raise RuntimeError
+
+    with raises(RuntimeError):
+        write_and_fail()
+    assert frames == []
+
+
+def test_rollback_on_error() -> None:
+    @dataclass
+    class Failing(BaseMessage):
+        payload: Annotated[bytes, Field(1)] = b""
+
+        def write_to(self, io: IO[bytes]) -> None:
+            io.write(b"\xff")
+            raise RuntimeError
+
+    frames: list[bytes] = []
+    writer = BatchWriter(16, frames.append)
+    writer.write(Message(payload=b""))
+    with raises(RuntimeError):
+        writer.write(Failing(payload=b"\x00"))
+    assert (writer.count, writer.size) == (1, 3)
+    writer.write(Message(payload=b"\x01"))
+    writer.flush()
+    assert frames == [b"\x02\x0a\x00\x03\x0a\x01\x01"]
+
+
+def test_rollback_on_size_mismatch() -> None:
+    @dataclass
+    class Mispredicted(BaseMessage):
+        payload: Annotated[bytes, Field(1)] = b""
+
+        def byte_size(self) -> int:
+            return super().byte_size() + 1
+
+    frames: list[bytes] = []
+    writer = BatchWriter(16, frames.append)
+    writer.write(Message(payload=b""))
+    with raises(IncorrectValueError):
+        writer.write(Mispredicted(payload=b"\x00"))
+    assert (writer.count, writer.size) == (1, 3)
+    writer.flush()
+    assert frames == [b"\x02\x0a\x00"]
+
+
+def test_retry_flush() -> None:
+    frames: list[bytes] = []
+
+    def flush_callback(frame: bytes) -> None:
+        if not frames:
+            frames.append(b"")
+            raise RuntimeError
+        frames.append(frame)
+
+    writer = BatchWriter(16, flush_callback)
+    writer.write(Message(payload=b""))
+    with raises(RuntimeError):
+        writer.flush()
+    assert (writer.count, writer.size) == (1, 3)
+    writer.flush()
+    assert frames == [b"", b"\x02\x0a\x00"]
+    assert (writer.count, writer.size) == (0, 0)
@@ -0,0 +1,147 @@
+import sys
+from collections.abc import Iterator
+from importlib import import_module
+from pathlib import Path
+from textwrap import dedent
+from types import ModuleType
+
+from pytest import fixture, warns
+
+from pure_protobuf.compile import generate, main
+from pure_protobuf.message import BaseMessage
+
+_SOURCE = dedent(
+    """
+    from dataclasses import dataclass, field
+    from enum import IntEnum
+    from typing import Annotated, ClassVar, Optional
+
+    from pure_protobuf.annotations import Field, ZigZagInt, double, fixed64, sfixed64, uint
+    from pure_protobuf.message import BaseMessage
+    from pure_protobuf.one_of import OneOf
+
+    __protobuf_codecs__ = "._codecs"
+
+
+    class Color(IntEnum):
+        RED = 1
+        GREEN = 2
+
+
+    @dataclass
+    class Inner(BaseMessage):
+        x: Annotated[int, Field(1)] = 0
+
+
+    @dataclass
+    class Outer(BaseMessage):
+        payload: ClassVar[OneOf] = OneOf()
+
+        a: Annotated[int, Field(1)] = 0
+        b: Annotated[str, Field(2)] = ""
+        c: Annotated[Optional[Inner], Field(3)] = None
+        d: Annotated[list[int], Field(4)] = field(default_factory=list)
+        e: Annotated[Optional[int], Field(5, one_of=payload)] = None
+        f: Annotated[Optional[str], Field(6, one_of=payload)] = None
+        g: Annotated[double, Field(7)] = 0.0
+        h: Annotated[sfixed64, Field(8)] = 0
+        i: Annotated[ZigZagInt, Field(9)] = 0
+        j: Annotated[Color, Field(10)] = Color.RED
+        k: Annotated[Optional[bytes], Field(11)] = None
+        l: Annotated[fixed64, Field(12)] = 0
+        m: Annotated[uint, Field(13)] = 0
+        n: Annotated[bool, Field(14)] = False
+    """,
+)
+
+
+@fixture
+def package(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "compiled_messages"
+    path.mkdir()
+    (path / "__init__.py").touch()
+    (path / "messages.py").write_text(_SOURCE)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield path
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in list(sys.modules):
+            if name.split(".")[0] == "compiled_messages":
+                del sys.modules[name]
+
+
+def _reimport() -> ModuleType:
+    sys.modules.pop("compiled_messages._codecs", None)
+    sys.modules.pop("compiled_messages.messages", None)
+    return import_module("compiled_messages.messages")
+
+
+def test_generic_without_codecs(package: Path) -> None:
+    messages = _reimport()
+    assert messages.Outer.loads(bytes(messages.Outer(a=1))) == messages.Outer(a=1)
+    assert messages.Outer.write_to is BaseMessage.write_to
+
+
+def test_compiled_codec(package: Path) -> None:
+    main(["compiled_messages.messages", "-o", str(package / "_codecs.py")])
+    messages = _reimport()
+
+    message = messages.Outer(
+        a=-5,
+        b="hello",
+        c=messages.Inner(x=3),
+        d=[1, 2],
+        f="world",
+        g=1.5,
+        h=-7,
+        i=-3,
+        j=messages.Color.GREEN,
+        k=b"bytes",
+        l=2**64 - 1,
+        m=300,
+        n=True,
+    )
+    # The reference encoding comes from the generic codec, which is installed before the first use.
+    expected = bytes(message)
+    assert messages.Outer.write_to is not BaseMessage.write_to
+
+    assert bytes(message) == expected
+    assert messages.Outer.loads(expected) == message
+    assert messages.Outer.loads(expected + bytes(messages.Outer(e=42))).e == 42
+    assert messages.Outer.loads(expected + bytes(messages.Outer(e=42))).f is None
+
+
+def test_stale_codec(package: Path) -> None:
+    main(["compiled_messages.messages", "-o", str(package / "_codecs.py")])
+    (package / "messages.py").write_text(_SOURCE.replace("a: Annotated[int, Field(1)]", "a: Annotated[uint, Field(1)]"))
+    messages = _reimport()
+    with warns(RuntimeWarning, match="out of date"):
+        assert bytes(messages.Inner(x=1)) == b"\x08\x01"
+        assert messages.Outer.loads(bytes(messages.Outer(a=1))) == messages.Outer(a=1)
+    assert messages.Outer.write_to is BaseMessage.write_to
+
+
+def test_subclass_resets_inherited_codec(package: Path) -> None:
+    main(["compiled_messages.messages", "-o", str(package / "_codecs.py")])
+    messages = _reimport()
+    assert bytes(messages.Inner(x=1)) == b"\x08\x01"
+
+    from dataclasses import dataclass
+    from typing import Annotated
+
+    from pure_protobuf.annotations import Field
+
+    @dataclass
+    class Derived(messages.Inner):  # type: ignore[name-defined]
+        y: Annotated[int, Field(2)] = 0
+
+    assert bytes(Derived(x=1, y=2)) == b"\x08\x01\x10\x02"
+    assert Derived.loads(b"\x08\x01\x10\x02") == Derived(x=1, y=2)
+
+
+def test_generate_lists_message_types(package: Path) -> None:
+    source = generate("compiled_messages.messages")
+    assert "def _compile_Inner(message_type):" in source
+    assert "def _compile_Outer(message_type):" in source
+    assert "Color" not in source
@@ -0,0 +1,198 @@
+import sys
+from collections.abc import Iterator
+from importlib import import_module
+from pathlib import Path
+from textwrap import dedent
+
+from pytest import fixture, mark, raises
+
+from pure_protobuf._proto import parse
+from pure_protobuf.exceptions import IncorrectProtoError
+from pure_protobuf.generate import main
+
+
+@fixture
+def tmp_sys_path(tmp_path: Path) -> Iterator[Path]:
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield tmp_path
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in list(sys.modules):
+            if name.split(".")[0] == "generated":
+                del sys.modules[name]
+
+
+def test_generate(tmp_sys_path: Path) -> None:
+    protos = tmp_sys_path / "protos" / "generated"
+    protos.mkdir(parents=True)
+    (protos / "common.proto").write_text(
+        dedent(
+            """
+            syntax = "proto3";
+            package generated.common;
+
+            enum Status {
+              STATUS_UNKNOWN = 0;
+              STATUS_OK = 1;
+            }
+            """,
+        ),
+    )
+    (protos / "messages.proto").write_text(
+        dedent(
+            """
+            // Comment.
+            syntax = "proto3";
+            package generated.messages;
+
+            import "google/protobuf/timestamp.proto";
+            import "generated/common.proto";
+
+            option java_package = "com.example";
+
+            message Order {
+              enum Kind {
+                KIND_UNSPECIFIED = 0;
+                KIND_SELL = -1;
+              }
+              message Line {
+                string sku = 1;
+                sint64 delta = 2;
+                Kind kind = 3;
+              }
+              reserved 9, 10 to 12;
+              int64 id = 1;
+              repeated Line lines = 2;
+              repeated int32 codes = 3 [packed = false];
+              repeated fixed64 hashes = 4;
+              map<string, Line> by_sku = 5;
+              google.protobuf.Timestamp created_at = 6;
+              optional string note = 7 [deprecated = true];
+              oneof payment {
+                string card = 8;
+                uint64 cash = 13;
+              }
+              common.Status status = 14;
+              bool from = 15;
+              Order parent = 16;
+            }
+            """,
+        ),
+    )
+    package = tmp_sys_path / "generated"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    include = str(tmp_sys_path / "protos")
+    main([str(protos / "common.proto"), "-I", include, "-o", str(package / "common.py")])
+    main([str(protos / "messages.proto"), "-I", include, "-o", str(package / "messages.py")])
+
+    messages = import_module("generated.messages")
+    common = import_module("generated.common")
+    Order = messages.Order  # noqa: N806
+
+    assert Order.Line().kind is Order.Kind.KIND_UNSPECIFIED
+    assert Order().status is common.Status.STATUS_UNKNOWN
+    assert bytes(Order.Line(sku="a", delta=-1, kind=Order.Kind.KIND_SELL)) == (
+        b"\x0a\x01a\x10\x01\x18\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01"
+    )
+    assert bytes(Order(id=1, codes=[1, 2], hashes=[3], from_=True)) == (
+        b"\x08\x01\x18\x01\x18\x02\x22\x08\x03\x00\x00\x00\x00\x00\x00\x00\x70\x00\x78\x01"
+    )
+
+    order = Order(
+        lines=[Order.Line(sku="a")],
+        by_sku={"b": Order.Line(sku="b")},
+        note="note",
+        cash=42,
+        parent=Order(id=2),
+    )
+    assert Order.loads(bytes(order)) == order
+
+    # Proto3 enums are open.
+    assert Order.Line.loads(b"\x18\x07").kind == 7
+
+
+def test_parse_nested() -> None:
+    proto_file = parse(
+        dedent(
+            """
+            syntax = "proto3";
+            message Outer {
+              message Inner {
+                map<int32, string> values = 1;
+              }
+              oneof value {
+                Inner inner = 2;
+              }
+            }
+            service Service {
+              rpc Call(Outer) returns (Outer) { option (foo) = { bar: 1 }; }
+            }
+            """,
+        ),
+    )
+    (outer,) = proto_file.messages
+    (inner,) = outer.messages
+    assert inner.fields[0].key_type_name == "int32"
+    assert outer.one_ofs == ["value"]
+    assert outer.fields[0].one_of == "value"
+
+
+@mark.parametrize(
+    ("source", "match"),
+    [
+        ('syntax = "proto2";', "only `proto3`"),
+        ("message Foo {}", "only `proto3`"),
+        ('syntax = "proto3"; message Foo { required int32 bar = 1; }', "not supported"),
+        ('syntax = "proto3"; enum Foo { BAR = 1; }', "must be zero"),
+        ('syntax = "proto3"; message Foo { int32 bar = ; }', ":1: expected an integer"),
+        ('syntax = "proto3";\nmessage Foo {', ":2: unexpected end of file"),
+    ],
+)
+def test_parse_error(source: str, match: str) -> None:
+    with raises(IncorrectProtoError, match=match):
+        parse(source)
+
+
+def test_unresolved_type(tmp_path: Path) -> None:
+    path = tmp_path / "messages.proto"
+    path.write_text('syntax = "proto3"; message Foo { Bar bar = 1; }')
+    with raises(IncorrectProtoError, match="cannot resolve type `Bar`"):
+        main([str(path)])
+
+
+def test_shadowed_names(tmp_sys_path: Path) -> None:
+    package = tmp_sys_path / "generated"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    path = tmp_sys_path / "shadowed.proto"
+    path.write_text(
+        dedent(
+            """
+            syntax = "proto3";
+
+            message Item {
+              string name = 1;
+            }
+
+            message Record {
+              enum Kind {
+                KIND_UNSPECIFIED = 0;
+              }
+              bytes bytes = 1;
+              string str = 2;
+              repeated int32 list = 3;
+              Item Item = 4;
+              Kind Kind = 5;
+              int64 id = 6;
+            }
+            """,
+        ),
+    )
+    main([str(path), "-o", str(package / "shadowed.py")])
+
+    shadowed = import_module("generated.shadowed")
+    record = shadowed.Record(bytes_=b"a", str_="b", list_=[1], Item_=shadowed.Item(name="c"), id=2)
+    assert record.Kind_ is shadowed.Record.Kind.KIND_UNSPECIFIED
+    assert shadowed.Record.loads(bytes(record)) == record
@@ -0,0 +1,130 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Annotated, Optional
+
+from pytest import fixture, raises
+
+from pure_protobuf import instrumentation
+from pure_protobuf.annotations import Field
+from pure_protobuf.exceptions import UnexpectedWireTypeError
+from pure_protobuf.helpers._dataclasses import SLOTS
+from pure_protobuf.message import BaseMessage
+
+
+@dataclass
+class Inner(BaseMessage):
+    x: Annotated[int, Field(1)] = 0
+
+
+@dataclass
+class Outer(BaseMessage):
+    a: Annotated[int, Field(1)] = 0
+    inner: Annotated[Optional[Inner], Field(2)] = None
+
+
+@fixture(autouse=True)
+def _reset() -> Iterator[None]:
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_counters() -> None:
+    with instrumentation.instrumented() as counters:
+        encoded = bytes(Outer(a=1, inner=Inner(x=2)))
+        assert encoded == b"\x08\x01\x12\x02\x08\x02"
+        assert Outer.loads(encoded + b"\x18\x05") == Outer(a=1, inner=Inner(x=2))
+
+    outer = counters[Outer]
+    assert outer.encode_calls == 1
+    assert outer.encode_bytes == 6
+    assert outer.decode_calls == 1
+    assert outer.decode_bytes == 8
+    assert outer.unknown_fields == 1
+    assert outer.encode_seconds > 0.0
+    assert outer.decode_seconds > 0.0
+
+    inner = counters[Inner]
+    assert inner.encode_calls == 1
+    assert inner.encode_bytes == 2
+    assert inner.decode_calls == 1
+    assert inner.decode_bytes == 2
+    assert inner.unknown_fields == 0
+
+
+def test_wire_type_mismatch() -> None:
+    with instrumentation.instrumented() as counters, raises(UnexpectedWireTypeError):
+        Outer.loads(b"\x12\x02\x0d\x00")
+    assert counters[Outer].wire_type_mismatches == 0
+    assert counters[Inner].wire_type_mismatches == 1
+
+    with instrumentation.instrumented() as counters, raises(UnexpectedWireTypeError):
+        Outer.loads(b"\x10\x01")
+    assert counters[Outer].wire_type_mismatches == 1
+
+
+def test_subclass_defined_while_enabled() -> None:
+    counters = instrumentation.enable()
+
+    @dataclass
+    class Derived(Outer):
+        b: Annotated[int, Field(3)] = 0
+
+    assert Derived.loads(bytes(Derived(b=3))) == Derived(b=3)
+    assert counters[Derived].encode_calls == 1
+    assert counters[Derived].decode_calls == 1
+    assert counters[Outer].encode_calls == 0
+    assert counters[Outer].decode_calls == 0
+
+
+def test_disable_uninstalls() -> None:
+    instrumentation.enable()
+    assert instrumentation.is_enabled()
+    assert "read_from" in Outer.__dict__
+    instrumentation.disable()
+
+    assert not instrumentation.is_enabled()
+    for name in ("read_from", "write_to", "__PROTOBUF_SKIP__"):
+        assert name not in Outer.__dict__
+    assert Outer.loads(bytes(Outer(a=1))) == Outer(a=1)
+    assert instrumentation.get_counters()[Outer].decode_calls == 0
+
+
+def test_disable_uninstalls_from_slotted_dataclass() -> None:
+    instrumentation.enable()
+
+    @dataclass(**SLOTS)
+    class Slotted(BaseMessage):
+        a: Annotated[int, Field(1)] = 0
+
+    assert Slotted.loads(bytes(Slotted(a=1))) == Slotted(a=1)
+    instrumentation.disable()
+
+    read_from = Slotted.__dict__.get("read_from")
+    assert read_from is None or not hasattr(read_from.__func__, "__protobuf_original__")
+    write_to = Slotted.__dict__.get("write_to")
+    assert write_to is None or not hasattr(write_to, "__protobuf_original__")
+    for skip in Slotted.__PROTOBUF_SKIP__.values():
+        assert not hasattr(skip, "__protobuf_original__")
+
+    instrumentation.reset()
+    assert Slotted.loads(bytes(Slotted(a=1)) + b"\x10\x01") == Slotted(a=1)
+    assert not instrumentation.get_counters()
+
+
+def test_disable_restores_map_entry_skip() -> None:
+    counters = instrumentation.enable()
+
+    @dataclass
+    class WithMap(BaseMessage):
+        labels: Annotated[dict[str, int], Field(1)] = field(default_factory=dict)
+
+    # The entry has an unknown field 3.
+    encoded = b"\x0a\x05\x0a\x01a\x18\x01"
+    assert WithMap.loads(encoded) == WithMap(labels={"a": 0})
+    assert counters[WithMap].unknown_fields == 1
+
+    instrumentation.disable()
+    assert WithMap.loads(encoded) == WithMap(labels={"a": 0})
+    assert counters[WithMap].unknown_fields == 1
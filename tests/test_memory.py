@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+from sys import getsizeof
+from typing import Annotated, Optional
+
+from pytest import raises
+
+from pure_protobuf.annotations import Field
+from pure_protobuf.memory import footprint, summarize
+from pure_protobuf.message import BaseMessage
+
+
+@dataclass
+class Inner(BaseMessage):
+    x: Annotated[int, Field(1)] = 0
+
+
+@dataclass
+class Outer(BaseMessage):
+    s: Annotated[str, Field(1)] = ""
+    b: Annotated[bytes, Field(2)] = b""
+    items: Annotated[list[int], Field(3)] = field(default_factory=list)
+    inner: Annotated[Optional[Inner], Field(4)] = None
+    mapping: Annotated[dict[str, int], Field(5)] = field(default_factory=dict)
+
+
+def test_footprint() -> None:
+    message = Outer(s="hello", b=b"world", items=[1, 2], inner=Inner(x=3), mapping={"a": 1})
+    result = footprint(message)
+
+    assert result.message_type is Outer
+    assert result.count == 1
+    assert result.wire_size == len(bytes(message))
+    assert {name: field_.kind for name, field_ in result.fields.items()} == {
+        "s": "string",
+        "b": "bytes",
+        "items": "list",
+        "inner": "message",
+        "mapping": "map",
+    }
+    assert result.fields["s"].size == getsizeof("hello")
+    assert result.fields["b"].size == getsizeof(b"world")
+    assert result.fields["items"].size == getsizeof(message.items) + getsizeof(1) + getsizeof(2)
+    assert result.size == sum(result.by_kind.values())
+    assert result.ratio > 1.0
+    assert str(result).splitlines()[0].startswith("field")
+
+
+def test_unset_fields() -> None:
+    result = footprint(Outer())
+    assert result.fields["inner"].kind == "none"
+    assert result.fields["inner"].size == 0
+
+
+def test_shared_objects_counted_once() -> None:
+    inner = Inner(x=1)
+    shared = summarize([Outer(inner=inner), Outer(inner=inner)])
+    distinct = summarize([Outer(inner=Inner(x=1)), Outer(inner=Inner(x=1))])
+    assert shared.count == 2
+    assert shared.fields["inner"].size < distinct.fields["inner"].size
+
+
+def test_summarize_mixed() -> None:
+    with raises(ValueError):
+        summarize([Outer(), Inner()])
+
+
+def test_summarize_empty() -> None:
+    with raises(ValueError):
+        summarize([])
@@ -1,9 +1,22 @@
-from dataclasses import dataclass
-from typing import Annotated, ClassVar, Optional
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from threading import Event
+from time import sleep
+from typing import Annotated, Any, ClassVar, Optional
+from unittest.mock import Mock
+from urllib.parse import ParseResult
 
-from pure_protobuf.annotations import Field
-from pure_protobuf.message import BaseMessage
-from pure_protobuf.one_of import OneOf
+from pytest import MonkeyPatch
+from typing_extensions import Self
+
+from pure_protobuf.annotations import Field, ZigZagInt, double, sfixed64, uint
+from pure_protobuf.helpers._dataclasses import SLOTS
+from pure_protobuf.message import _CLASS_HOOKS, BaseMessage, _make_setattr
+from pure_protobuf.one_of import ONE_OF_SLOT, OneOf
+from pure_protobuf.testing import generate
+from tests.definitions import ExampleEnum
 
 
 def test_initialize_dataclass_with_one_of() -> None:
@@ -17,3 +30,303 @@ def test_initialize_dataclass_with_one_of() -> None:
         bar: Annotated[Optional[bool], Field(2, one_of=payload)] = None
 
     assert Message(foo=3).foo == 3
+
+
+def test_setattr_without_one_of() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        foo: Annotated[int, Field(1)] = 0
+
+    Message(foo=42)
+    assert Message.__setattr__ is object.__setattr__
+
+
+def test_setattr_installed_with_schema() -> None:
+    @dataclass
+    class Parent(BaseMessage):
+        payload: ClassVar[OneOf] = OneOf()
+
+        foo: Annotated[Optional[int], Field(1, one_of=payload)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=payload)] = None
+
+    assert "__setattr__" not in Parent.__dict__
+    assert Parent.__PROTOBUF_FIELDS_BY_NAME__
+    assert "__setattr__" in Parent.__dict__
+
+    @dataclass
+    class Child(Parent):
+        baz: Annotated[int, Field(3)] = 0
+
+    # The parent's setter must not be inherited, since it's unaware of the child's fields.
+    assert "__setattr__" not in Parent.__dict__
+    message = Child(foo=1)
+    message.bar = 2
+    assert message == Child(bar=2)
+
+
+def test_setattr_overridden(monkeypatch: MonkeyPatch) -> None:
+    @dataclass
+    class Message(BaseMessage):
+        payload: ClassVar[OneOf] = OneOf()
+
+        foo: Annotated[Optional[int], Field(1, one_of=payload)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=payload)] = None
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            super().__setattr__(name, value)
+
+    make_setattr = Mock(wraps=_make_setattr)
+    monkeypatch.setattr("pure_protobuf.message._make_setattr", make_setattr)
+    message = Message(foo=1)
+    message.bar = 2
+    assert message == Message(bar=2)
+    make_setattr.assert_called_once_with(Message)
+
+
+def test_inherited_fields() -> None:
+    @dataclass
+    class Parent(BaseMessage):
+        foo: Annotated[int, Field(1)] = 0
+        bar: Annotated[int, Field(2)] = 0
+
+    @dataclass
+    class Child(Parent):
+        bar: Annotated[int, Field(3)] = 0
+        baz: Annotated[int, Field(4)] = 0
+
+    assert list(Child.__PROTOBUF_FIELDS_BY_NAME__) == ["foo", "bar", "baz"]
+    assert list(Parent.__PROTOBUF_FIELDS_BY_NAME__) == ["foo", "bar"]
+
+    child = Child(foo=1, bar=2, baz=4)
+    assert bytes(child) == b"\x08\x01\x18\x02\x20\x04"
+    assert Child.loads(b"\x08\x01\x18\x02\x20\x04") == child
+
+
+def test_setattr_inherited_one_of() -> None:
+    @dataclass
+    class Parent(BaseMessage):
+        foo: Annotated[int, Field(1)] = 0
+
+    Parent(foo=1)
+
+    @dataclass
+    class Child(Parent):
+        payload: ClassVar[OneOf] = OneOf()
+
+        bar: Annotated[Optional[int], Field(2, one_of=payload)] = None
+        qux: Annotated[Optional[int], Field(3, one_of=payload)] = None
+
+    # The parent's setter must not get installed again, since the child would inherit it.
+    Parent(foo=2)
+    child = Child(foo=1, bar=2)
+    child.qux = 3
+    assert child == Child(foo=1, bar=None, qux=3)
+    assert bytes(child) == b"\x08\x01\x18\x03"
+    assert Child.loads(b"\x08\x01\x10\x02\x18\x03") == child
+
+
+def test_one_of_discriminator() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        payload: ClassVar[OneOf] = OneOf()
+        which_one = payload.which_one_of_getter()
+
+        foo: Annotated[Optional[int], Field(1, one_of=payload)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=payload)] = None
+
+    message = Message()
+    assert message.which_one() is None
+    message.foo = 1
+    assert message.which_one() == "foo"
+    message.bar = 2
+    assert message.foo is None
+    assert message.which_one() == "bar"
+    assert message.payload == 2
+    message.bar = None
+    assert message.which_one() is None
+    assert message.payload is None
+    assert Message.loads(b"\x08\x01\x10\x02").which_one() == "bar"
+
+
+def test_one_of_slotted() -> None:
+    @dataclass(**SLOTS)
+    class Message(BaseMessage):
+        payload: ClassVar[OneOf] = OneOf()
+        which_one = payload.which_one_of_getter()
+
+        foo: Annotated[Optional[int], Field(1, one_of=payload)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=payload)] = None
+
+    message = Message(foo=1)
+    message.bar = 2
+    assert message == Message(foo=None, bar=2)
+    assert message.which_one() == "bar"
+
+
+def test_one_of_slot() -> None:
+    class Slotted(BaseMessage):
+        __slots__ = (ONE_OF_SLOT,)
+
+    @dataclass(**SLOTS)
+    class Message(Slotted):
+        payload: ClassVar[OneOf] = OneOf()
+        which_one = payload.which_one_of_getter()
+
+        foo: Annotated[Optional[int], Field(1, one_of=payload)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=payload)] = None
+
+    message = Message(foo=1)
+    assert message.which_one() == "foo"
+    message.bar = 2
+    assert message == Message(foo=None, bar=2)
+    assert message.which_one() == "bar"
+    if SLOTS:
+        assert getattr(message, ONE_OF_SLOT) == {"payload": "bar"}
+
+
+def test_one_of_vars() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        payload: ClassVar[OneOf] = OneOf()
+        which_one = payload.which_one_of_getter()
+
+        foo: Annotated[Optional[int], Field(1, one_of=payload)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=payload)] = None
+
+    message = Message(foo=1)
+    message.bar = 2
+    assert message.which_one() == "bar"
+    assert vars(message) == {"foo": None, "bar": 2}
+    assert Message(**vars(message)) == message
+
+
+def test_one_of_copied_discriminator() -> None:
+    class Slotted(BaseMessage):
+        __slots__ = (ONE_OF_SLOT,)
+
+    @dataclass(**SLOTS)
+    class Message(Slotted):
+        payload: ClassVar[OneOf] = OneOf()
+        which_one = payload.which_one_of_getter()
+
+        foo: Annotated[Optional[int], Field(1, one_of=payload)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=payload)] = None
+
+    message = Message(foo=1)
+    assert message.which_one() == "foo"
+
+    # The discriminator gets copied, but the members get updated bypassing the setter.
+    copied = copy(message)
+    object.__setattr__(copied, "foo", None)
+    object.__setattr__(copied, "bar", 2)
+    assert copied.which_one() == "bar"
+    assert message.which_one() == "foo"
+
+
+def test_merge_one_of() -> None:
+    @dataclass
+    class Inner(BaseMessage):
+        payload: ClassVar[OneOf] = OneOf()
+
+        foo: Annotated[Optional[int], Field(1, one_of=payload)] = None
+        bar: Annotated[Optional[int], Field(2, one_of=payload)] = None
+
+    @dataclass
+    class Outer(BaseMessage):
+        inner: Annotated[Optional[Inner], Field(1)] = None
+
+    assert Outer.loads(b"\x0a\x02\x08\x01\x0a\x02\x10\x02") == Outer(inner=Inner(bar=2))
+
+
+@dataclass
+class ForwardReferencing(BaseMessage):
+    later: "Annotated[Optional[DefinedLater], Field(1)]" = None
+
+
+@dataclass
+class DefinedLater(BaseMessage):
+    foo: Annotated[int, Field(1)] = 0
+
+
+def test_forward_reference() -> None:
+    message = ForwardReferencing(later=DefinedLater(foo=42))
+    assert bytes(message) == b"\x0a\x02\x08\x2a"
+    assert ForwardReferencing.loads(b"\x0a\x02\x08\x2a") == message
+
+
+def test_schema_built_once() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        foo: Annotated[int, Field(1)] = 0
+
+    def get_fields(_: Any) -> Any:
+        return Message.__PROTOBUF_FIELDS_BY_NAME__
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        fields = list(executor.map(get_fields, range(8)))
+    assert all(item is fields[0] for item in fields)
+    assert "__PROTOBUF_FIELDS_BY_NAME__" in vars(Message)
+
+
+def test_schema_published_when_complete() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        foo: Annotated[int, Field(1)] = 0
+
+    building = Event()
+    release = Event()
+
+    def hook(message_type: type[BaseMessage], is_built: bool) -> None:
+        if message_type is Message and is_built:
+            building.set()
+            release.wait(5.0)
+
+    def get_fields() -> tuple[Any, bool]:
+        # The other thread must wait for the schema, including the hooks, to be complete.
+        return Message.__PROTOBUF_FIELDS_BY_NAME__, release.is_set()
+
+    _CLASS_HOOKS.append(hook)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            builder = executor.submit(lambda: Message.__PROTOBUF_FIELDS_BY_NUMBER__)
+            assert building.wait(5.0)
+            reader = executor.submit(get_fields)
+            sleep(0.1)
+            release.set()
+            fields_by_name, is_released = reader.result()
+            assert builder.result() == {1: ("foo", fields_by_name["foo"])}
+    finally:
+        _CLASS_HOOKS.remove(hook)
+    assert is_released
+
+
+def test_byte_size() -> None:
+    @dataclass
+    class Child(BaseMessage):
+        name: Annotated[str, Field(1)] = ""
+        inner: Annotated[Optional[Self], Field(2)] = None
+
+    @dataclass
+    class Message(BaseMessage):
+        number: Annotated[int, Field(1)] = 0
+        unsigned: Annotated[uint, Field(2)] = uint(0)
+        zigzag: Annotated[ZigZagInt, Field(3)] = ZigZagInt(0)
+        fixed: Annotated[sfixed64, Field(4)] = sfixed64(0)
+        flag: Annotated[bool, Field(5)] = False
+        text: Annotated[str, Field(6)] = ""
+        blob: Annotated[bytes, Field(7)] = b""
+        enum: Annotated[ExampleEnum, Field(8, open_enum=True)] = ExampleEnum.FOO
+        packed: Annotated[list[int], Field(9)] = field(default_factory=list)
+        unpacked: Annotated[list[double], Field(10, packed=False)] = field(default_factory=list)
+        child: Annotated[Optional[Child], Field(11)] = None
+        children: Annotated[list[Child], Field(12)] = field(default_factory=list)
+        mapping: Annotated[dict[str, Child], Field(13)] = field(default_factory=dict)
+        timestamp: Annotated[Optional[datetime], Field(14)] = None
+        duration: Annotated[Optional[timedelta], Field(15)] = None
+        url: Annotated[Optional[ParseResult], Field(16)] = None
+
+    for seed in range(20):
+        message = generate(Message, seed=seed)
+        size = len(bytes(message))
+        assert message.byte_size() == size
+        assert message.estimate_size() >= size
@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Annotated, Optional
+
+from pytest import mark, raises
+
+from pure_protobuf.annotations import Field
+from pure_protobuf.exceptions import IncorrectValueError
+from pure_protobuf.message import BaseMessage
+from pure_protobuf.parallel import _split, encode_sharded
+
+
+@dataclass
+class Entry(BaseMessage):
+    key: Annotated[str, Field(1)] = ""
+
+
+@dataclass
+class Snapshot(BaseMessage):
+    version: Annotated[int, Field(1)] = 0
+    entries: Annotated[list[Entry], Field(2)] = field(default_factory=list)
+    values: Annotated[list[int], Field(3)] = field(default_factory=list)
+    labels: Annotated[dict[str, int], Field(4)] = field(default_factory=dict)
+    comment: Annotated[Optional[str], Field(5)] = None
+
+
+SNAPSHOT = Snapshot(
+    version=42,
+    entries=[Entry(key=str(i)) for i in range(10)],
+    values=list(range(7)),
+    labels={str(i): i for i in range(5)},
+    comment="done",
+)
+
+
+@mark.parametrize("shards", [1, 3, 100])
+def test_encode_sharded_identical(shards: int) -> None:
+    with ThreadPoolExecutor(2) as executor:
+        assert encode_sharded(SNAPSHOT, executor, shards=shards) == bytes(SNAPSHOT)
+        assert encode_sharded(SNAPSHOT, executor, field_name="labels", shards=shards) == bytes(SNAPSHOT)
+
+
+@mark.parametrize("shards", [1, 3, 100])
+def test_encode_sharded_packed(shards: int) -> None:
+    with ThreadPoolExecutor(2) as executor:
+        encoded = encode_sharded(SNAPSHOT, executor, field_name="values", shards=shards)
+    assert Snapshot.loads(encoded) == SNAPSHOT
+
+
+def test_encode_sharded_nothing_to_split() -> None:
+    message = Snapshot(version=1)
+    with ThreadPoolExecutor(1) as executor:
+        assert encode_sharded(message, executor) == bytes(message)
+        assert encode_sharded(message, executor, field_name="entries") == bytes(message)
+
+
+def test_encode_sharded_incorrect_field() -> None:
+    with ThreadPoolExecutor(1) as executor:
+        with raises(IncorrectValueError):
+            encode_sharded(SNAPSHOT, executor, field_name="version")
+        with raises(IncorrectValueError):
+            encode_sharded(SNAPSHOT, executor, field_name="missing")
+        with raises(IncorrectValueError):
+            encode_sharded(SNAPSHOT, executor, shards=0)
+
+
+def test_split_iterable() -> None:
+    assert _split(iter(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert _split(iter(()), 3) == []
+
+
+def test_encode_sharded_iterable() -> None:
+    message = Snapshot(version=42, values=iter(range(7)))  # type: ignore[arg-type]
+    with ThreadPoolExecutor(2) as executor:
+        encoded = encode_sharded(message, executor, field_name="values", shards=3)
+    assert Snapshot.loads(encoded) == Snapshot(version=42, values=list(range(7)))
@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+from typing import Annotated, Optional
+
+from pytest import raises
+
+from pure_protobuf.annotations import Field
+from pure_protobuf.message import BaseMessage
+from pure_protobuf.profiling import profile
+
+
+@dataclass
+class Inner(BaseMessage):
+    x: Annotated[int, Field(1)] = 0
+
+
+@dataclass
+class Outer(BaseMessage):
+    a: Annotated[int, Field(1)] = 0
+    inner: Annotated[Optional[Inner], Field(2)] = None
+    b: Annotated[list[int], Field(3)] = field(default_factory=list)
+    c: Annotated[list[int], Field(4, packed=False)] = field(default_factory=list)
+
+
+def test_profile() -> None:
+    message = Outer(a=150, inner=Inner(x=2), b=[1, 2], c=[1, 2])
+    encoded = bytes(message)
+    with profile(Outer, Inner) as report:
+        assert bytes(message) == encoded
+        assert Outer.loads(encoded) == message
+
+    costs = {(cost.message_type, cost.name): cost for cost in report.costs}
+    assert set(costs) == {(Outer, "a"), (Outer, "inner"), (Outer, "b"), (Outer, "c"), (Inner, "x")}
+
+    a = costs[Outer, "a"]
+    assert a.number == 1
+    assert (a.encode_calls, a.encode_bytes, a.decode_calls, a.decode_bytes) == (1, 3, 1, 3)
+
+    inner = costs[Outer, "inner"]
+    assert (inner.encode_bytes, inner.decode_bytes) == (4, 4)
+    assert inner.total_seconds >= costs[Inner, "x"].total_seconds
+
+    b = costs[Outer, "b"]
+    assert (b.encode_calls, b.encode_bytes, b.decode_calls, b.decode_bytes) == (1, 4, 1, 4)
+
+    # Unpacked items are separate records.
+    c = costs[Outer, "c"]
+    assert (c.encode_calls, c.encode_bytes, c.decode_calls, c.decode_bytes) == (1, 4, 2, 4)
+
+    assert report.sorted(lambda cost: cost.total_bytes)[0] is inner
+    assert str(report).splitlines()[0].startswith("field")
+
+
+def test_restores_descriptors() -> None:
+    fields_by_number = Outer.__PROTOBUF_FIELDS_BY_NUMBER__
+    with profile(Outer):
+        assert Outer.__PROTOBUF_FIELDS_BY_NUMBER__ is not fields_by_number
+    assert Outer.__PROTOBUF_FIELDS_BY_NUMBER__ is fields_by_number
+    assert "__PROTOBUF_FIELDS_BY_NAME__" in Outer.__dict__
+
+
+def test_profile_all() -> None:
+    with profile() as report:
+
+        @dataclass
+        class Late(BaseMessage):
+            y: Annotated[int, Field(1)] = 0
+
+        assert Late.loads(bytes(Late(y=1))) == Late(y=1)
+
+    (cost,) = (cost for cost in report.costs if cost.message_type is Late)
+    assert (cost.encode_calls, cost.decode_calls) == (1, 1)
+    assert any(cost.message_type is Outer for cost in report.costs)
+
+
+def test_nested_profile() -> None:
+    with profile(), raises(RuntimeError), profile():
+        pass
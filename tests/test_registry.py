@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+from pure_protobuf.annotations import Field
+from pure_protobuf.message import BaseMessage
+from pure_protobuf.registry import get_type_url, register, resolve
+from pure_protobuf.well_known import Any_
+
+
+def test_registered_automatically() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        foo: Annotated[int, Field(1)] = 0
+
+    type_url = get_type_url(Message)
+    assert type_url.geturl() == "import://tests.test_registry/test_registered_automatically.<locals>.Message"
+    assert resolve(type_url) is Message
+    assert resolve(type_url.geturl()) is Message
+
+    # Local classes are not importable, but they still get resolved via the registry.
+    assert Any_.from_message(Message(foo=42)).into_message() == Message(foo=42)
+
+
+def test_register_explicitly() -> None:
+    @dataclass
+    class Message(BaseMessage):
+        foo: Annotated[int, Field(1)] = 0
+
+    register(Message, "type.googleapis.com/test.Message")
+    assert get_type_url(Message).geturl() == "type.googleapis.com/test.Message"
+    assert resolve("type.googleapis.com/test.Message") is Message
+
+    any_ = Any_.from_message(Message(foo=42))
+    assert bytes(any_) == b"\x0a\x20type.googleapis.com/test.Message\x12\x02\x08\x2a"
+    assert Any_.loads(bytes(any_)).into_message() == Message(foo=42)
+
+
+def test_resolve_missing() -> None:
+    assert resolve("import://tests.test_registry/Missing") is None
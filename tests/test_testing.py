@@ -0,0 +1,109 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import IntEnum
+from typing import Annotated, ClassVar, NewType, Optional
+
+from pytest import MonkeyPatch, mark, raises
+from typing_extensions import Self
+
+from pure_protobuf.annotations import Field, ZigZagInt, double, fixed32, sfixed64, uint
+from pure_protobuf.descriptors.record import RecordDescriptor
+from pure_protobuf.exceptions import UnsupportedAnnotationError
+from pure_protobuf.message import BaseMessage
+from pure_protobuf.one_of import OneOf
+from pure_protobuf.testing import SizeProfile, generate, generate_corpus
+from pure_protobuf.well_known import Any_
+
+
+class Color(IntEnum):
+    RED = 1
+    GREEN = 2
+
+
+@dataclass
+class Node(BaseMessage):
+    value: Annotated[ZigZagInt, Field(1)] = ZigZagInt(0)
+    children: Annotated[list[Self], Field(2)] = field(default_factory=list)
+    parent: Annotated[Optional[Self], Field(3)] = None
+
+
+@dataclass
+class Message(BaseMessage):
+    payload: ClassVar[OneOf] = OneOf()
+
+    a: Annotated[int, Field(1)] = 0
+    b: Annotated[uint, Field(2)] = uint(0)
+    c: Annotated[double, Field(3)] = double(0.0)
+    d: Annotated[float, Field(4)] = 0.0
+    e: Annotated[fixed32, Field(5)] = fixed32(0)
+    f: Annotated[sfixed64, Field(6)] = sfixed64(0)
+    g: Annotated[str, Field(7)] = ""
+    h: Annotated[bytes, Field(8)] = b""
+    i: Annotated[Color, Field(9)] = Color.RED
+    j: Annotated[list[int], Field(10)] = field(default_factory=list)
+    k: Annotated[dict[str, Node], Field(11)] = field(default_factory=dict)
+    created_at: Annotated[Optional[datetime], Field(12)] = None
+    ttl: Annotated[Optional[timedelta], Field(13)] = None
+    any_: Annotated[Optional[Any_], Field(14)] = None
+    o: Annotated[Optional[Node], Field(15, one_of=payload)] = None
+    p: Annotated[Optional[str], Field(16, one_of=payload)] = None
+
+
+@mark.parametrize("size_profile", ["small", "medium", "large"])
+def test_round_trip(size_profile: str) -> None:
+    messages, encoded = generate_corpus(Message, 5, seed=42, size_profile=size_profile)
+    assert [Message.loads(buffer) for buffer in encoded] == messages
+
+
+def test_deterministic() -> None:
+    assert generate(Message, seed=1) == generate(Message, seed=1)
+    assert generate(Message, seed=1) != generate(Message, seed=2)
+
+
+def test_size_profile() -> None:
+    message = generate(
+        Message,
+        size_profile=SizeProfile(repeated_length=(3, 3), string_length=(5, 5), presence=1.0, one_of_weights={"o": 0.0}),
+    )
+    assert len(message.j) == 3
+    assert len(message.g) == 5
+    assert message.created_at is not None
+    assert message.o is None
+    assert message.p is not None
+
+
+def test_max_depth() -> None:
+    def depth(node: Optional[Node]) -> int:
+        if node is None:
+            return 0
+        return 1 + max((depth(child) for child in (*node.children, node.parent)), default=0)
+
+    profile = SizeProfile(repeated_length=(1, 1), presence=1.0, max_depth=3)
+    assert depth(generate(Node, size_profile=profile)) == 4
+
+
+def test_max_messages() -> None:
+    def count(node: Optional[Node]) -> int:
+        if node is None:
+            return 0
+        return 1 + sum(count(child) for child in (*node.children, node.parent))
+
+    profile = SizeProfile(repeated_length=(8, 8), presence=1.0, max_depth=10, max_messages=20)
+    assert count(generate(Node, size_profile=profile)) <= 21
+
+
+def test_unknown_size_profile() -> None:
+    with raises(ValueError, match="unknown size profile"):
+        generate(Message, size_profile="huge")
+
+
+def test_unsupported_hint(monkeypatch: MonkeyPatch) -> None:
+    custom = NewType("custom", int)
+    monkeypatch.setitem(RecordDescriptor.__PREDEFINED__, custom, RecordDescriptor.__PREDEFINED__[int])
+
+    @dataclass
+    class Custom(BaseMessage):
+        a: Annotated[custom, Field(1)] = custom(0)
+
+    with raises(UnsupportedAnnotationError, match="cannot generate values"):
+        generate(Custom)
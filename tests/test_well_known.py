@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from typing import Annotated
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Optional
 
 from pure_protobuf.annotations import Field
 from pure_protobuf.message import BaseMessage
-from pure_protobuf.well_known import Any_
+from pure_protobuf.well_known import Any_, Duration, Timestamp
 
 
 @dataclass
@@ -18,3 +19,57 @@ def test_child() -> None:
     assert any_.type_url.hostname == "tests.test_well_known"
     assert any_.type_url.path == "/ChildMessage"
     assert any_.into_message() == child
+
+
+def test_timestamp() -> None:
+    timestamp = Timestamp(seconds=42, nanos=100)
+    assert bytes(timestamp) == b"\x08\x2a\x10\x64"
+    assert Timestamp.loads(b"\x08\x2a\x10\x64") == timestamp
+
+
+def test_duration() -> None:
+    duration = Duration(seconds=42, nanos=100)
+    assert bytes(duration) == b"\x08\x2a\x10\x64"
+    assert Duration.loads(b"\x08\x2a\x10\x64") == duration
+
+
+def test_timestamp_datetime() -> None:
+    value = datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc)
+    assert Timestamp.from_datetime(value) == Timestamp(seconds=1_700_000_000, nanos=123_456_000)
+    assert Timestamp.from_datetime(value).into_datetime() == value
+
+
+def test_duration_timedelta() -> None:
+    value = timedelta(seconds=-42, microseconds=-5)
+    assert Duration.from_timedelta(value) == Duration(seconds=-42, nanos=-5000)
+    assert Duration.from_timedelta(value).into_timedelta() == value
+
+
+@dataclass
+class NativeMessage(BaseMessage):
+    timestamp: Annotated[Optional[datetime], Field(1)] = None
+    duration: Annotated[Optional[timedelta], Field(2)] = None
+
+
+@dataclass
+class WellKnownMessage(BaseMessage):
+    timestamp: Annotated[Optional[Timestamp], Field(1)] = None
+    duration: Annotated[Optional[Duration], Field(2)] = None
+
+
+def test_native_datetime_and_timedelta() -> None:
+    timestamp = datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc)
+    duration = timedelta(seconds=-42, microseconds=-5)
+    native = NativeMessage(timestamp=timestamp, duration=duration)
+    well_known = WellKnownMessage(
+        timestamp=Timestamp.from_datetime(timestamp),
+        duration=Duration.from_timedelta(duration),
+    )
+    assert bytes(native) == bytes(well_known)
+    assert NativeMessage.loads(bytes(well_known)) == native
+
+
+def test_native_epoch() -> None:
+    message = NativeMessage(timestamp=datetime(1970, 1, 1, tzinfo=timezone.utc), duration=timedelta())
+    assert bytes(message) == b"\x0a\x00\x12\x00"
+    assert NativeMessage.loads(bytes(message)) == message